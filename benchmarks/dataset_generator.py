@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import datetime
+import itertools
+import pathlib
+import random
+import string
+import typing
+
+_HEADER: str = '"date"      ,"currency_code","name"              ,"local_price","dollar_ex","dollar_price"\n'
+_FIRST_RELEASE: datetime.date = datetime.date(year=2000, month=4, day=1)
+_MAX_RELEASE_SPAN_DAYS: int = 36_500
+
+_KNOWN_COUNTRIES: tuple[tuple[str, str], ...] = (
+    ('United States', 'USD'), ('Argentina', 'ARS'), ('Australia', 'AUD'), ('Brazil', 'BRL'), ('Britain', 'GBP'),
+    ('Canada', 'CAD'), ('Chile', 'CLP'), ('China', 'CNY'), ('Czech Republic', 'CZK'), ('Denmark', 'DKK'),
+    ('Euro area', 'EUR'), ('Hong Kong', 'HKD'), ('Hungary', 'HUF'), ('Indonesia', 'IDR'), ('Israel', 'ILS'),
+    ('Japan', 'JPY'), ('Malaysia', 'MYR'), ('Mexico', 'MXN'), ('New Zealand', 'NZD'), ('Poland', 'PLN'),
+    ('Russia', 'RUB'), ('Singapore', 'SGD'), ('South Africa', 'ZAR'), ('South Korea', 'KRW'), ('Sweden', 'SEK'),
+    ('Switzerland', 'CHF'), ('Taiwan', 'TWD'), ('Thailand', 'THB'), ('Turkey', 'TRY'), ('Vietnam', 'VND'),
+)
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DatasetSpec:
+    """Size of a synthetic dataset, with more than ``dates`` releases only when the rows do not fit in them."""
+    rows: int
+    countries: int = 74
+    dates: int = 38
+    seed: int = 0
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _Country:
+    name: str
+    currency_code: str
+    dollar_exchange_rate: int
+    base_dollar_price: float
+    drift_per_release: float
+
+
+class DatasetGenerator:
+    """Streams deterministic CSV files in the layout of ``input/big_mac_prices.csv``, rows spread over the releases."""
+
+    def write(self, spec: DatasetSpec, path: pathlib.Path) -> None:
+        rng: random.Random = random.Random(spec.seed)
+        countries: list[_Country] = self._countries(spec.countries, rng)
+        release_dates: list[str] = self._release_dates(max(spec.dates, -(-spec.rows // spec.countries)))
+
+        with path.open('w', encoding='utf-8', newline='', buffering=1 << 20) as file:
+            file.write(_HEADER)
+            file.writelines(self._rows(spec.rows, countries, release_dates, rng))
+
+    @staticmethod
+    def _rows(
+        amount: int,
+        countries: list[_Country],
+        release_dates: list[str],
+        rng: random.Random,
+    ) -> typing.Iterator[str]:
+        for release_index, release_date in enumerate(release_dates):
+            first_row: int = amount * release_index // len(release_dates)
+            end_row: int = amount * (release_index + 1) // len(release_dates)
+            country_indices: list[int] = sorted(index % len(countries) for index in range(first_row, end_row))
+
+            for country_index in country_indices:
+                country: _Country = countries[country_index]
+                dollar_price: float = round(
+                    country.base_dollar_price * (1 + country.drift_per_release) ** release_index
+                    * rng.uniform(0.95, 1.05),
+                    2,
+                )
+                local_price: float = round(dollar_price * country.dollar_exchange_rate, 2)
+
+                yield (
+                    f'"{release_date}",{country.currency_code:<15},{country.name:<20},'
+                    f'{str(local_price):<13},{country.dollar_exchange_rate:<11},{dollar_price}\n'
+                )
+
+    @staticmethod
+    def _countries(amount: int, rng: random.Random) -> list[_Country]:
+        known_codes: set[str] = {code for _, code in _KNOWN_COUNTRIES}
+        synthetic_codes: typing.Iterator[str] = (
+            ''.join(letters)
+            for letters in itertools.product(string.ascii_uppercase, repeat=3)
+            if ''.join(letters) not in known_codes
+        )
+        names_and_codes: list[tuple[str, str]] = list(_KNOWN_COUNTRIES[:amount])
+
+        for index in range(len(names_and_codes), amount):
+            names_and_codes.append((f'Country {index:05d}', next(synthetic_codes)))
+
+        return [
+            _Country(
+                name=name,
+                currency_code=code,
+                dollar_exchange_rate=1 if code == 'USD' else rng.choice((1, 3, 7, 15, 41, 120, 1400, 23417)),
+                base_dollar_price=rng.uniform(1.5, 6.5),
+                drift_per_release=rng.uniform(-0.01, 0.03),
+            )
+            for name, code in names_and_codes
+        ]
+
+    @staticmethod
+    def _release_dates(amount: int) -> list[str]:
+        if amount > _MAX_RELEASE_SPAN_DAYS:
+            raise ValueError(f'{amount} releases do not fit one day apart, generate more countries')
+
+        step: datetime.timedelta = datetime.timedelta(days=max(1, min(182, _MAX_RELEASE_SPAN_DAYS // amount)))
+
+        return [(_FIRST_RELEASE + step * i).isoformat() for i in range(amount)]
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Generate a synthetic Big Mac prices CSV')
+    parser.add_argument('output', type=pathlib.Path)
+    parser.add_argument('--rows', type=int, required=True)
+    parser.add_argument('--countries', type=int, default=DatasetSpec.countries)
+    parser.add_argument('--dates', type=int, default=DatasetSpec.dates)
+    parser.add_argument('--seed', type=int, default=DatasetSpec.seed)
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    arguments: argparse.Namespace = _parse_arguments()
+
+    DatasetGenerator().write(
+        DatasetSpec(rows=arguments.rows, countries=arguments.countries, dates=arguments.dates, seed=arguments.seed),
+        arguments.output,
+    )
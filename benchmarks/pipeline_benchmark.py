@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import datetime
+import json
+import pathlib
+import platform
+import tempfile
+import typing
+
+from benchmarks.dataset_generator import DatasetGenerator, DatasetSpec
+from src.big_mac_application import BigMacApplication
+from src.core.instrumentation.tracer import Tracer
+from src.core.presentation.main_menu_controller import MainMenuController
+from src.features.price_loading.data.repositories.load_memory_budget import LoadMemoryBudget
+
+_RENDER_STAGES: dict[str, str] = {
+    '1': 'render.raw_data',
+    '2': 'render.average_price_per_country',
+    '3': 'render.most_expensive_country',
+    '4': 'render.cheapest_country',
+    '5': 'render.price_change_per_country',
+    '8': 'render.full_report',
+}
+
+
+class PipelineBenchmark:
+    """Times every load, statistics and rendering stage over synthetic datasets of increasing size."""
+    _work_directory: pathlib.Path
+    _generator: DatasetGenerator
+    _memory_budget: LoadMemoryBudget | None
+
+    def __init__(self, work_directory: pathlib.Path, memory_budget: LoadMemoryBudget | None = None) -> None:
+        self._work_directory = work_directory
+        self._generator = DatasetGenerator()
+        self._memory_budget = memory_budget
+
+    async def run(self, specs: typing.Iterable[DatasetSpec]) -> dict[str, typing.Any]:
+        return {
+            'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'memory_budget': None if self._memory_budget is None else dataclasses.asdict(self._memory_budget),
+            'runs': [await self._run_one(spec) for spec in specs],
+        }
+
+    async def _run_one(self, spec: DatasetSpec) -> dict[str, typing.Any]:
+        csv_path: pathlib.Path = self._work_directory.joinpath(
+            f'big_mac_{spec.rows}_{spec.countries}_{spec.dates}_{spec.seed}.csv'
+        )
+
+        if not csv_path.exists():
+            self._generator.write(spec, csv_path)
+
+        tracer: Tracer = Tracer()
+        controller: MainMenuController = BigMacApplication.build_main_menu_controller(
+            price_dataset_store=BigMacApplication.build_price_dataset_store(
+                csv_file_path=csv_path,
+                probes=[tracer],
+                memory_budget=self._memory_budget,
+            ),
+            probes=[tracer],
+        )
+
+        await controller.load_prices()
+
+        for option, stage in _RENDER_STAGES.items():
+            await self._render(tracer, controller, option, stage)
+
+        return {
+            'dataset': dataclasses.asdict(spec),
+            'spans': [dataclasses.asdict(s) for s in tracer.spans],
+        }
+
+    @staticmethod
+    async def _render(tracer: Tracer, controller: MainMenuController, option: str, stage: str) -> None:
+        token: tuple[int, int] = tracer.start(stage)
+        lines: int = sum(1 for _ in await controller.on_option_selected(option))
+        tracer.stop(stage, token, lines)
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Benchmark the Big Mac prices pipeline')
+    parser.add_argument('--rows', type=int, nargs='+', default=[10 ** 3, 10 ** 4, 10 ** 5])
+    parser.add_argument('--countries', type=int, default=DatasetSpec.countries)
+    parser.add_argument('--dates', type=int, default=DatasetSpec.dates)
+    parser.add_argument('--seed', type=int, default=DatasetSpec.seed)
+    parser.add_argument('--work-directory', type=pathlib.Path, help='where generated datasets are kept')
+    parser.add_argument('--memory-budget-mb', type=float, help='load in chunks within this many megabytes')
+    parser.add_argument('--output', type=pathlib.Path, help='JSON results file, stdout if omitted')
+
+    return parser.parse_args()
+
+
+async def _main(arguments: argparse.Namespace, work_directory: pathlib.Path) -> None:
+    specs: list[DatasetSpec] = [
+        DatasetSpec(rows=rows, countries=arguments.countries, dates=arguments.dates, seed=arguments.seed)
+        for rows in arguments.rows
+    ]
+    memory_budget: LoadMemoryBudget | None = None if arguments.memory_budget_mb is None \
+        else LoadMemoryBudget.from_megabytes(arguments.memory_budget_mb)
+    results: dict[str, typing.Any] = await PipelineBenchmark(work_directory, memory_budget).run(specs)
+    payload: str = json.dumps(results, indent=2)
+
+    if arguments.output is None:
+        print(payload)
+    else:
+        arguments.output.write_text(payload, encoding='utf-8')
+
+
+if __name__ == '__main__':
+    parsed_arguments: argparse.Namespace = _parse_arguments()
+
+    if parsed_arguments.work_directory is not None:
+        parsed_arguments.work_directory.mkdir(parents=True, exist_ok=True)
+        asyncio.run(_main(parsed_arguments, parsed_arguments.work_directory))
+    else:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            asyncio.run(_main(parsed_arguments, pathlib.Path(temporary_directory)))
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+import typing
+
+_PROJECT_ROOT: pathlib.Path = pathlib.Path(__file__).absolute().parent.parent
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class StartupScenario:
+    name: str
+    arguments: tuple[str, ...]
+    budget_milliseconds: float | None
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class StartupMeasurement:
+    scenario: str
+    runs: int
+    min_milliseconds: float
+    median_milliseconds: float
+    budget_milliseconds: float | None
+
+    @property
+    def within_budget(self) -> bool:
+        return self.budget_milliseconds is None or self.median_milliseconds <= self.budget_milliseconds
+
+
+class StartupBenchmark:
+    """Time from spawning ``main.py`` until its first line of output, the menu title or first report header."""
+    _runs: int
+
+    def __init__(self, runs: int) -> None:
+        self._runs = runs
+
+    def measure(self, scenario: StartupScenario) -> StartupMeasurement:
+        durations: list[float] = [self._time_to_first_line(scenario.arguments) for _ in range(self._runs)]
+
+        return StartupMeasurement(
+            scenario=scenario.name,
+            runs=self._runs,
+            min_milliseconds=min(durations) * 1000,
+            median_milliseconds=statistics.median(durations) * 1000,
+            budget_milliseconds=scenario.budget_milliseconds,
+        )
+
+    @staticmethod
+    def _time_to_first_line(arguments: tuple[str, ...]) -> float:
+        environment: dict[str, str] = {**os.environ, 'PYTHONUNBUFFERED': '1'}
+        start: float = time.perf_counter()
+
+        with subprocess.Popen(
+            [sys.executable, 'main.py', *arguments],
+            cwd=_PROJECT_ROOT,
+            env=environment,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ) as process:
+            first_line: bytes = typing.cast(typing.IO[bytes], process.stdout).readline()
+            elapsed: float = time.perf_counter() - start
+            process.kill()
+
+        if not first_line:
+            raise RuntimeError(f'main.py {" ".join(arguments)} exited without output')
+
+        return elapsed
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Benchmark Big Mac prices startup time')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--menu-budget-ms', type=float, help='fail if the median time to the menu exceeds this')
+    parser.add_argument('--batch-budget-ms', type=float, help='fail if the median time to a report exceeds this')
+    parser.add_argument('--output', type=pathlib.Path, help='JSON results file, stdout if omitted')
+
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    parsed_arguments: argparse.Namespace = _parse_arguments()
+    benchmark: StartupBenchmark = StartupBenchmark(parsed_arguments.runs)
+    measurements: list[StartupMeasurement] = [
+        benchmark.measure(
+            StartupScenario(
+                name='menu',
+                arguments=(),
+                budget_milliseconds=parsed_arguments.menu_budget_ms,
+            )
+        ),
+        benchmark.measure(
+            StartupScenario(
+                name='batch',
+                arguments=('--report', 'cheapest-country'),
+                budget_milliseconds=parsed_arguments.batch_budget_ms,
+            )
+        ),
+    ]
+    payload: str = json.dumps(
+        [{**dataclasses.asdict(m), 'within_budget': m.within_budget} for m in measurements],
+        indent=2,
+    )
+
+    if parsed_arguments.output is None:
+        print(payload)
+    else:
+        parsed_arguments.output.write_text(payload, encoding='utf-8')
+
+    sys.exit(0 if all(m.within_budget for m in measurements) else 1)
@@ -1,3 +1,4 @@
 import pathlib
 
 PROJECT_ROOT: pathlib.Path = pathlib.Path('.')
+DEFAULT_INPUT_PATH: pathlib.Path = PROJECT_ROOT.joinpath('input/big_mac_prices.csv')
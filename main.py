@@ -1,11 +1,163 @@
+import argparse
 import asyncio
+import pathlib
+import sys
+import typing
 
+import constants
 from src.big_mac_application import BigMacApplication
+from src.core.instrumentation.memory_profiler import MemoryProfiler
+from src.core.instrumentation.stage_probe import StageProbe
+from src.core.instrumentation.tracer import Tracer
+from src.core.presentation.batch_report_runner import BatchOutputFormat
+from src.core.presentation.rendered_report_cache import RenderedReportCache
+from src.core.presentation.report_name import ReportName
+from src.core.utils.result import Error, Result
+from src.features.price_loading.data.repositories.load_memory_budget import LoadMemoryBudget
+from src.features.price_loading.domain.use_cases.load_prices_use_case import LoadPricesUseCaseDependenciesFailure, \
+    LoadPricesUseCaseFailure
 
+_OUTPUT_BUFFER_SIZE: int = 1 << 20
 
-async def run():
-    await BigMacApplication.run()
+
+async def run(arguments: argparse.Namespace, probes: list[StageProbe]) -> int:
+    memory_budget: LoadMemoryBudget | None = None if arguments.memory_budget_mb is None \
+        else LoadMemoryBudget.from_megabytes(arguments.memory_budget_mb)
+
+    if arguments.serve:
+        await BigMacApplication.serve(
+            arguments.host,
+            arguments.port,
+            csv_file_path=arguments.input,
+            probes=probes,
+            memory_budget=memory_budget,
+            watch_interval_seconds=arguments.watch_interval,
+            rendered_report_cache=RenderedReportCache.from_megabytes(arguments.report_cache_mb),
+            regions_file_path=arguments.regions,
+        )
+        return 0
+
+    if not arguments.report:
+        await BigMacApplication.run(
+            csv_file_path=arguments.input,
+            probes=probes,
+            memory_budget=memory_budget,
+            watch_interval_seconds=arguments.watch_interval,
+            rendered_report_cache=RenderedReportCache.from_megabytes(arguments.report_cache_mb),
+        )
+        return 0
+
+    report_names: list[ReportName] = [ReportName(r) for r in arguments.report]
+    output_format: BatchOutputFormat = BatchOutputFormat(arguments.format)
+    batch_result: Result[None, LoadPricesUseCaseFailure]
+
+    if arguments.output is None:
+        batch_result = await BigMacApplication.run_batch(
+            arguments.input, report_names, output_format, sys.stdout, probes=probes, memory_budget=memory_budget
+        )
+    else:
+        with arguments.output.open('w', encoding='utf-8', newline='', buffering=_OUTPUT_BUFFER_SIZE) as output:
+            batch_result = await BigMacApplication.run_batch(
+                arguments.input, report_names, output_format, output, probes=probes, memory_budget=memory_budget
+            )
+
+    if batch_result.is_err():
+        err_result: Error[None, LoadPricesUseCaseFailure] = typing.cast(Error, batch_result)
+        print(_load_failure_message(arguments.input, err_result.value), file=sys.stderr)
+
+        return 1
+
+    return 0
+
+
+def _load_failure_message(csv_file_path: pathlib.Path, failure: LoadPricesUseCaseFailure) -> str:
+    if isinstance(failure, LoadPricesUseCaseDependenciesFailure):
+        return f'Could not load the prices from {csv_file_path}: {failure.reason}'
+
+    return f'Could not load the prices from {csv_file_path}'
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Big Mac Prices')
+    parser.add_argument('--input', type=pathlib.Path, default=constants.DEFAULT_INPUT_PATH, help='prices CSV file')
+    parser.add_argument(
+        '--report',
+        action='append',
+        choices=[r.value for r in ReportName],
+        help='run this report without the interactive menu, may be repeated',
+    )
+    parser.add_argument(
+        '--format',
+        choices=[f.value for f in BatchOutputFormat],
+        default=BatchOutputFormat.TEXT.value,
+        help='output format of --report',
+    )
+    parser.add_argument('--output', type=pathlib.Path, help='file to write --report output to, stdout if omitted')
+    parser.add_argument('--serve', action='store_true', help='serve the reports over HTTP instead of the menu')
+    parser.add_argument('--host', default='127.0.0.1', help='address --serve binds to')
+    parser.add_argument('--port', type=int, default=8000, help='port --serve listens on')
+    parser.add_argument(
+        '--regions',
+        type=pathlib.Path,
+        help='name,region CSV file joined to the prices by /analytics/aggregate?by=region, off if omitted',
+    )
+    parser.add_argument(
+        '--watch-interval',
+        type=float,
+        default=2.0,
+        help='seconds between checks of the input file for changes, 0 disables reloading on change',
+    )
+    parser.add_argument(
+        '--report-cache-mb',
+        type=float,
+        default=64,
+        help='memory cap of the rendered report cache in megabytes, 0 disables it',
+    )
+    parser.add_argument('--trace', action='store_true', help='print per-stage timings to stderr on exit')
+    parser.add_argument('--trace-json', type=pathlib.Path, help='write per-stage timings as JSON to the given path')
+    parser.add_argument(
+        '--memory-profile',
+        action='store_true',
+        help='print per-stage memory allocations to stderr on exit',
+    )
+    parser.add_argument(
+        '--memory-profile-json',
+        type=pathlib.Path,
+        help='write per-stage memory allocations as JSON to the given path',
+    )
+    parser.add_argument(
+        '--memory-budget-mb',
+        type=float,
+        help='load in chunks so that intermediate data stays within this many megabytes',
+    )
+
+    return parser.parse_args()
+
+
+def _export(report: Tracer | MemoryProfiler, print_text: bool, json_path: pathlib.Path | None) -> None:
+    if print_text:
+        print(report.as_text(), file=sys.stderr)
+
+    if json_path is not None:
+        json_path.write_text(report.as_json(), encoding='utf-8')
 
 
 if __name__ == '__main__':
-    asyncio.run(run())
+    parsed_arguments: argparse.Namespace = _parse_arguments()
+    tracer: Tracer | None = Tracer() if parsed_arguments.trace or parsed_arguments.trace_json else None
+    memory_profiler: MemoryProfiler | None = \
+        MemoryProfiler() if parsed_arguments.memory_profile or parsed_arguments.memory_profile_json else None
+
+    exit_code: int = 1
+
+    try:
+        exit_code = asyncio.run(run(parsed_arguments, [p for p in (memory_profiler, tracer) if p is not None]))
+    finally:
+        if tracer is not None:
+            _export(tracer, parsed_arguments.trace, parsed_arguments.trace_json)
+
+        if memory_profiler is not None:
+            memory_profiler.stop_tracing()
+            _export(memory_profiler, parsed_arguments.memory_profile, parsed_arguments.memory_profile_json)
+
+    sys.exit(exit_code)
@@ -1,14 +1,40 @@
+from __future__ import annotations
+
+import csv
+import dataclasses
 import pathlib
+import typing
+from collections.abc import Sequence
 
 import constants
+from src.core.instrumentation.stage_probe import StageProbe, count_single_row
+from src.core.presentation.batch_report_runner import BatchOutputFormat, BatchReport, BatchReportRunner
+from src.core.presentation.export_schema import AVERAGE_PRICE_ENTRY_SCHEMA, PRICE_CHANGE_SCHEMA, PRICE_ENTRY_SCHEMA, \
+    PRICE_SUMMARY_SCHEMA, SINGLE_COUNTRY_PRICE_SCHEMA
+from src.core.presentation.http_server import HttpRouter, HttpServer
 from src.core.presentation.main_menu import MainMenu
 from src.core.presentation.main_menu_controller import MainMenuController
+from src.core.presentation.price_service_controller import PriceServiceController
+from src.core.presentation.rendered_report_cache import RenderedReportCache
+from src.core.presentation.report_formatter import ReportFormatter
+from src.core.presentation.report_name import ReportName
+from src.core.utils.option import Option, Some
+from src.core.utils.result import Ok, Result
 from src.features.price_loading.data.data_sources.csv_data_source import CsvDataSource
 from src.features.price_loading.data.data_sources.utils.csv_file_reader import CsvFileReader
+from src.features.price_loading.data.data_sources.utils.file_change_watcher import FileChangeWatcher
+from src.features.price_loading.data.repositories.load_memory_budget import LoadMemoryBudget
 from src.features.price_loading.data.repositories.mappers.csv_price_mapper import CsvPriceMapper
 from src.features.price_loading.data.repositories.price_repository_impl import PriceRepositoryImpl
-from src.features.price_loading.domain.use_cases.load_prices_use_case import LoadPricesUseCase
+from src.features.price_loading.domain.price_dataset_store import PriceDatasetStore
+from src.features.price_loading.domain.use_cases.load_prices_use_case import LoadPricesUseCase, \
+    LoadPricesUseCaseFailure
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
 from src.features.price_loading.repository.price_repository import PriceRepository
+from src.features.statistics.domain.entities.average_price_entry import AveragePriceEntry
+from src.features.statistics.domain.entities.full_report import FullReport
+from src.features.statistics.domain.entities.single_country_price import SingleCountryPrice
+from src.features.statistics.domain.use_cases.build_full_report_use_case import BuildFullReportUseCase
 from src.features.statistics.domain.use_cases.calculate_average_price_per_country_use_case import \
     CalculateAveragePricePerCountryUseCase
 from src.features.statistics.domain.use_cases.calculate_cheapest_country_use_case import CalculateCheapestCountryUseCase
@@ -18,14 +44,292 @@ from src.features.statistics.domain.use_cases.calculate_price_change_use_case im
 from src.features.statistics.domain.use_cases.get_extremities_per_country_use_case import \
     GetExtremitiesPerCountryUseCase
 
+if typing.TYPE_CHECKING:
+    from src.core.presentation.analytics_service_controller import AnalyticsServiceController
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _StatisticsUseCases:
+    average_price_per_country: CalculateAveragePricePerCountryUseCase
+    most_expensive_country: CalculateMostExpensiveCountryUseCase
+    cheapest_country: CalculateCheapestCountryUseCase
+    extremities_per_country: GetExtremitiesPerCountryUseCase
+    price_change: CalculatePriceChangeUseCase
+    full_report: BuildFullReportUseCase
+
 
 class BigMacApplication:
 
     @staticmethod
-    async def run() -> None:
-        csv_file_path: pathlib.Path = constants.PROJECT_ROOT.absolute().joinpath(
-            pathlib.Path('input/big_mac_prices.csv')
+    async def run(
+        csv_file_path: pathlib.Path = constants.DEFAULT_INPUT_PATH,
+        probes: Sequence[StageProbe] = (),
+        memory_budget: LoadMemoryBudget | None = None,
+        watch_interval_seconds: float = 2.0,
+        rendered_report_cache: RenderedReportCache | None = None,
+    ) -> None:
+        price_dataset_store: PriceDatasetStore = BigMacApplication.build_price_dataset_store(
+            csv_file_path=csv_file_path.absolute(),
+            probes=probes,
+            memory_budget=memory_budget,
+        )
+        main_menu_controller: MainMenuController = BigMacApplication.build_main_menu_controller(
+            price_dataset_store=price_dataset_store,
+            probes=probes,
+            rendered_report_cache=rendered_report_cache,
+        )
+
+        main_menu: MainMenu = MainMenu(
+            main_menu_controller=main_menu_controller,
+        )
+
+        if watch_interval_seconds > 0:
+            FileChangeWatcher(
+                path=csv_file_path,
+                interval_seconds=watch_interval_seconds,
+                on_change=price_dataset_store.reload,
+            ).start()
+
+        while True:
+            await main_menu.run()
+
+    @staticmethod
+    async def serve(
+        host: str,
+        port: int,
+        csv_file_path: pathlib.Path = constants.DEFAULT_INPUT_PATH,
+        probes: Sequence[StageProbe] = (),
+        memory_budget: LoadMemoryBudget | None = None,
+        watch_interval_seconds: float = 2.0,
+        rendered_report_cache: RenderedReportCache | None = None,
+        regions_file_path: pathlib.Path | None = None,
+    ) -> None:
+        price_dataset_store: PriceDatasetStore = BigMacApplication.build_price_dataset_store(
+            csv_file_path=csv_file_path.absolute(),
+            probes=probes,
+            memory_budget=memory_budget,
+        )
+        price_service_controller: PriceServiceController = BigMacApplication.build_price_service_controller(
+            price_dataset_store=price_dataset_store,
+            probes=probes,
+            rendered_report_cache=rendered_report_cache,
+        )
+
+        await price_dataset_store.load()
+
+        if watch_interval_seconds > 0:
+            FileChangeWatcher(
+                path=csv_file_path,
+                interval_seconds=watch_interval_seconds,
+                on_change=price_dataset_store.reload,
+            ).start()
+
+        analytics_service_controller: AnalyticsServiceController = \
+            BigMacApplication.build_analytics_service_controller(
+                price_dataset_store,
+                None if regions_file_path is None else BigMacApplication.load_regions(regions_file_path),
+            )
+        router: HttpRouter = HttpRouter(
+            routes={'/analytics': analytics_service_controller.handle},
+            default=price_service_controller.handle,
+        )
+
+        await HttpServer(handler=router.handle).serve(host, port)
+
+    @staticmethod
+    async def run_batch(
+        csv_file_path: pathlib.Path,
+        report_names: Sequence[ReportName],
+        output_format: BatchOutputFormat,
+        output: typing.TextIO,
+        probes: Sequence[StageProbe] = (),
+        memory_budget: LoadMemoryBudget | None = None,
+    ) -> Result[None, LoadPricesUseCaseFailure]:
+        load_prices_use_case: LoadPricesUseCase = BigMacApplication._build_load_prices_use_case(
+            csv_file_path=csv_file_path.absolute(),
+            probes=probes,
+            memory_budget=memory_budget,
+        )
+        reports: list[BatchReport] = [
+            report for name in report_names for report in BigMacApplication._build_batch_reports(name, probes)
+        ]
+
+        return await BatchReportRunner(
+            load_prices_use_case=load_prices_use_case,
+            reports=reports,
+            output_format=output_format,
+        ).run(output)
+
+    @staticmethod
+    def build_price_dataset_store(
+        csv_file_path: pathlib.Path,
+        probes: Sequence[StageProbe] = (),
+        memory_budget: LoadMemoryBudget | None = None,
+    ) -> PriceDatasetStore:
+        return PriceDatasetStore(
+            load_prices_use_case=BigMacApplication._build_load_prices_use_case(
+                csv_file_path=csv_file_path,
+                probes=probes,
+                memory_budget=memory_budget,
+            ),
+        )
+
+    @staticmethod
+    def build_main_menu_controller(
+        price_dataset_store: PriceDatasetStore,
+        probes: Sequence[StageProbe] = (),
+        rendered_report_cache: RenderedReportCache | None = None,
+    ) -> MainMenuController:
+        use_cases: _StatisticsUseCases = BigMacApplication._build_statistics_use_cases(probes)
+
+        return MainMenuController(
+            price_dataset_store=price_dataset_store,
+            calculate_average_price_per_country_use_case=use_cases.average_price_per_country,
+            calculate_most_expensive_country_use_case=use_cases.most_expensive_country,
+            calculate_cheapest_country_use_case=use_cases.cheapest_country,
+            get_extremities_per_country_use_case=use_cases.extremities_per_country,
+            calculate_price_change_use_case=use_cases.price_change,
+            build_full_report_use_case=use_cases.full_report,
+            rendered_report_cache=RenderedReportCache() if rendered_report_cache is None else rendered_report_cache,
+        )
+
+    @staticmethod
+    def build_price_service_controller(
+        price_dataset_store: PriceDatasetStore,
+        probes: Sequence[StageProbe] = (),
+        rendered_report_cache: RenderedReportCache | None = None,
+    ) -> PriceServiceController:
+        use_cases: _StatisticsUseCases = BigMacApplication._build_statistics_use_cases(probes)
+
+        return PriceServiceController(
+            price_dataset_store=price_dataset_store,
+            calculate_average_price_per_country_use_case=use_cases.average_price_per_country,
+            calculate_most_expensive_country_use_case=use_cases.most_expensive_country,
+            calculate_cheapest_country_use_case=use_cases.cheapest_country,
+            get_extremities_per_country_use_case=use_cases.extremities_per_country,
+            calculate_price_change_use_case=use_cases.price_change,
+            build_full_report_use_case=use_cases.full_report,
+            rendered_report_cache=RenderedReportCache() if rendered_report_cache is None else rendered_report_cache,
+        )
+
+    @staticmethod
+    def build_analytics_service_controller(
+        price_dataset_store: PriceDatasetStore,
+        regions: dict[CountryName, str] | None = None,
+    ) -> AnalyticsServiceController:
+        # NumPy is only needed by the analytics endpoints, keep it off the menu and batch startup path.
+        # pylint: disable=import-outside-toplevel
+        from src.core.presentation.analytics_service_controller import AnalyticsServiceController
+        from src.features.statistics.domain.entities.group_key import ColumnGroupKey, CountryGroupKey, \
+            CurrencyGroupKey, RegionGroupKey, YearGroupKey
+        from src.features.statistics.domain.use_cases.aggregate_prices_use_case import AggregatePricesUseCase
+        from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+        from src.features.statistics.domain.use_cases.build_price_history_index_use_case import \
+            BuildPriceHistoryIndexUseCase
+        from src.features.statistics.domain.use_cases.build_price_matrix_use_case import BuildPriceMatrixUseCase
+        from src.features.statistics.domain.use_cases.calculate_big_mac_index_use_case import \
+            CalculateBigMacIndexUseCase
+        from src.features.statistics.domain.use_cases.calculate_country_quantiles_use_case import \
+            CalculateCountryQuantilesUseCase
+        from src.features.statistics.domain.use_cases.calculate_price_change_between_dates_use_case import \
+            CalculatePriceChangeBetweenDatesUseCase
+        from src.features.statistics.domain.use_cases.calculate_price_similarity_use_case import \
+            CalculatePriceSimilarityUseCase
+        from src.features.statistics.domain.use_cases.calculate_price_trends_use_case import \
+            CalculatePriceTrendsUseCase
+        from src.features.statistics.domain.use_cases.calculate_release_statistics_use_case import \
+            CalculateReleaseStatisticsUseCase
+        from src.features.statistics.domain.use_cases.detect_price_anomalies_use_case import \
+            DetectPriceAnomaliesUseCase
+        from src.features.statistics.domain.use_cases.estimate_country_quantiles_use_case import \
+            EstimateCountryQuantilesUseCase
+        from src.features.statistics.domain.use_cases.rebase_prices_use_case import RebasePricesUseCase
+
+        build_price_columns_use_case: BuildPriceColumnsUseCase = BuildPriceColumnsUseCase()
+        build_price_history_index_use_case: BuildPriceHistoryIndexUseCase = BuildPriceHistoryIndexUseCase()
+        build_price_matrix_use_case: BuildPriceMatrixUseCase = BuildPriceMatrixUseCase()
+        group_keys: list[ColumnGroupKey] = [CountryGroupKey(), CurrencyGroupKey(), YearGroupKey()]
+        if regions is not None:
+            group_keys.append(RegionGroupKey(regions))
+
+        return AnalyticsServiceController(
+            price_dataset_store=price_dataset_store,
+            build_price_columns_use_case=build_price_columns_use_case,
+            build_price_matrix_use_case=build_price_matrix_use_case,
+            build_price_history_index_use_case=build_price_history_index_use_case,
+            calculate_price_change_between_dates_use_case=CalculatePriceChangeBetweenDatesUseCase(),
+            calculate_price_trends_use_case=CalculatePriceTrendsUseCase(
+                build_price_columns_use_case=build_price_columns_use_case,
+                build_price_history_index_use_case=build_price_history_index_use_case,
+            ),
+            calculate_release_statistics_use_case=CalculateReleaseStatisticsUseCase(
+                build_price_columns_use_case=build_price_columns_use_case,
+                build_price_history_index_use_case=build_price_history_index_use_case,
+            ),
+            aggregate_prices_use_case=AggregatePricesUseCase(build_price_columns_use_case=build_price_columns_use_case),
+            group_keys=group_keys,
+            calculate_country_quantiles_use_case=CalculateCountryQuantilesUseCase(
+                build_price_columns_use_case=build_price_columns_use_case,
+            ),
+            estimate_country_quantiles_use_case=EstimateCountryQuantilesUseCase(),
+            calculate_big_mac_index_use_case=CalculateBigMacIndexUseCase(
+                build_price_columns_use_case=build_price_columns_use_case,
+            ),
+            rebase_prices_use_case=RebasePricesUseCase(build_price_columns_use_case=build_price_columns_use_case),
+            calculate_price_similarity_use_case=CalculatePriceSimilarityUseCase(
+                build_price_columns_use_case=build_price_columns_use_case,
+                build_price_matrix_use_case=build_price_matrix_use_case,
+            ),
+            detect_price_anomalies_use_case=DetectPriceAnomaliesUseCase(
+                build_price_columns_use_case=build_price_columns_use_case,
+            ),
         )
+
+    @staticmethod
+    def load_regions(path: pathlib.Path) -> dict[CountryName, str]:
+        """Region of every country listed in a ``name,region`` CSV file."""
+        with path.open(encoding='utf-8', newline='') as regions_file:
+            return {
+                CountryName(value=row['name'].strip()): row['region'].strip()
+                for row in csv.DictReader(regions_file, skipinitialspace=True)
+            }
+
+    @staticmethod
+    def _build_statistics_use_cases(probes: Sequence[StageProbe]) -> _StatisticsUseCases:
+        most_expensive_country_use_case: CalculateMostExpensiveCountryUseCase = CalculateMostExpensiveCountryUseCase()
+        cheapest_country_use_case: CalculateCheapestCountryUseCase = CalculateCheapestCountryUseCase()
+        calculate_price_change_use_case: CalculatePriceChangeUseCase = CalculatePriceChangeUseCase()
+        use_cases: _StatisticsUseCases = _StatisticsUseCases(
+            average_price_per_country=CalculateAveragePricePerCountryUseCase(),
+            most_expensive_country=most_expensive_country_use_case,
+            cheapest_country=cheapest_country_use_case,
+            extremities_per_country=GetExtremitiesPerCountryUseCase(),
+            price_change=calculate_price_change_use_case,
+            full_report=BuildFullReportUseCase(
+                calculate_most_expensive_country_use_case=most_expensive_country_use_case,
+                calculate_cheapest_country_use_case=cheapest_country_use_case,
+                calculate_price_change_use_case=calculate_price_change_use_case,
+            ),
+        )
+
+        BigMacApplication._instrument_use_cases(
+            probes,
+            use_cases.average_price_per_country,
+            use_cases.most_expensive_country,
+            use_cases.cheapest_country,
+            use_cases.extremities_per_country,
+            use_cases.price_change,
+            use_cases.full_report,
+        )
+
+        return use_cases
+
+    @staticmethod
+    def _build_load_prices_use_case(
+        csv_file_path: pathlib.Path,
+        probes: Sequence[StageProbe],
+        memory_budget: LoadMemoryBudget | None,
+    ) -> LoadPricesUseCase:
         csv_file_reader: CsvFileReader = CsvFileReader()
         csv_price_mapper: CsvPriceMapper = CsvPriceMapper()
 
@@ -37,30 +341,159 @@ class BigMacApplication:
         price_repository: PriceRepository = PriceRepositoryImpl(
             csv_data_source=csv_data_source,
             csv_price_model_mapper=csv_price_mapper,
+            memory_budget=memory_budget,
         )
 
         load_prices_use_case: LoadPricesUseCase = LoadPricesUseCase(
             price_repository=price_repository,
         )
-        calculate_average_price_per_country_use_case: CalculateAveragePricePerCountryUseCase = \
-            CalculateAveragePricePerCountryUseCase()
-        most_expensive_country_use_case: CalculateMostExpensiveCountryUseCase = CalculateMostExpensiveCountryUseCase()
-        cheapest_country_use_case: CalculateCheapestCountryUseCase = CalculateCheapestCountryUseCase()
-        get_extremities_use_case: GetExtremitiesPerCountryUseCase = GetExtremitiesPerCountryUseCase()
-        calculate_price_change_use_case: CalculatePriceChangeUseCase = CalculatePriceChangeUseCase()
 
-        main_menu_controller: MainMenuController = MainMenuController(
-            load_prices_use_case=load_prices_use_case,
-            calculate_average_price_per_country_use_case=calculate_average_price_per_country_use_case,
-            calculate_most_expensive_country_use_case=most_expensive_country_use_case,
-            calculate_cheapest_country_use_case=cheapest_country_use_case,
-            get_extremities_per_country_use_case=get_extremities_use_case,
-            calculate_price_change_use_case=calculate_price_change_use_case,
-        )
+        for probe in probes:
+            probe.instrument(csv_file_reader, 'read', stage='CsvFileReader.read')
+            probe.instrument(csv_data_source, '_to_models', stage='CsvDataSource._to_models')
+            probe.instrument(csv_price_mapper, 'map', stage='CsvPriceMapper.map', row_counter=count_single_row)
+            probe.instrument(price_repository, '_to_entities', stage='PriceRepositoryImpl._to_entities')
+            probe.instrument(load_prices_use_case, 'try_execute')
 
-        main_menu: MainMenu = MainMenu(
-            main_menu_controller=main_menu_controller,
-        )
+        return load_prices_use_case
 
-        while True:
-            await main_menu.run()
+    @staticmethod
+    def _build_batch_reports(name: ReportName, probes: Sequence[StageProbe]) -> list[BatchReport]:
+        match name:
+            case ReportName.RAW_DATA:
+                return [
+                    BatchReport(
+                        name=name,
+                        compute=lambda prices: prices,
+                        as_lines=lambda prices: (
+                            line for p in prices for line in ReportFormatter.price_as_raw_lines(p)
+                        ),
+                        schema=PRICE_ENTRY_SCHEMA,
+                    )
+                ]
+            case ReportName.AVERAGE_PRICE_PER_COUNTRY:
+                average_use_case: CalculateAveragePricePerCountryUseCase = CalculateAveragePricePerCountryUseCase()
+                BigMacApplication._instrument_use_cases(probes, average_use_case)
+
+                return [
+                    BatchReport(
+                        name=name,
+                        compute=lambda prices: BigMacApplication._average_prices(average_use_case, prices),
+                        as_lines=lambda averages: (
+                            line for a in averages for line in ReportFormatter.average_price_as_raw_lines(a)
+                        ),
+                        schema=AVERAGE_PRICE_ENTRY_SCHEMA,
+                    )
+                ]
+            case ReportName.MOST_EXPENSIVE_COUNTRY | ReportName.CHEAPEST_COUNTRY:
+                average_use_case = CalculateAveragePricePerCountryUseCase()
+                single_country_use_case: CalculateMostExpensiveCountryUseCase | CalculateCheapestCountryUseCase = \
+                    CalculateMostExpensiveCountryUseCase() if name == ReportName.MOST_EXPENSIVE_COUNTRY \
+                    else CalculateCheapestCountryUseCase()
+                BigMacApplication._instrument_use_cases(probes, average_use_case, single_country_use_case)
+
+                return [
+                    BatchReport(
+                        name=name,
+                        compute=lambda prices: BigMacApplication._option_as_list(
+                            single_country_use_case.execute(BigMacApplication._average_prices(average_use_case, prices))
+                        ),
+                        as_lines=lambda countries: (
+                            line for c in countries for line in ReportFormatter.single_country_price_as_raw_lines(c)
+                        ),
+                        schema=SINGLE_COUNTRY_PRICE_SCHEMA,
+                    )
+                ]
+            case ReportName.PRICE_CHANGE_PER_COUNTRY:
+                get_extremities_use_case: GetExtremitiesPerCountryUseCase = GetExtremitiesPerCountryUseCase()
+                calculate_price_change_use_case: CalculatePriceChangeUseCase = CalculatePriceChangeUseCase()
+                BigMacApplication._instrument_use_cases(
+                    probes,
+                    get_extremities_use_case,
+                    calculate_price_change_use_case,
+                )
+
+                return [
+                    BatchReport(
+                        name=name,
+                        compute=lambda prices: calculate_price_change_use_case.execute(
+                            get_extremities_use_case.execute(prices)
+                        ),
+                        as_lines=ReportFormatter.price_changes_as_lines,
+                        schema=PRICE_CHANGE_SCHEMA,
+                    )
+                ]
+            case ReportName.FULL_REPORT:
+                return BigMacApplication._build_full_batch_reports(probes)
+
+    @staticmethod
+    def _build_full_batch_reports(probes: Sequence[StageProbe]) -> list[BatchReport]:
+        """Builds every report section from one shared full report, computed once per loaded price list."""
+        full_report_use_case: BuildFullReportUseCase = BigMacApplication._build_statistics_use_cases(probes).full_report
+        computed: list[tuple[list[PriceEntry], FullReport]] = []
+
+        def compute(prices: list[PriceEntry]) -> FullReport:
+            if not computed or computed[0][0] is not prices:
+                computed[:] = [(prices, full_report_use_case.execute(prices))]
+
+            return computed[0][1]
+
+        return [
+            BatchReport(
+                name=ReportName.FULL_REPORT,
+                compute=lambda prices: [compute(prices).summary],
+                as_lines=lambda summaries: (
+                    line for s in summaries for line in ReportFormatter.price_summary_as_lines(s)
+                ),
+                schema=PRICE_SUMMARY_SCHEMA,
+            ),
+            BatchReport(
+                name=ReportName.AVERAGE_PRICE_PER_COUNTRY,
+                compute=lambda prices: compute(prices).average_prices,
+                as_lines=lambda averages: (
+                    line for a in averages for line in ReportFormatter.average_price_as_raw_lines(a)
+                ),
+                schema=AVERAGE_PRICE_ENTRY_SCHEMA,
+            ),
+            BatchReport(
+                name=ReportName.MOST_EXPENSIVE_COUNTRY,
+                compute=lambda prices: BigMacApplication._option_as_list(compute(prices).most_expensive_country),
+                as_lines=lambda countries: (
+                    line for c in countries for line in ReportFormatter.single_country_price_as_raw_lines(c)
+                ),
+                schema=SINGLE_COUNTRY_PRICE_SCHEMA,
+            ),
+            BatchReport(
+                name=ReportName.CHEAPEST_COUNTRY,
+                compute=lambda prices: BigMacApplication._option_as_list(compute(prices).cheapest_country),
+                as_lines=lambda countries: (
+                    line for c in countries for line in ReportFormatter.single_country_price_as_raw_lines(c)
+                ),
+                schema=SINGLE_COUNTRY_PRICE_SCHEMA,
+            ),
+            BatchReport(
+                name=ReportName.PRICE_CHANGE_PER_COUNTRY,
+                compute=lambda prices: compute(prices).price_changes,
+                as_lines=ReportFormatter.price_changes_as_lines,
+                schema=PRICE_CHANGE_SCHEMA,
+            ),
+        ]
+
+    @staticmethod
+    def _average_prices(
+        use_case: CalculateAveragePricePerCountryUseCase,
+        prices: list[PriceEntry],
+    ) -> list[AveragePriceEntry]:
+        result: Result = use_case.execute(prices)
+
+        return typing.cast(Ok, result).value if result.is_ok() else []
+
+    @staticmethod
+    def _option_as_list(option: Option[SingleCountryPrice]) -> list[SingleCountryPrice]:
+        return [typing.cast(Some, option).value] if option.is_some() else []
+
+    @staticmethod
+    def _instrument_use_cases(probes: Sequence[StageProbe], *use_cases: object) -> None:
+        for probe in probes:
+            for use_case in use_cases:
+                probe.instrument(use_case, 'execute')
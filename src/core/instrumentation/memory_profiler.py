@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import sys
+import threading
+import tracemalloc
+
+from src.core.instrumentation.stage_probe import StageProbe
+
+try:
+    import resource
+except ImportError:  # pragma: nocover
+    resource = None  # type: ignore
+
+
+class MemoryProfiler(StageProbe):
+    """Reports net and peak ``tracemalloc`` allocations per stage, nested peaks propagating to their parents."""
+    _stages: dict[str, _MutableStageMemory]
+    _lock: threading.Lock
+    _thread_state: threading.local
+
+    def __init__(self) -> None:
+        self._stages = {}
+        self._lock = threading.Lock()
+        self._thread_state = threading.local()
+
+    def start(self, stage: str) -> _Frame:
+        frames: list[_Frame] = self._frames()
+
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+            if stage not in self._stages:
+                self._stages[stage] = _MutableStageMemory(depth=len(frames))
+
+            current, peak = tracemalloc.get_traced_memory()
+
+            if frames:
+                frames[-1].observed_peak = max(frames[-1].observed_peak, peak)
+
+            tracemalloc.reset_peak()
+
+        frame: _Frame = _Frame(start=current, observed_peak=current)
+        frames.append(frame)
+
+        return frame
+
+    def stop(self, stage: str, token: _Frame, rows: int | None) -> None:
+        frames: list[_Frame] = self._frames()
+        frames.remove(token)
+
+        with self._lock:
+            current, peak = tracemalloc.get_traced_memory()
+            frame_peak: int = max(token.observed_peak, peak)
+
+            if frames:
+                frames[-1].observed_peak = max(frames[-1].observed_peak, frame_peak)
+
+            memory: _MutableStageMemory = self._stages[stage]
+            memory.calls += 1
+            memory.net_bytes += current - token.start
+            memory.peak_bytes = max(memory.peak_bytes, frame_peak - token.start)
+
+            if rows is not None:
+                memory.rows = rows if memory.rows is None else memory.rows + rows
+
+    def _frames(self) -> list[_Frame]:
+        if not hasattr(self._thread_state, 'frames'):
+            self._thread_state.frames = []
+
+        return self._thread_state.frames
+
+    @staticmethod
+    def stop_tracing() -> None:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    @property
+    def stages(self) -> list[StageMemory]:
+        with self._lock:
+            return [
+                StageMemory(
+                    stage=stage,
+                    depth=memory.depth,
+                    calls=memory.calls,
+                    net_bytes=memory.net_bytes,
+                    peak_bytes=memory.peak_bytes,
+                    rows=memory.rows,
+                    bytes_per_row=memory.net_bytes / memory.rows if memory.rows else None,
+                )
+                for stage, memory in self._stages.items()
+            ]
+
+    @property
+    def peak_rss_bytes(self) -> int | None:
+        if resource is None:
+            return None  # pragma: nocover
+
+        max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+    def as_text(self) -> str:
+        lines: list[str] = [
+            f'{"Stage":<60}{"Calls":>10}{"Net (KiB)":>14}{"Peak (KiB)":>14}{"Rows":>12}{"B/row":>10}',
+            '-' * 120,
+        ]
+
+        for memory in self.stages:
+            stage: str = '  ' * memory.depth + memory.stage
+            rows: str = '' if memory.rows is None else str(memory.rows)
+            bytes_per_row: str = '' if memory.bytes_per_row is None else f'{memory.bytes_per_row:.1f}'
+
+            lines.append(
+                f'{stage:<60}{memory.calls:>10}{memory.net_bytes / 1024:>14.1f}{memory.peak_bytes / 1024:>14.1f}'
+                f'{rows:>12}{bytes_per_row:>10}'
+            )
+
+        if self.peak_rss_bytes is not None:
+            lines.append(f'Peak RSS: {self.peak_rss_bytes / 1024 / 1024:.1f} MiB')
+
+        return '\n'.join(lines)
+
+    def as_json(self) -> str:
+        return json.dumps(
+            {'peak_rss_bytes': self.peak_rss_bytes, 'stages': [dataclasses.asdict(s) for s in self.stages]},
+            indent=2,
+        )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class StageMemory:
+    stage: str
+    depth: int
+    calls: int
+    net_bytes: int
+    peak_bytes: int
+    rows: int | None
+    bytes_per_row: float | None
+
+
+@dataclasses.dataclass(kw_only=True)
+class _MutableStageMemory:
+    depth: int
+    calls: int = 0
+    net_bytes: int = 0
+    peak_bytes: int = 0
+    rows: int | None = None
+
+
+@dataclasses.dataclass(kw_only=True, eq=False)
+class _Frame:
+    start: int
+    observed_peak: int
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import abc
+import functools
+import inspect
+import typing
+from collections.abc import Callable, Sized
+
+from src.core.utils.option import Some
+from src.core.utils.result import Ok
+
+RowCounter: typing.TypeAlias = Callable[[typing.Any], int | None]
+
+
+class StageProbe(abc.ABC):
+
+    @abc.abstractmethod
+    def start(self, stage: str) -> typing.Any:
+        pass  # pragma: nocover
+
+    @abc.abstractmethod
+    def stop(self, stage: str, token: typing.Any, rows: int | None) -> None:
+        pass  # pragma: nocover
+
+    def instrument(
+        self,
+        target: object,
+        method_name: str,
+        stage: str | None = None,
+        row_counter: RowCounter | None = None,
+    ) -> None:
+        """Replaces ``target.method_name`` with a wrapper reporting to this probe, only on the given instance."""
+        method: Callable[..., typing.Any] = getattr(target, method_name)
+        stage_name: str = stage if stage is not None else f'{type(target).__name__}.{method_name}'
+        counter: RowCounter = row_counter if row_counter is not None else count_rows
+
+        setattr(target, method_name, self._wrap(method, stage_name, counter))
+
+    def _wrap(self, method: Callable[..., typing.Any], stage: str, counter: RowCounter) -> Callable[..., typing.Any]:
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+                token: typing.Any = self.start(stage)
+                output: typing.Any = None
+
+                try:
+                    output = await method(*args, **kwargs)
+                    return output
+                finally:
+                    self.stop(stage, token, counter(output))
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            token: typing.Any = self.start(stage)
+            output: typing.Any = None
+
+            try:
+                output = method(*args, **kwargs)
+                return output
+            finally:
+                self.stop(stage, token, counter(output))
+
+        return wrapper
+
+
+def count_rows(output: typing.Any) -> int | None:
+    if isinstance(output, (Ok, Some)):
+        return count_rows(output.value)
+
+    if isinstance(output, Sized) and not isinstance(output, str):
+        return len(output)
+
+    return None
+
+
+def count_single_row(output: typing.Any) -> int | None:
+    if isinstance(output, Ok):
+        return 1
+
+    return 0 if output is not None else None
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import threading
+import time
+import typing
+
+from src.core.instrumentation.stage_probe import StageProbe
+
+
+class Tracer(StageProbe):
+    """Collects wall time, thread CPU time and row counts per stage, folding repeated calls into one span."""
+    _spans: dict[str, _MutableSpan]
+    _lock: threading.Lock
+    _thread_state: threading.local
+
+    def __init__(self) -> None:
+        self._spans = {}
+        self._lock = threading.Lock()
+        self._thread_state = threading.local()
+
+    def start(self, stage: str) -> tuple[int, int]:
+        depth: int = getattr(self._thread_state, 'depth', 0)
+
+        with self._lock:
+            if stage not in self._spans:
+                self._spans[stage] = _MutableSpan(depth=depth)
+
+        self._thread_state.depth = depth + 1
+
+        return time.perf_counter_ns(), time.thread_time_ns()
+
+    def stop(self, stage: str, token: tuple[int, int], rows: int | None) -> None:
+        wall_end: int = time.perf_counter_ns()
+        cpu_end: int = time.thread_time_ns()
+        wall_start, cpu_start = token
+
+        self._thread_state.depth -= 1
+
+        with self._lock:
+            span: _MutableSpan = self._spans[stage]
+            span.calls += 1
+            span.wall_time_ns += wall_end - wall_start
+            span.cpu_time_ns += cpu_end - cpu_start
+
+            if rows is not None:
+                span.rows = rows if span.rows is None else span.rows + rows
+
+    @property
+    def spans(self) -> list[TraceSpan]:
+        with self._lock:
+            return [
+                TraceSpan(
+                    stage=stage,
+                    depth=span.depth,
+                    calls=span.calls,
+                    wall_time_seconds=span.wall_time_ns / 1e9,
+                    cpu_time_seconds=span.cpu_time_ns / 1e9,
+                    rows=span.rows,
+                )
+                for stage, span in self._spans.items()
+            ]
+
+    def as_text(self) -> str:
+        lines: list[str] = [
+            f'{"Stage":<60}{"Calls":>10}{"Wall (s)":>12}{"CPU (s)":>12}{"Rows":>12}',
+            '-' * 106,
+        ]
+
+        for span in self.spans:
+            stage: str = '  ' * span.depth + span.stage
+            rows: str = '' if span.rows is None else str(span.rows)
+
+            lines.append(
+                f'{stage:<60}{span.calls:>10}{span.wall_time_seconds:>12.6f}{span.cpu_time_seconds:>12.6f}{rows:>12}'
+            )
+
+        return '\n'.join(lines)
+
+    def as_json(self) -> str:
+        return json.dumps({'spans': [dataclasses.asdict(s) for s in self.spans]}, indent=2)
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class TraceSpan:
+    stage: str
+    depth: int
+    calls: int
+    wall_time_seconds: float
+    cpu_time_seconds: float
+    rows: int | None
+
+
+@dataclasses.dataclass(kw_only=True)
+class _MutableSpan:
+    depth: int
+    calls: int = 0
+    wall_time_ns: int = 0
+    cpu_time_ns: int = 0
+    rows: int | None = None
@@ -0,0 +1,576 @@
+from __future__ import annotations
+
+import bisect
+import datetime
+import math
+import typing
+from collections.abc import Sequence
+
+import numpy
+
+from src.core.presentation.export_schema import DATED_PRICE_CHANGE_SCHEMA, RELEASE_STATISTICS_SCHEMA
+from src.core.presentation.http_server import HttpRequest, HttpResponse
+from src.core.presentation.query_parameters import InvalidQueryParameter, QueryParameters
+from src.core.utils.option import Some
+from src.core.utils.result import Error, Ok, Result
+from src.core.utils.versioned_cache import VersionedCache
+from src.features.price_loading.domain.price_dataset_store import PriceDatasetStore
+from src.features.price_loading.entities.price_dataset import PriceDataset
+from src.features.price_loading.entities.price_entry import CountryName
+from src.features.statistics.domain.entities.aggregated_group import AggregatedField, AggregatedGroup, Reducer
+from src.features.statistics.domain.entities.big_mac_index import BigMacIndex
+from src.features.statistics.domain.entities.country_quantile_sketches import CountryQuantileSketches
+from src.features.statistics.domain.entities.country_quantiles import CountryQuantiles, QuantileMode
+from src.features.statistics.domain.entities.date_match import DateMatch
+from src.features.statistics.domain.entities.dated_price_change import DatedPriceChange
+from src.features.statistics.domain.entities.group_key import ColumnGroupKey
+from src.features.statistics.domain.entities.price_anomalies import PriceAnomalies
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+from src.features.statistics.domain.entities.price_history_index import PriceHistoryIndex
+from src.features.statistics.domain.entities.price_matrix import PriceMatrix
+from src.features.statistics.domain.entities.price_similarity import PriceSimilarity, SimilarCountry, \
+    SimilarityMeasure
+from src.features.statistics.domain.entities.price_trends import PriceTrends
+from src.features.statistics.domain.entities.release_statistics import ReleaseStatistics
+from src.features.statistics.domain.use_cases.aggregate_prices_use_case import AggregatePricesUseCase
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.build_price_history_index_use_case import \
+    BuildPriceHistoryIndexUseCase
+from src.features.statistics.domain.use_cases.build_price_matrix_use_case import BuildPriceMatrixUseCase
+from src.features.statistics.domain.use_cases.calculate_big_mac_index_use_case import DEFAULT_BASE_COUNTRY, \
+    CalculateBigMacIndexUseCase
+from src.features.statistics.domain.use_cases.calculate_country_quantiles_use_case import \
+    CalculateCountryQuantilesUseCase
+from src.features.statistics.domain.use_cases.calculate_price_change_between_dates_use_case import \
+    CalculatePriceChangeBetweenDatesUseCase
+from src.features.statistics.domain.use_cases.calculate_price_similarity_use_case import \
+    DEFAULT_MIN_COMMON_RELEASES, CalculatePriceSimilarityUseCase
+from src.features.statistics.domain.use_cases.calculate_price_trends_use_case import CalculatePriceTrendsUseCase
+from src.features.statistics.domain.use_cases.calculate_release_statistics_use_case import \
+    CalculateReleaseStatisticsUseCase
+from src.features.statistics.domain.use_cases.detect_price_anomalies_use_case import DEFAULT_TOLERANCE, \
+    DEFAULT_Z_THRESHOLD, DetectPriceAnomaliesUseCase
+from src.features.statistics.domain.use_cases.estimate_country_quantiles_use_case import \
+    EstimateCountryQuantilesUseCase
+from src.features.statistics.domain.use_cases.rebase_prices_use_case import DOLLAR_CURRENCY, RebasePricesUseCase
+
+_DEFAULT_TREND_WINDOW: int = 4
+_MAX_TREND_WINDOW: int = 100
+_DEFAULT_REDUCERS: tuple[Reducer, ...] = (Reducer.COUNT, Reducer.MEAN, Reducer.MIN, Reducer.MAX)
+_DEFAULT_PROBABILITIES: tuple[float, ...] = (0.1, 0.5, 0.9)
+_DEFAULT_NEIGHBOURS: int = 5
+
+
+class AnalyticsServiceController:
+    """Answers the ``/analytics`` endpoints from NumPy columns built once per dataset version."""
+    _price_dataset_store: PriceDatasetStore
+    _build_price_columns_use_case: BuildPriceColumnsUseCase
+    _build_price_matrix_use_case: BuildPriceMatrixUseCase
+    _build_price_history_index_use_case: BuildPriceHistoryIndexUseCase
+    _price_change_between_dates_use_case: CalculatePriceChangeBetweenDatesUseCase
+    _price_trends_use_case: CalculatePriceTrendsUseCase
+    _release_statistics_use_case: CalculateReleaseStatisticsUseCase
+    _aggregate_prices_use_case: AggregatePricesUseCase
+    _group_keys: dict[str, ColumnGroupKey]
+    _country_quantiles_use_case: CalculateCountryQuantilesUseCase
+    _estimate_country_quantiles_use_case: EstimateCountryQuantilesUseCase
+    _big_mac_index_use_case: CalculateBigMacIndexUseCase
+    _rebase_prices_use_case: RebasePricesUseCase
+    _price_similarity_use_case: CalculatePriceSimilarityUseCase
+    _detect_price_anomalies_use_case: DetectPriceAnomaliesUseCase
+    _columns_cache: VersionedCache[None, PriceColumns]
+    _rebased_columns_cache: VersionedCache[str, Result]
+    _matrix_cache: VersionedCache[tuple[bool, str], PriceMatrix]
+    _history_index_cache: VersionedCache[None, PriceHistoryIndex]
+    _trends_cache: VersionedCache[int, PriceTrends]
+    _release_statistics_cache: VersionedCache[None, list[ReleaseStatistics]]
+    _aggregation_cache: VersionedCache[tuple[str, tuple[Reducer, ...], AggregatedField, str], list[AggregatedGroup]]
+    _quantiles_cache: VersionedCache[tuple[tuple[float, ...], str], list[CountryQuantiles]]
+    _quantile_sketches_cache: VersionedCache[None, CountryQuantileSketches]
+    _similarity_cache: VersionedCache[tuple[SimilarityMeasure, int], PriceSimilarity]
+    _anomalies_cache: VersionedCache[tuple[float, float], PriceAnomalies]
+    _big_mac_index_cache: VersionedCache[CountryName, Result]
+
+    def __init__(
+        self,
+        price_dataset_store: PriceDatasetStore,
+        build_price_columns_use_case: BuildPriceColumnsUseCase,
+        build_price_matrix_use_case: BuildPriceMatrixUseCase,
+        build_price_history_index_use_case: BuildPriceHistoryIndexUseCase,
+        calculate_price_change_between_dates_use_case: CalculatePriceChangeBetweenDatesUseCase,
+        calculate_price_trends_use_case: CalculatePriceTrendsUseCase,
+        calculate_release_statistics_use_case: CalculateReleaseStatisticsUseCase,
+        aggregate_prices_use_case: AggregatePricesUseCase,
+        group_keys: Sequence[ColumnGroupKey],
+        calculate_country_quantiles_use_case: CalculateCountryQuantilesUseCase,
+        estimate_country_quantiles_use_case: EstimateCountryQuantilesUseCase,
+        calculate_big_mac_index_use_case: CalculateBigMacIndexUseCase,
+        rebase_prices_use_case: RebasePricesUseCase,
+        calculate_price_similarity_use_case: CalculatePriceSimilarityUseCase,
+        detect_price_anomalies_use_case: DetectPriceAnomaliesUseCase,
+    ) -> None:
+        self._price_dataset_store = price_dataset_store
+        self._build_price_columns_use_case = build_price_columns_use_case
+        self._build_price_matrix_use_case = build_price_matrix_use_case
+        self._build_price_history_index_use_case = build_price_history_index_use_case
+        self._price_change_between_dates_use_case = calculate_price_change_between_dates_use_case
+        self._price_trends_use_case = calculate_price_trends_use_case
+        self._release_statistics_use_case = calculate_release_statistics_use_case
+        self._aggregate_prices_use_case = aggregate_prices_use_case
+        self._group_keys = {k.name: k for k in group_keys}
+        self._country_quantiles_use_case = calculate_country_quantiles_use_case
+        self._estimate_country_quantiles_use_case = estimate_country_quantiles_use_case
+        self._big_mac_index_use_case = calculate_big_mac_index_use_case
+        self._rebase_prices_use_case = rebase_prices_use_case
+        self._price_similarity_use_case = calculate_price_similarity_use_case
+        self._detect_price_anomalies_use_case = detect_price_anomalies_use_case
+        self._columns_cache = VersionedCache(max_entries=1)
+        self._rebased_columns_cache = VersionedCache(max_entries=4)
+        self._matrix_cache = VersionedCache(max_entries=4)
+        self._history_index_cache = VersionedCache(max_entries=1)
+        self._trends_cache = VersionedCache(max_entries=4)
+        self._release_statistics_cache = VersionedCache(max_entries=1)
+        self._aggregation_cache = VersionedCache(max_entries=16)
+        self._quantiles_cache = VersionedCache(max_entries=8)
+        self._quantile_sketches_cache = VersionedCache(max_entries=1)
+        self._big_mac_index_cache = VersionedCache(max_entries=4)
+        self._similarity_cache = VersionedCache(max_entries=4)
+        self._anomalies_cache = VersionedCache(max_entries=4)
+
+    async def handle(self, request: HttpRequest) -> HttpResponse:
+        dataset: PriceDataset = await self._price_dataset_store.get()
+        parameters: QueryParameters = QueryParameters(request.query)
+
+        try:
+            match request.path.rstrip('/'):
+                case '/analytics/price-matrix':
+                    payload: dict[str, typing.Any] = self._price_matrix(dataset, parameters)
+                case '/analytics/price-change':
+                    payload = self._price_change(dataset, parameters)
+                case '/analytics/price-trends':
+                    payload = self._price_trends(dataset, parameters)
+                case '/analytics/release-statistics':
+                    payload = self._release_statistics(dataset, parameters)
+                case '/analytics/aggregate':
+                    payload = self._aggregate(dataset, parameters)
+                case '/analytics/quantiles':
+                    payload = self._quantiles(dataset, parameters)
+                case '/analytics/big-mac-index':
+                    payload = self._big_mac_index(dataset, parameters)
+                case '/analytics/similar-countries':
+                    payload = self._similar_countries(dataset, parameters)
+                case '/analytics/anomalies':
+                    payload = self._anomalies(dataset, parameters)
+                case _:
+                    return HttpResponse.error(404, f'Unknown path {request.path}')
+        except InvalidQueryParameter as invalid_parameter:
+            return HttpResponse.error(400, invalid_parameter.details)
+
+        return HttpResponse.json({'dataset_version': dataset.version} | payload)
+
+    def _columns(self, dataset: PriceDataset, currency: str = DOLLAR_CURRENCY) -> PriceColumns:
+        """Price columns of the dataset, with prices in ``currency``."""
+        columns: PriceColumns = self._columns_cache.get(
+            dataset.version,
+            None,
+            lambda: self._build_price_columns_use_case.execute(dataset.prices),
+        )
+
+        if currency == DOLLAR_CURRENCY:
+            return columns
+
+        result: Result = self._rebased_columns_cache.get(
+            dataset.version,
+            currency,
+            lambda: self._rebase_prices_use_case.calculate(columns, currency),
+        )
+
+        if result.is_err():
+            raise InvalidQueryParameter(typing.cast(Error, result).value.details)
+
+        return typing.cast(Ok, result).value
+
+    def _matrix(self, dataset: PriceDataset, forward_fill: bool, currency: str) -> PriceMatrix:
+        return self._matrix_cache.get(
+            dataset.version,
+            (forward_fill, currency),
+            lambda: self._build_price_matrix_use_case.execute(
+                self._columns(dataset, currency),
+                forward_fill=forward_fill,
+            ),
+        )
+
+    def _history_index(self, dataset: PriceDataset) -> PriceHistoryIndex:
+        return self._history_index_cache.get(
+            dataset.version,
+            None,
+            lambda: self._build_price_history_index_use_case.execute(self._columns(dataset)),
+        )
+
+    def _price_change(self, dataset: PriceDataset, parameters: QueryParameters) -> dict[str, typing.Any]:
+        parameters.accept_only(('from', 'to', 'match'))
+
+        start: datetime.date = parameters.required_date('from')
+        end: datetime.date = parameters.required_date('to')
+        match: DateMatch = parameters.choice('match', DateMatch, DateMatch.EXACT)
+        changes: list[DatedPriceChange] = self._price_change_between_dates_use_case.execute(
+            self._history_index(dataset),
+            start,
+            end,
+            match,
+        )
+
+        return {
+            'from': start.isoformat(),
+            'to': end.isoformat(),
+            'match': match.value,
+            'items': [DATED_PRICE_CHANGE_SCHEMA.as_record(c) for c in changes],
+        }
+
+    def _aggregate(self, dataset: PriceDataset, parameters: QueryParameters) -> dict[str, typing.Any]:
+        parameters.accept_only(('by', 'reducers', 'field', 'currency'))
+
+        key: ColumnGroupKey = self._group_key(parameters.text('by') or 'country')
+        reducers: tuple[Reducer, ...] = parameters.choices('reducers', Reducer, _DEFAULT_REDUCERS)
+        field: AggregatedField = parameters.choice('field', AggregatedField, AggregatedField.DOLLAR_PRICE)
+        currency: str = _currency(parameters)
+        groups: list[AggregatedGroup] = self._aggregation_cache.get(
+            dataset.version,
+            (key.name, reducers, field, currency),
+            lambda: self._aggregate_prices_use_case.aggregate_columns(
+                self._columns(dataset, currency),
+                key,
+                reducers,
+                field,
+            ),
+        )
+
+        return {
+            'by': key.name,
+            'field': field.value,
+            'currency': currency,
+            'items': [{key.name: g.key} | {r.value: v for r, v in g.values.items()} for g in groups],
+        }
+
+    def _big_mac_index(self, dataset: PriceDataset, parameters: QueryParameters) -> dict[str, typing.Any]:
+        parameters.accept_only(('base', 'date', 'country'))
+
+        columns: PriceColumns = self._columns(dataset)
+        base_country: CountryName = columns.countries[
+            self._country_code(columns.countries, parameters.text('base') or DEFAULT_BASE_COUNTRY.value)
+        ]
+        date: datetime.date | None = parameters.date('date')
+        country_name: str | None = parameters.text('country')
+        result: Result = self._big_mac_index_cache.get(
+            dataset.version,
+            base_country,
+            lambda: self._big_mac_index_use_case.calculate(columns, base_country),
+        )
+
+        if result.is_err():
+            raise InvalidQueryParameter(typing.cast(Error, result).value.details)
+
+        index: BigMacIndex = typing.cast(Ok, result).value
+        is_selected: numpy.ndarray = numpy.ones(len(columns.country_codes), dtype=bool)
+
+        if date is not None:
+            is_selected &= columns.date_codes == self._date_code(columns.dates, date)
+
+        if country_name is not None:
+            is_selected &= columns.country_codes == self._country_code(columns.countries, country_name)
+
+        rows: numpy.ndarray = numpy.flatnonzero(is_selected)
+        rows = rows[numpy.lexsort((columns.country_codes[rows], columns.date_codes[rows]))]
+
+        return {
+            'base_country': base_country.value,
+            'items': [
+                {
+                    'date': columns.dates[date_code].isoformat(),
+                    'country_name': columns.countries[country_code].value,
+                    'currency_code': columns.currencies[currency_code],
+                    'local_price': local_price,
+                    'dollar_exchange_rate': exchange_rate,
+                    'implied_ppp_rate': implied_ppp_rate,
+                    'valuation_percentage': valuation_percentage,
+                }
+                for date_code, country_code, currency_code, local_price, exchange_rate, implied_ppp_rate,
+                valuation_percentage in zip(
+                    columns.date_codes[rows].tolist(),
+                    columns.country_codes[rows].tolist(),
+                    columns.currency_codes[rows].tolist(),
+                    columns.local_prices[rows].tolist(),
+                    columns.exchange_rates[rows].tolist(),
+                    _as_json_numbers(index.implied_ppp_rates[rows]),
+                    _as_json_numbers(index.valuation_percentages[rows]),
+                )
+            ],
+        }
+
+    def _similar_countries(self, dataset: PriceDataset, parameters: QueryParameters) -> dict[str, typing.Any]:
+        parameters.accept_only(('country', 'k', 'measure', 'min_common_releases'))
+
+        country_name: str = parameters.required_text('country')
+        k: int = parameters.integer('k', _DEFAULT_NEIGHBOURS, 1)
+        measure: SimilarityMeasure = parameters.choice('measure', SimilarityMeasure, SimilarityMeasure.CORRELATION)
+        min_common_releases: int = parameters.integer('min_common_releases', DEFAULT_MIN_COMMON_RELEASES, 2)
+        similarity: PriceSimilarity = self._similarity_cache.get(
+            dataset.version,
+            (measure, min_common_releases),
+            lambda: self._price_similarity_use_case.calculate(
+                self._matrix(dataset, False, DOLLAR_CURRENCY),
+                measure,
+                min_common_releases,
+            ),
+        )
+        country: CountryName = similarity.countries[self._country_code(similarity.countries, country_name)]
+        neighbours: list[SimilarCountry] = typing.cast(Some, similarity.nearest(country, k)).value
+
+        return {
+            'country_name': country.value,
+            'measure': measure.value,
+            'items': [
+                {
+                    'country_name': n.country.value,
+                    'similarity': n.similarity,
+                    'common_releases': n.common_releases,
+                }
+                for n in neighbours
+            ],
+        }
+
+    def _anomalies(self, dataset: PriceDataset, parameters: QueryParameters) -> dict[str, typing.Any]:
+        parameters.accept_only(('tolerance', 'z_threshold', 'country'))
+
+        tolerance: float = parameters.decimal('tolerance', DEFAULT_TOLERANCE, 0.0)
+        z_threshold: float = parameters.decimal('z_threshold', DEFAULT_Z_THRESHOLD, 0.0)
+        country_name: str | None = parameters.text('country')
+        columns: PriceColumns = self._columns(dataset)
+        anomalies: PriceAnomalies = self._anomalies_cache.get(
+            dataset.version,
+            (tolerance, z_threshold),
+            lambda: self._detect_price_anomalies_use_case.calculate(columns, tolerance, z_threshold),
+        )
+        rows: numpy.ndarray = anomalies.flagged_rows
+
+        if country_name is not None:
+            rows = rows[columns.country_codes[rows] == self._country_code(columns.countries, country_name)]
+
+        rows = rows[numpy.lexsort((columns.country_codes[rows], columns.date_codes[rows]))]
+
+        return {
+            'tolerance': tolerance,
+            'z_threshold': z_threshold,
+            'inconsistent_prices': int(anomalies.is_inconsistent.sum()),
+            'price_jumps': int(anomalies.is_outlier.sum()),
+            'items': [
+                {
+                    'date': columns.dates[date_code].isoformat(),
+                    'country_name': columns.countries[country_code].value,
+                    'currency_code': columns.currencies[currency_code],
+                    'local_price': local_price,
+                    'dollar_exchange_rate': exchange_rate,
+                    'dollar_price': dollar_price,
+                    'implied_dollar_price': implied_dollar_price,
+                    'change_percentage': change_percentage,
+                    'change_z_score': change_z_score,
+                    'is_inconsistent': is_inconsistent,
+                    'is_price_jump': is_outlier,
+                }
+                for date_code, country_code, currency_code, local_price, exchange_rate, dollar_price,
+                implied_dollar_price, change_percentage, change_z_score, is_inconsistent, is_outlier in zip(
+                    columns.date_codes[rows].tolist(),
+                    columns.country_codes[rows].tolist(),
+                    columns.currency_codes[rows].tolist(),
+                    columns.local_prices[rows].tolist(),
+                    columns.exchange_rates[rows].tolist(),
+                    columns.dollar_prices[rows].tolist(),
+                    _as_json_numbers(anomalies.implied_dollar_prices[rows]),
+                    _as_json_numbers(anomalies.change_percentages[rows]),
+                    _as_json_numbers(anomalies.change_z_scores[rows]),
+                    anomalies.is_inconsistent[rows].tolist(),
+                    anomalies.is_outlier[rows].tolist(),
+                )
+            ],
+        }
+
+    def _quantiles(self, dataset: PriceDataset, parameters: QueryParameters) -> dict[str, typing.Any]:
+        parameters.accept_only(('probabilities', 'mode', 'country', 'currency'))
+
+        probabilities: tuple[float, ...] = parameters.decimals('probabilities', _DEFAULT_PROBABILITIES, 0.0, 1.0)
+        mode: QuantileMode = parameters.choice('mode', QuantileMode, QuantileMode.EXACT)
+        country_name: str | None = parameters.text('country')
+        currency: str = _currency(parameters)
+
+        if mode == QuantileMode.EXACT:
+            quantiles: list[CountryQuantiles] = self._quantiles_cache.get(
+                dataset.version,
+                (probabilities, currency),
+                lambda: self._country_quantiles_use_case.calculate(self._columns(dataset, currency), probabilities),
+            )
+        elif currency != DOLLAR_CURRENCY:
+            raise InvalidQueryParameter('currency is only supported with mode=exact')
+        else:
+            quantiles = self._estimate_country_quantiles_use_case.summarize(
+                self._quantile_sketches_cache.get(
+                    dataset.version,
+                    None,
+                    lambda: self._estimate_country_quantiles_use_case.sketch(dataset.prices),
+                ),
+                probabilities,
+            )
+
+        if country_name is not None:
+            quantiles = [quantiles[self._country_code([q.country for q in quantiles], country_name)]]
+
+        return {
+            'mode': mode.value,
+            'currency': currency,
+            'items': [
+                {
+                    'country_name': q.country.value,
+                    'prices': q.prices,
+                    'quantiles': [{'probability': p, 'price': v} for p, v in q.quantiles.items()],
+                }
+                for q in quantiles
+            ],
+        }
+
+    def _release_statistics(self, dataset: PriceDataset, parameters: QueryParameters) -> dict[str, typing.Any]:
+        parameters.accept_only(('from', 'to'))
+
+        start: datetime.date | None = parameters.date('from')
+        end: datetime.date | None = parameters.date('to')
+        statistics: list[ReleaseStatistics] = self._release_statistics_cache.get(
+            dataset.version,
+            None,
+            lambda: self._release_statistics_use_case.calculate(self._history_index(dataset)),
+        )
+
+        return {
+            'items': [
+                RELEASE_STATISTICS_SCHEMA.as_record(s) for s in statistics
+                if (start is None or s.date >= start) and (end is None or s.date <= end)
+            ],
+        }
+
+    def _price_trends(self, dataset: PriceDataset, parameters: QueryParameters) -> dict[str, typing.Any]:
+        parameters.accept_only(('window', 'country'))
+
+        window: int = parameters.integer('window', _DEFAULT_TREND_WINDOW, 1, _MAX_TREND_WINDOW)
+        country_name: str | None = parameters.text('country')
+        trends: PriceTrends = self._trends_cache.get(
+            dataset.version,
+            window,
+            lambda: self._price_trends_use_case.calculate(self._history_index(dataset), window),
+        )
+        country_codes: list[int] = list(range(len(trends.countries))) if country_name is None \
+            else [self._country_code(trends.countries, country_name)]
+
+        return {
+            'window': window,
+            'items': [self._country_trend(trends, c) for c in country_codes],
+        }
+
+    @staticmethod
+    def _country_trend(trends: PriceTrends, country_code: int) -> dict[str, typing.Any]:
+        releases: slice = slice(trends.country_starts[country_code], trends.country_starts[country_code + 1])
+
+        return {
+            'country_name': trends.countries[country_code].value,
+            'compound_annual_growth_percentage': _as_json_numbers(
+                trends.compound_annual_growth_percentages[country_code:country_code + 1]
+            )[0],
+            'releases': [
+                {
+                    'date': datetime.date.fromordinal(ordinal).isoformat(),
+                    'dollar_price': dollar_price,
+                    'rolling_mean': rolling_mean,
+                    'year_over_year_percentage': year_over_year_percentage,
+                }
+                for ordinal, dollar_price, rolling_mean, year_over_year_percentage in zip(
+                    trends.release_ordinals[releases].tolist(),
+                    _as_json_numbers(trends.dollar_prices[releases]),
+                    _as_json_numbers(trends.rolling_means[releases]),
+                    _as_json_numbers(trends.year_over_year_percentages[releases]),
+                )
+            ],
+        }
+
+    def _price_matrix(self, dataset: PriceDataset, parameters: QueryParameters) -> dict[str, typing.Any]:
+        parameters.accept_only(('country', 'date', 'forward_fill', 'currency'))
+
+        currency: str = _currency(parameters)
+        matrix: PriceMatrix = self._matrix(dataset, parameters.flag('forward_fill'), currency)
+        country_name: str | None = parameters.text('country')
+        date: datetime.date | None = parameters.date('date')
+        row: int | None = None if country_name is None else self._country_code(matrix.countries, country_name)
+        column: int | None = None if date is None else self._date_code(matrix.dates, date)
+
+        if row is not None and column is not None:
+            return {
+                'currency': currency,
+                'country': matrix.countries[row].value,
+                'date': matrix.dates[column].isoformat(),
+                'price': _as_json_numbers(matrix.dollar_prices[row, column:column + 1])[0],
+            }
+        if row is not None:
+            return {
+                'currency': currency,
+                'country': matrix.countries[row].value,
+                'dates': [d.isoformat() for d in matrix.dates],
+                'prices': _as_json_numbers(matrix.dollar_prices[row]),
+            }
+        if column is not None:
+            return {
+                'currency': currency,
+                'date': matrix.dates[column].isoformat(),
+                'countries': [c.value for c in matrix.countries],
+                'prices': _as_json_numbers(matrix.dollar_prices[:, column]),
+            }
+
+        return {
+            'currency': currency,
+            'countries': [c.value for c in matrix.countries],
+            'dates': [d.isoformat() for d in matrix.dates],
+            'prices': [_as_json_numbers(r) for r in matrix.dollar_prices],
+        }
+
+    def _group_key(self, name: str) -> ColumnGroupKey:
+        key: ColumnGroupKey | None = self._group_keys.get(name.casefold())
+
+        if key is None:
+            raise InvalidQueryParameter(f'by must be one of {", ".join(self._group_keys)}')
+
+        return key
+
+    @staticmethod
+    def _country_code(countries: list[CountryName], name: str) -> int:
+        country_code: int | None = next(
+            (i for i, c in enumerate(countries) if c.value.casefold() == name.casefold()),
+            None,
+        )
+
+        if country_code is None:
+            raise InvalidQueryParameter(f'Unknown country {name}')
+
+        return country_code
+
+    @staticmethod
+    def _date_code(dates: list[datetime.date], date: datetime.date) -> int:
+        date_code: int = bisect.bisect_left(dates, date)
+
+        if date_code == len(dates) or dates[date_code] != date:
+            raise InvalidQueryParameter(f'{date.isoformat()} is not a release date')
+
+        return date_code
+
+
+def _currency(parameters: QueryParameters) -> str:
+    currency: str | None = parameters.text('currency')
+
+    return DOLLAR_CURRENCY if currency is None else currency.upper()
+
+
+def _as_json_numbers(values: numpy.ndarray) -> list[float | None]:
+    return [v if math.isfinite(v) else None for v in values.tolist()]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import dataclasses
+import enum
+import json
+import typing
+from collections.abc import Callable, Iterator, Sequence
+
+from src.core.presentation.export_schema import ExportSchema
+from src.core.presentation.report_exporter import ReportExporter
+from src.core.presentation.report_formatter import ReportFormatter
+from src.core.presentation.report_name import ReportName
+from src.core.utils.result import Error, Ok, Result
+from src.features.price_loading.domain.use_cases.load_prices_use_case import (
+    LoadPricesUseCase,
+    LoadPricesUseCaseFailure,
+)
+from src.features.price_loading.entities.price_entry import PriceEntry
+
+
+class BatchOutputFormat(str, enum.Enum):
+    TEXT = 'text'
+    JSON = 'json'
+    JSON_LINES = 'jsonl'
+    CSV = 'csv'
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BatchReport:
+    name: ReportName
+    compute: Callable[[list[PriceEntry]], Sequence[typing.Any]]
+    as_lines: Callable[[Sequence[typing.Any]], Iterator[str]]
+    schema: ExportSchema
+
+
+class BatchReportRunner:
+    """Loads prices once and writes each requested report once, where it first appears."""
+    _load_prices_use_case: LoadPricesUseCase
+    _reports: Sequence[BatchReport]
+    _output_format: BatchOutputFormat
+
+    def __init__(
+        self,
+        load_prices_use_case: LoadPricesUseCase,
+        reports: Sequence[BatchReport],
+        output_format: BatchOutputFormat,
+    ) -> None:
+        self._load_prices_use_case = load_prices_use_case
+        self._reports = self._first_of_each_name(reports)
+        self._output_format = output_format
+
+    async def run(self, output: typing.TextIO) -> Result[None, LoadPricesUseCaseFailure]:
+        prices_result: Result[list[PriceEntry], LoadPricesUseCaseFailure] = \
+            await self._load_prices_use_case.try_execute()
+
+        if prices_result.is_err():
+            err_result: Error[list[PriceEntry], LoadPricesUseCaseFailure] = typing.cast(Error, prices_result)
+
+            return Result.error(err_result.value)
+
+        prices_ok_result: Ok[list[PriceEntry], LoadPricesUseCaseFailure] = typing.cast(Ok, prices_result)
+        prices: list[PriceEntry] = prices_ok_result.value
+
+        match self._output_format:
+            case BatchOutputFormat.TEXT:
+                self._write_text(prices, output)
+            case BatchOutputFormat.JSON:
+                self._write_json(prices, output)
+            case BatchOutputFormat.JSON_LINES:
+                self._write_json_lines(prices, output)
+            case BatchOutputFormat.CSV:
+                self._write_csv(prices, output)
+
+        output.flush()
+
+        return Result.ok(None)
+
+    @staticmethod
+    def _first_of_each_name(reports: Sequence[BatchReport]) -> list[BatchReport]:
+        names: set[ReportName] = set()
+        unique_reports: list[BatchReport] = []
+
+        for report in reports:
+            if report.name not in names:
+                names.add(report.name)
+                unique_reports.append(report)
+
+        return unique_reports
+
+    def _write_text(self, prices: list[PriceEntry], output: typing.TextIO) -> None:
+        for report in self._reports:
+            output.write(ReportFormatter.section_header(report.name.value) + '\n')
+
+            for line in report.as_lines(report.compute(prices)):
+                output.write(line + '\n')
+
+            output.write('\n')
+
+    def _write_json(self, prices: list[PriceEntry], output: typing.TextIO) -> None:
+        exporter: ReportExporter = ReportExporter(output)
+        separator: str = ''
+
+        output.write('{')
+
+        for report in self._reports:
+            output.write(f'{separator}{json.dumps(report.name.value)}:')
+            exporter.write_json_array(report.schema, report.compute(prices))
+            separator = ','
+
+        output.write('}\n')
+
+    def _write_json_lines(self, prices: list[PriceEntry], output: typing.TextIO) -> None:
+        exporter: ReportExporter = ReportExporter(output)
+
+        for report in self._reports:
+            exporter.write_json_lines(report.schema, report.compute(prices), report=report.name.value)
+
+    def _write_csv(self, prices: list[PriceEntry], output: typing.TextIO) -> None:
+        """Writes every report as its own header and rows, separated by a blank line."""
+        exporter: ReportExporter = ReportExporter(output)
+
+        for index, report in enumerate(self._reports):
+            if index > 0:
+                output.write('\n')
+
+            exporter.write_csv(report.schema, report.compute(prices))
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import dataclasses
+import typing
+from collections.abc import Callable
+
+from src.features.price_loading.entities.price_entry import PriceEntry
+from src.features.statistics.domain.entities.average_price_entry import AveragePriceEntry
+from src.features.statistics.domain.entities.dated_price_change import DatedPriceChange
+from src.features.statistics.domain.entities.full_report import PriceSummary
+from src.features.statistics.domain.entities.price_change import PriceChange
+from src.features.statistics.domain.entities.release_statistics import ReleaseStatistics
+from src.features.statistics.domain.entities.single_country_price import SingleCountryPrice
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ExportSchema:
+    """Flat columns of a report entry, in the order they are exported."""
+    columns: tuple[str, ...]
+    as_row: Callable[[typing.Any], tuple[typing.Any, ...]]
+
+    def as_record(self, entry: typing.Any) -> dict[str, typing.Any]:
+        return dict(zip(self.columns, self.as_row(entry)))
+
+
+def _price_entry_row(entry: PriceEntry) -> tuple[typing.Any, ...]:
+    return (
+        entry.date.isoformat(),
+        entry.country_name.value,
+        entry.price.original_currency.value,
+        entry.price.amount_in_original_currency.value,
+        entry.price.dollar_exchange_rate.value,
+        entry.price.amount_in_dollars.value,
+    )
+
+
+def _average_price_entry_row(entry: AveragePriceEntry) -> tuple[typing.Any, ...]:
+    return entry.country.value, entry.price.value
+
+
+def _single_country_price_row(entry: SingleCountryPrice) -> tuple[typing.Any, ...]:
+    return entry.country_name.value, entry.price.value
+
+
+def _price_summary_row(entry: PriceSummary) -> tuple[typing.Any, ...]:
+    return (
+        entry.prices,
+        entry.countries,
+        None if entry.first_date is None else entry.first_date.isoformat(),
+        None if entry.last_date is None else entry.last_date.isoformat(),
+    )
+
+
+def _price_change_row(entry: PriceChange) -> tuple[typing.Any, ...]:
+    return entry.country.value, entry.percentage.is_negative, entry.percentage.value
+
+
+def _dated_price_change_row(entry: DatedPriceChange) -> tuple[typing.Any, ...]:
+    return (
+        entry.country.value,
+        entry.start_date.isoformat(),
+        entry.end_date.isoformat(),
+        entry.start_price,
+        entry.end_price,
+        entry.percentage,
+    )
+
+
+def _release_statistics_row(entry: ReleaseStatistics) -> tuple[typing.Any, ...]:
+    return (
+        entry.date.isoformat(),
+        entry.countries,
+        entry.mean,
+        entry.median,
+        entry.standard_deviation,
+        entry.minimum,
+        entry.maximum,
+    )
+
+
+PRICE_ENTRY_SCHEMA: ExportSchema = ExportSchema(
+    columns=('date', 'country_name', 'currency_code', 'local_price', 'dollar_exchange_rate', 'dollar_price'),
+    as_row=_price_entry_row,
+)
+AVERAGE_PRICE_ENTRY_SCHEMA: ExportSchema = ExportSchema(
+    columns=('country_name', 'average_dollar_price'),
+    as_row=_average_price_entry_row,
+)
+SINGLE_COUNTRY_PRICE_SCHEMA: ExportSchema = ExportSchema(
+    columns=('country_name', 'average_dollar_price'),
+    as_row=_single_country_price_row,
+)
+PRICE_SUMMARY_SCHEMA: ExportSchema = ExportSchema(
+    columns=('prices', 'countries', 'first_date', 'last_date'),
+    as_row=_price_summary_row,
+)
+PRICE_CHANGE_SCHEMA: ExportSchema = ExportSchema(
+    columns=('country_name', 'is_negative', 'percentage'),
+    as_row=_price_change_row,
+)
+DATED_PRICE_CHANGE_SCHEMA: ExportSchema = ExportSchema(
+    columns=('country_name', 'start_date', 'end_date', 'start_dollar_price', 'end_dollar_price', 'percentage'),
+    as_row=_dated_price_change_row,
+)
+RELEASE_STATISTICS_SCHEMA: ExportSchema = ExportSchema(
+    columns=(
+        'date',
+        'countries',
+        'mean_dollar_price',
+        'median_dollar_price',
+        'dollar_price_standard_deviation',
+        'min_dollar_price',
+        'max_dollar_price',
+    ),
+    as_row=_release_statistics_row,
+)
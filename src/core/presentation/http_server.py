@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import gzip
+import http
+import json
+import typing
+import urllib.parse
+from collections.abc import Awaitable, Callable
+
+_MAX_HEADER_LINES: int = 100
+_GZIP_MIN_BYTES: int = 1024
+_GZIP_LEVEL: int = 5
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class HttpRequest:
+    method: str
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+    version: str
+
+    @property
+    def keeps_alive(self) -> bool:
+        connection: str = self.headers.get('connection', '').casefold()
+
+        if self.version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+
+        return connection != 'close'
+
+    @property
+    def accepts_gzip(self) -> bool:
+        return 'gzip' in self.headers.get('accept-encoding', '').casefold()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class HttpResponse:
+    status: int
+    body: bytes
+    content_type: str = 'application/json; charset=utf-8'
+
+    @staticmethod
+    def json(payload: typing.Any, status: int = 200) -> HttpResponse:
+        return HttpResponse(status=status, body=json.dumps(payload).encode('utf-8'))
+
+    @staticmethod
+    def error(status: int, message: str) -> HttpResponse:
+        return HttpResponse.json({'error': message}, status=status)
+
+
+class HttpRouter:
+    """Hands every request to the handler of the longest path prefix it starts with."""
+    _routes: list[tuple[str, Callable[[HttpRequest], Awaitable[HttpResponse]]]]
+    _default: Callable[[HttpRequest], Awaitable[HttpResponse]]
+
+    def __init__(
+        self,
+        routes: dict[str, Callable[[HttpRequest], Awaitable[HttpResponse]]],
+        default: Callable[[HttpRequest], Awaitable[HttpResponse]],
+    ) -> None:
+        self._routes = sorted(routes.items(), key=lambda route: len(route[0]), reverse=True)
+        self._default = default
+
+    async def handle(self, request: HttpRequest) -> HttpResponse:
+        for prefix, handler in self._routes:
+            if request.path == prefix or request.path.startswith(prefix.rstrip('/') + '/'):
+                return await handler(request)
+
+        return await self._default(request)
+
+
+class HttpServer:
+    """Minimal keep-alive HTTP/1.1 server on asyncio streams answering ``GET`` and ``HEAD``, gzip when accepted."""
+    _handler: Callable[[HttpRequest], Awaitable[HttpResponse]]
+    _idle_timeout_seconds: float
+
+    def __init__(
+        self,
+        handler: Callable[[HttpRequest], Awaitable[HttpResponse]],
+        idle_timeout_seconds: float = 15.0,
+    ) -> None:
+        self._handler = handler
+        self._idle_timeout_seconds = idle_timeout_seconds
+
+    async def start(self, host: str, port: int) -> asyncio.Server:
+        return await asyncio.start_server(self._serve_connection, host, port)
+
+    async def serve(self, host: str, port: int) -> None:
+        server: asyncio.Server = await self.start(host, port)
+
+        async with server:
+            await server.serve_forever()
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request: HttpRequest | None = await asyncio.wait_for(
+                    self._read_request(reader),
+                    timeout=self._idle_timeout_seconds,
+                )
+
+                if request is None:
+                    break
+
+                writer.write(self._encode(request, await self._respond(request), request.keeps_alive))
+                await writer.drain()
+
+                if not request.keeps_alive:
+                    break
+        except _MalformedRequest:
+            writer.write(self._encode(None, HttpResponse.error(400, 'Malformed request'), keep_alive=False))
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(self, request: HttpRequest) -> HttpResponse:
+        if request.method not in ('GET', 'HEAD'):
+            return HttpResponse.error(405, f'Method {request.method} not allowed')
+
+        try:
+            return await self._handler(request)
+        except Exception:  # pylint: disable=broad-except
+            return HttpResponse.error(500, 'Internal server error')
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> HttpRequest | None:
+        try:
+            request_line: bytes = await reader.readline()
+        except ValueError as error:
+            raise _MalformedRequest() from error
+
+        if not request_line:
+            return None
+
+        parts: list[str] = request_line.decode('latin-1').split()
+
+        if len(parts) != 3 or not parts[2].startswith('HTTP/1.'):
+            raise _MalformedRequest()
+
+        method, target, version = parts
+        headers: dict[str, str] = await HttpServer._read_headers(reader)
+        content_length: str = headers.get('content-length', '0')
+
+        if not content_length.isdigit():
+            raise _MalformedRequest()
+
+        if int(content_length) > 0:
+            await reader.readexactly(int(content_length))
+
+        url: urllib.parse.SplitResult = urllib.parse.urlsplit(target)
+
+        return HttpRequest(
+            method=method.upper(),
+            path=urllib.parse.unquote(url.path),
+            query=dict(urllib.parse.parse_qsl(url.query)),
+            headers=headers,
+            version=version,
+        )
+
+    @staticmethod
+    async def _read_headers(reader: asyncio.StreamReader) -> dict[str, str]:
+        headers: dict[str, str] = {}
+
+        for _ in range(_MAX_HEADER_LINES):
+            try:
+                line: str = (await reader.readline()).decode('latin-1').rstrip('\r\n')
+            except ValueError as error:
+                raise _MalformedRequest() from error
+
+            if not line:
+                return headers
+
+            name, separator, value = line.partition(':')
+
+            if not separator:
+                raise _MalformedRequest()
+
+            headers[name.strip().casefold()] = value.strip()
+
+        raise _MalformedRequest()
+
+    @staticmethod
+    def _encode(request: HttpRequest | None, response: HttpResponse, keep_alive: bool) -> bytes:
+        body: bytes = response.body
+        headers: list[str] = [
+            f'HTTP/1.1 {response.status} {http.HTTPStatus(response.status).phrase}',
+            f'Content-Type: {response.content_type}',
+            'Vary: Accept-Encoding',
+            f'Connection: {"keep-alive" if keep_alive else "close"}',
+        ]
+
+        if request is not None and request.accepts_gzip and len(body) >= _GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=_GZIP_LEVEL)
+            headers.append('Content-Encoding: gzip')
+
+        headers.append(f'Content-Length: {len(body)}')
+        head: bytes = ('\r\n'.join(headers) + '\r\n\r\n').encode('latin-1')
+
+        return head if request is not None and request.method == 'HEAD' else head + body
+
+
+class _MalformedRequest(Exception):
+    pass
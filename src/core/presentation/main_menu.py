@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import sys
+import threading
+import typing
+from collections.abc import Iterable
+
 from src.core.presentation.main_menu_controller import MainMenuController
 from src.core.presentation.view_models.main_menu_view_model import MainMenuViewModel
 
 
+# Lines are handed to stdout in chunks of about this many characters, so the first lines of a large report show
+# up before the rest is formatted without paying a write call per line.
+_OUTPUT_CHUNK_SIZE: int = 64 * 1024
+
+
 class MainMenu:
     _controller: MainMenuController
 
@@ -16,19 +28,77 @@ class MainMenu:
         self._display_header(view_model.title)
         self._display_body(view_model.body)
         await self._await_user_input(view_model.option_input_message)
+        await self._browse(view_model.browse_input_message)
 
     async def _await_user_input(self, input_message: str) -> None:
         result: str = '0'
         should_retry: bool = True
 
         while should_retry:
-            result = input(input_message)
+            result = await self._read_input(input_message)
             should_retry = self._controller.validate_input(result)
 
-        display_message: str = await self._controller.on_option_selected(result)
-        print(display_message)
+        display_lines: Iterable[str] = await self._controller.on_option_selected(result)
+        self._display_lines(display_lines)
         print()
 
+    async def _browse(self, input_message: str) -> None:
+        while self._controller.is_browsing:
+            command: str = await self._read_input(input_message)
+            self._display_lines(self._controller.on_browse_command(command))
+            print()
+
+    @staticmethod
+    async def _read_input(input_message: str) -> str:
+        """Reads a line on a daemon thread, which unlike an executor thread does not hold up the exit on Ctrl-C."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        line: asyncio.Future[str] = loop.create_future()
+
+        def settle(value: str | None, error: BaseException | None) -> None:
+            if line.done():
+                return
+
+            if error is not None:
+                line.set_exception(error)
+            else:
+                line.set_result(typing.cast(str, value))
+
+        def read() -> None:
+            value: str | None = None
+            error: BaseException | None = None
+
+            try:
+                value = input(input_message)
+            except BaseException as input_error:  # pylint: disable=broad-except
+                error = input_error
+
+            # The loop is closed when the menu exited while the line was being typed
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(settle, value, error)
+
+        threading.Thread(target=read, name='menu-input', daemon=True).start()
+
+        return await line
+
+    @staticmethod
+    def _display_lines(lines: Iterable[str]) -> None:
+        chunk: list[str] = []
+        chunk_size: int = 0
+
+        for line in lines:
+            chunk.append(line)
+            chunk_size += len(line) + 1
+
+            if chunk_size >= _OUTPUT_CHUNK_SIZE:
+                sys.stdout.write('\n'.join(chunk) + '\n')
+                chunk.clear()
+                chunk_size = 0
+
+        if chunk:
+            sys.stdout.write('\n'.join(chunk) + '\n')
+
+        sys.stdout.flush()
+
     @staticmethod
     def _display_body(body: str) -> None:
         print(body)
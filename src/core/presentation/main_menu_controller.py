@@ -1,17 +1,22 @@
-import datetime
 import sys
 import typing
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterable, Iterator
 
+from src.core.presentation.raw_data_pager import RawDataPager
+from src.core.presentation.rendered_report_cache import RenderedReportCache, ReportCacheKey, ReportCacheStatistics
+from src.core.presentation.report_formatter import ReportFormatter
+from src.core.presentation.report_name import ReportName
 from src.core.presentation.view_models.main_menu_view_model import MainMenuViewModel
 from src.core.utils.option import Option, Some
 from src.core.utils.result import Ok, Result
-from src.features.price_loading.domain.use_cases.load_prices_use_case import LoadPricesUseCase
-from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.price_loading.domain.price_dataset_store import PriceDatasetStore
+from src.features.price_loading.entities.price_dataset import PriceDataset
+from src.features.price_loading.entities.price_entry import PriceEntry
 from src.features.statistics.domain.entities.average_price_entry import AveragePriceEntry
 from src.features.statistics.domain.entities.country_extremes import CountryExtremes
 from src.features.statistics.domain.entities.price_change import PriceChange
 from src.features.statistics.domain.entities.single_country_price import SingleCountryPrice
+from src.features.statistics.domain.use_cases.build_full_report_use_case import BuildFullReportUseCase
 from src.features.statistics.domain.use_cases.calculate_average_price_per_country_use_case import (
     CalculateAveragePricePerCountryUseCase, CalculateAveragePriceUseCaseFailure,
 )
@@ -22,49 +27,57 @@ from src.features.statistics.domain.use_cases.calculate_price_change_use_case im
 from src.features.statistics.domain.use_cases.get_extremities_per_country_use_case import \
     GetExtremitiesPerCountryUseCase
 
+_RAW_DATA_PAGE_SIZE: int = 10
+
 
 class MainMenuController:
-    _load_prices_use_case: LoadPricesUseCase
+    _price_dataset_store: PriceDatasetStore
     _average_price_per_country_use_case: CalculateAveragePricePerCountryUseCase
     _most_expensive_country_use_case: CalculateMostExpensiveCountryUseCase
     _cheapest_country_use_case: CalculateCheapestCountryUseCase
     _get_extremities_per_country_use_case: GetExtremitiesPerCountryUseCase
     _calculate_price_change_use_case: CalculatePriceChangeUseCase
+    _build_full_report_use_case: BuildFullReportUseCase
+    _rendered_report_cache: RenderedReportCache
 
     _view_model: MainMenuViewModel
-    _prices_cache: list[PriceEntry] | None = None
+    _browsed_dataset: PriceDataset | None
+    _raw_data_pager: RawDataPager | None
+    _current_page: int
 
     def __init__(
         self,
-        load_prices_use_case: LoadPricesUseCase,
+        price_dataset_store: PriceDatasetStore,
         calculate_average_price_per_country_use_case: CalculateAveragePricePerCountryUseCase,
         calculate_most_expensive_country_use_case: CalculateMostExpensiveCountryUseCase,
         calculate_cheapest_country_use_case: CalculateCheapestCountryUseCase,
         get_extremities_per_country_use_case: GetExtremitiesPerCountryUseCase,
         calculate_price_change_use_case: CalculatePriceChangeUseCase,
+        build_full_report_use_case: BuildFullReportUseCase,
+        rendered_report_cache: RenderedReportCache,
     ) -> None:
-        self._load_prices_use_case = load_prices_use_case
+        self._price_dataset_store = price_dataset_store
         self._average_price_per_country_use_case = calculate_average_price_per_country_use_case
         self._most_expensive_country_use_case = calculate_most_expensive_country_use_case
         self._cheapest_country_use_case = calculate_cheapest_country_use_case
         self._get_extremities_per_country_use_case = get_extremities_per_country_use_case
         self._calculate_price_change_use_case = calculate_price_change_use_case
+        self._build_full_report_use_case = build_full_report_use_case
+        self._rendered_report_cache = rendered_report_cache
 
         self._view_model = MainMenuViewModel(
             title=' Big Mac Prices '.center(150, '-'),
             body=self._options_as_body(),
             option_input_message='Please select an option:\n',
+            browse_input_message='[n]ext, [p]revious, <page number>, c <country>, [q]uit:\n',
         )
+        self._browsed_dataset = None
+        self._raw_data_pager = None
+        self._current_page = 0
 
-    @property
-    def _prices(self) -> list[PriceEntry]:
-        self._load_prices()
-        return typing.cast(list[PriceEntry], self._prices_cache)
-
-    @property
-    def _average_prices_per_country(self) -> list[AveragePriceEntry]:
+    def _average_prices_per_country(self, prices: list[PriceEntry]) -> list[AveragePriceEntry]:
         average_prices_result: Result[list[AveragePriceEntry], CalculateAveragePriceUseCaseFailure] = \
-            self._average_price_per_country_use_case.execute(self._prices)
+            self._average_price_per_country_use_case.execute(prices)
 
         if average_prices_result.is_err():
             return []
@@ -74,126 +87,180 @@ class MainMenuController:
 
         return average_prices_ok_result.value
 
+    @property
+    def is_browsing(self) -> bool:
+        return self._current_page > 0
+
+    @property
+    def report_cache_statistics(self) -> ReportCacheStatistics:
+        return self._rendered_report_cache.statistics
+
     async def display(self) -> MainMenuViewModel:
-        await self._load_prices()
+        self._price_dataset_store.load()
 
         return self._view_model
 
-    async def on_option_selected(self, result: str) -> str:
+    async def load_prices(self) -> list[PriceEntry]:
+        dataset: PriceDataset = await self._price_dataset_store.get()
+
+        return dataset.prices
+
+    async def on_option_selected(self, result: str) -> Iterator[str]:
         selected_option: int = int(result)
 
+        if selected_option == 0:
+            sys.exit()
+
+        if selected_option == 7:
+            return self._reload_data()
+
+        dataset: PriceDataset = await self._price_dataset_store.get()
+        prices: list[PriceEntry] = dataset.prices
+
         match selected_option:
             case 1:
-                if self._prices_cache is not None:
-                    return self._display_raw_data(self._prices_cache)
+                # The raw data is the largest report, stream it rather than recording it into the cache.
+                return self._display_raw_data(prices)
             case 2:
-                return self._display_average_price_per_country()
+                return self._cached(
+                    ReportName.AVERAGE_PRICE_PER_COUNTRY,
+                    dataset,
+                    lambda: self._display_average_price_per_country(prices),
+                )
             case 3:
-                return self._display_most_expensive_country()
+                return self._cached(
+                    ReportName.MOST_EXPENSIVE_COUNTRY,
+                    dataset,
+                    lambda: self._display_most_expensive_country(prices),
+                )
             case 4:
-                return self._display_cheapest_country()
+                return self._cached(
+                    ReportName.CHEAPEST_COUNTRY,
+                    dataset,
+                    lambda: self._display_cheapest_country(prices),
+                )
             case 5:
-                return self._display_price_change_per_country()
-            case 0:
-                sys.exit()
+                return self._cached(
+                    ReportName.PRICE_CHANGE_PER_COUNTRY,
+                    dataset,
+                    lambda: self._display_price_change_per_country(prices),
+                )
+            case 6:
+                return self._start_browsing(dataset)
+            case 8:
+                return self._cached(
+                    ReportName.FULL_REPORT,
+                    dataset,
+                    lambda: ReportFormatter.full_report_as_lines(self._build_full_report_use_case.execute(prices)),
+                )
             case _:
-                return 'Invalid option'
+                return iter(['Invalid option'])
 
-        return 'Something weird happened...'
+    def on_browse_command(self, command: str) -> Iterator[str]:
+        if self._raw_data_pager is None or not self.is_browsing:
+            return iter(['Not browsing raw data'])
 
-    def _display_price_change_per_country(self) -> str:
-        extremities: list[CountryExtremes] = self._get_extremities_per_country_use_case.execute(self._prices)
-        price_changes: list[PriceChange] = self._calculate_price_change_use_case.execute(extremities)
+        normalized_command: str = command.strip().casefold()
 
-        lines: list[str] = list(self._price_changes_as_lines(price_changes))
+        if normalized_command == 'q':
+            self._current_page = 0
+            return iter([])
+        if normalized_command == 'n':
+            return self._display_page(self._current_page + 1)
+        if normalized_command == 'p':
+            return self._display_page(self._current_page - 1)
+        if normalized_command.isdigit():
+            return self._display_page(int(normalized_command))
+        if normalized_command.startswith('c '):
+            country_page: Option[int] = self._raw_data_pager.page_of_country(command.strip()[2:])
 
-        return '\n'.join(lines)
+            if country_page.is_empty():
+                return iter(['Country not found'])
 
-    async def _load_prices(self):
-        if self._prices_cache is None:
-            self._prices_cache = await self._load_prices_use_case.execute()
+            return self._display_page(typing.cast(Some, country_page).value)
 
-    def _display_raw_data(self, prices: list[PriceEntry]) -> str:
-        if len(prices) == 0:
-            return 'No prices found'
+        return iter(['Invalid command'])
 
-        prices_as_raw_lines: list[str] = []
+    def _cached(self, report: ReportName, dataset: PriceDataset, render: Callable[[], Iterable[str]]) -> Iterator[str]:
+        return self._rendered_report_cache.lines(
+            ReportCacheKey(report=report, dataset_version=dataset.version),
+            render,
+        )
 
-        for p in prices:
-            raw_lines: list[str] = list(self._price_as_raw_lines(p))
-            prices_as_raw_lines.extend(raw_lines)
+    def _reload_data(self) -> Iterator[str]:
+        already_reloading: bool = self._price_dataset_store.is_reloading
+        self._price_dataset_store.reload()
+
+        if already_reloading:
+            return iter(['A reload is already running, it will pick up the latest file contents'])
+
+        return iter(['Reloading data in the background, reports use the current data until it finishes'])
 
-        body: str = '\n'.join(prices_as_raw_lines)
+    def _start_browsing(self, dataset: PriceDataset) -> Iterator[str]:
+        if len(dataset.prices) == 0:
+            return iter(['No prices found'])
 
-        return body
+        if self._browsed_dataset is not dataset:
+            self._browsed_dataset = dataset
+            self._raw_data_pager = RawDataPager(dataset.prices, _RAW_DATA_PAGE_SIZE)
 
-    def _display_average_price_per_country(self) -> str:
-        prices_as_raw_lines: list[str] = []
+        return self._display_page(1)
 
-        for p in self._average_prices_per_country:
-            raw_lines: list[str] = list(self._average_price_as_raw_lines(p))
-            prices_as_raw_lines.extend(raw_lines)
+    def _display_page(self, page: int) -> Generator[str, None, None]:
+        pager: RawDataPager = typing.cast(RawDataPager, self._raw_data_pager)
+        prices: list[PriceEntry] = typing.cast(PriceDataset, self._browsed_dataset).prices
 
-        body: str = '\n'.join(prices_as_raw_lines)
+        self._current_page = pager.clamp(page)
+        start, end = pager.page_bounds(self._current_page)
 
-        return body
+        yield f'Page {self._current_page} of {pager.page_count}'
 
-    def _display_most_expensive_country(self) -> str:
+        for index in range(start, end):
+            yield from ReportFormatter.price_as_raw_lines(prices[index])
+
+    def _display_price_change_per_country(self, prices: list[PriceEntry]) -> Iterator[str]:
+        extremities: list[CountryExtremes] = self._get_extremities_per_country_use_case.execute(prices)
+        price_changes: list[PriceChange] = self._calculate_price_change_use_case.execute(extremities)
+
+        return ReportFormatter.price_changes_as_lines(price_changes)
+
+    def _display_raw_data(self, prices: list[PriceEntry]) -> Generator[str, None, None]:
+        if len(prices) == 0:
+            yield 'No prices found'
+            return
+
+        for p in prices:
+            yield from ReportFormatter.price_as_raw_lines(p)
+
+    def _display_average_price_per_country(self, prices: list[PriceEntry]) -> Generator[str, None, None]:
+        for p in self._average_prices_per_country(prices):
+            yield from ReportFormatter.average_price_as_raw_lines(p)
+
+    def _display_most_expensive_country(self, prices: list[PriceEntry]) -> Iterator[str]:
         most_expensive_country_option: Option[SingleCountryPrice] = \
-            self._most_expensive_country_use_case.execute(self._average_prices_per_country)
+            self._most_expensive_country_use_case.execute(self._average_prices_per_country(prices))
 
         if most_expensive_country_option.is_empty():
-            return 'Unable to calculate most expensive country'
+            return iter(['Unable to calculate most expensive country'])
 
         some_most_expensive_country: Some[SingleCountryPrice] = typing.cast(Some, most_expensive_country_option)
 
-        lines: list[str] = list(self._single_country_price_as_raw_lines(some_most_expensive_country.value))
+        return ReportFormatter.single_country_price_as_raw_lines(some_most_expensive_country.value)
 
-        return '\n'.join(lines)
-
-    def _display_cheapest_country(self):
+    def _display_cheapest_country(self, prices: list[PriceEntry]) -> Iterator[str]:
         cheapest_country_option: Option[SingleCountryPrice] = \
-            self._cheapest_country_use_case.execute(self._average_prices_per_country)
+            self._cheapest_country_use_case.execute(self._average_prices_per_country(prices))
 
         if cheapest_country_option.is_empty():
-            return 'Unable to calculate cheapest country'
+            return iter(['Unable to calculate cheapest country'])
 
         some_cheapest_country: Some[SingleCountryPrice] = typing.cast(Some, cheapest_country_option)
-        lines: list[str] = list(self._single_country_price_as_raw_lines(some_cheapest_country.value))
-
-        return '\n'.join(lines)
 
-    def _price_as_raw_lines(self, price: PriceEntry) -> Generator[str, None, None]:
-        yield '-' * 150
-        yield self._display_country_name(price.country_name)
-        yield 'Price in USD: ' + self._float_as_str(price.price.amount_in_dollars.value)
-        yield 'Amount in original currency: {0} {1}'.format(
-            price.price.original_currency.value,
-            self._float_as_str(price.price.amount_in_original_currency.value)
-        )
-        yield 'USD exchange rate: ' + self._float_as_str(price.price.dollar_exchange_rate.value)
-        yield 'Date: ' + self._date_as_str(price.date)
-
-    def _average_price_as_raw_lines(self, price: AveragePriceEntry) -> Generator[str, None, None]:
-        yield '-' * 150
-        yield self._display_country_name(price.country)
-        yield 'Average price in USD: ' + self._float_as_str(price.price.value)
-
-    def _single_country_price_as_raw_lines(self, value: SingleCountryPrice) -> Generator[str, None, None]:
-        yield '-' * 150
-        yield self._display_country_name(value.country_name)
-        yield 'Average price in USD: ' + self._float_as_str(value.price.value)
-
-    def _price_changes_as_lines(self, price_changes: list[PriceChange]) -> Generator[str, None, None]:
-        for p in price_changes:
-            yield '-' * 150
-            yield self._display_country_name(p.country)
-            yield 'Price ' + f'{"decreased" if p.percentage.is_negative else "increased"} by ' \
-                             f'{p.percentage.value:.2f}% since first measurement'
+        return ReportFormatter.single_country_price_as_raw_lines(some_cheapest_country.value)
 
     @staticmethod
     def validate_input(result: str) -> bool:
-        return not result.isdigit() or int(result) < 0 or int(result) > 6
+        return not result.isdigit() or int(result) < 0 or int(result) > 8
 
     @staticmethod
     def _options_as_body() -> str:
@@ -204,18 +271,9 @@ class MainMenuController:
                 '3 - Get most expensive country on average',
                 '4 - Get cheapest country on average',
                 '5 - Calculate price change per country',
+                '6 - Browse raw data',
+                '7 - Reload data',
+                '8 - Display full report',
                 '0 - Exit',
             ]
         )
-
-    @staticmethod
-    def _float_as_str(value: float) -> str:
-        return f'{round(value, 2):.2f}'
-
-    @staticmethod
-    def _date_as_str(date: datetime.date) -> str:
-        return date.strftime('%Y.%m.%d')
-
-    @staticmethod
-    def _display_country_name(name: CountryName) -> str:
-        return 'Country: ' + name.value
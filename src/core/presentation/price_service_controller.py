@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import json
+import math
+import typing
+from collections.abc import Callable
+
+from src.core.presentation.export_schema import AVERAGE_PRICE_ENTRY_SCHEMA, PRICE_CHANGE_SCHEMA, PRICE_ENTRY_SCHEMA, \
+    PRICE_SUMMARY_SCHEMA, SINGLE_COUNTRY_PRICE_SCHEMA, ExportSchema
+from src.core.presentation.http_server import HttpRequest, HttpResponse
+from src.core.presentation.query_parameters import InvalidQueryParameter, QueryParameters
+from src.core.presentation.rendered_report_cache import RenderedReportCache, ReportCacheKey, ReportCacheStatistics
+from src.core.presentation.report_name import ReportName
+from src.core.utils.option import Option, Some
+from src.core.utils.result import Ok, Result
+from src.features.price_loading.domain.price_dataset_store import PriceDatasetStore
+from src.features.price_loading.entities.price_dataset import PriceDataset
+from src.features.price_loading.entities.price_entry import PriceEntry
+from src.features.statistics.domain.entities.average_price_entry import AveragePriceEntry
+from src.features.statistics.domain.entities.full_report import FullReport
+from src.features.statistics.domain.entities.single_country_price import SingleCountryPrice
+from src.features.statistics.domain.use_cases.build_full_report_use_case import BuildFullReportUseCase
+from src.features.statistics.domain.use_cases.calculate_average_price_per_country_use_case import \
+    CalculateAveragePricePerCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_cheapest_country_use_case import CalculateCheapestCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_most_expensive_country_use_case import \
+    CalculateMostExpensiveCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_price_change_use_case import CalculatePriceChangeUseCase
+from src.features.statistics.domain.use_cases.get_extremities_per_country_use_case import \
+    GetExtremitiesPerCountryUseCase
+
+_DEFAULT_PAGE_SIZE: int = 100
+_MAX_PAGE_SIZE: int = 1000
+_RAW_DATA_FILTERS: tuple[str, ...] = ('country', 'currency', 'from', 'to', 'page', 'page_size')
+
+
+class PriceServiceController:
+    """Serves every report at ``/<report name>``, caching bodies per report, query and dataset version."""
+    _price_dataset_store: PriceDatasetStore
+    _average_price_per_country_use_case: CalculateAveragePricePerCountryUseCase
+    _most_expensive_country_use_case: CalculateMostExpensiveCountryUseCase
+    _cheapest_country_use_case: CalculateCheapestCountryUseCase
+    _get_extremities_per_country_use_case: GetExtremitiesPerCountryUseCase
+    _calculate_price_change_use_case: CalculatePriceChangeUseCase
+    _build_full_report_use_case: BuildFullReportUseCase
+    _rendered_report_cache: RenderedReportCache
+
+    def __init__(
+        self,
+        price_dataset_store: PriceDatasetStore,
+        calculate_average_price_per_country_use_case: CalculateAveragePricePerCountryUseCase,
+        calculate_most_expensive_country_use_case: CalculateMostExpensiveCountryUseCase,
+        calculate_cheapest_country_use_case: CalculateCheapestCountryUseCase,
+        get_extremities_per_country_use_case: GetExtremitiesPerCountryUseCase,
+        calculate_price_change_use_case: CalculatePriceChangeUseCase,
+        build_full_report_use_case: BuildFullReportUseCase,
+        rendered_report_cache: RenderedReportCache,
+    ) -> None:
+        self._price_dataset_store = price_dataset_store
+        self._average_price_per_country_use_case = calculate_average_price_per_country_use_case
+        self._most_expensive_country_use_case = calculate_most_expensive_country_use_case
+        self._cheapest_country_use_case = calculate_cheapest_country_use_case
+        self._get_extremities_per_country_use_case = get_extremities_per_country_use_case
+        self._calculate_price_change_use_case = calculate_price_change_use_case
+        self._build_full_report_use_case = build_full_report_use_case
+        self._rendered_report_cache = rendered_report_cache
+
+    async def handle(self, request: HttpRequest) -> HttpResponse:
+        path: str = request.path.rstrip('/')
+
+        if path == '/status':
+            return await self._status()
+
+        try:
+            report: ReportName = ReportName(path.lstrip('/'))
+        except ValueError:
+            return HttpResponse.error(404, f'Unknown path {request.path}')
+
+        dataset: PriceDataset = await self._price_dataset_store.get()
+
+        try:
+            render: Callable[[], typing.Any] = self._renderer(report, dataset.prices, request.query)
+        except InvalidQueryParameter as invalid_parameter:
+            return HttpResponse.error(400, invalid_parameter.details)
+
+        key: ReportCacheKey = ReportCacheKey(
+            report=report,
+            dataset_version=dataset.version,
+            parameters=tuple(sorted(request.query.items())),
+        )
+        body: str = ''.join(
+            self._rendered_report_cache.lines(
+                key,
+                lambda: [json.dumps({'dataset_version': dataset.version} | render())],
+            )
+        )
+
+        return HttpResponse(status=200, body=body.encode('utf-8'))
+
+    async def _status(self) -> HttpResponse:
+        dataset: PriceDataset = await self._price_dataset_store.get()
+        cache_statistics: ReportCacheStatistics = self._rendered_report_cache.statistics
+
+        return HttpResponse.json(
+            {
+                'dataset_version': dataset.version,
+                'prices': len(dataset.prices),
+                'reloading': self._price_dataset_store.is_reloading,
+                'report_cache': dataclasses.asdict(cache_statistics) | {'hit_rate': cache_statistics.hit_rate},
+            }
+        )
+
+    def _renderer(
+        self,
+        report: ReportName,
+        prices: list[PriceEntry],
+        query: dict[str, str],
+    ) -> Callable[[], dict[str, typing.Any]]:
+        """Validates the query eagerly and returns the deferred computation of the response payload."""
+        if report != ReportName.RAW_DATA and query:
+            raise InvalidQueryParameter(f'{report.value} takes no query parameters')
+
+        match report:
+            case ReportName.RAW_DATA:
+                return self._raw_data_renderer(prices, query)
+            case ReportName.AVERAGE_PRICE_PER_COUNTRY:
+                return lambda: self._items(AVERAGE_PRICE_ENTRY_SCHEMA, self._average_prices_per_country(prices))
+            case ReportName.MOST_EXPENSIVE_COUNTRY:
+                return lambda: self._item(
+                    self._most_expensive_country_use_case.execute(self._average_prices_per_country(prices))
+                )
+            case ReportName.CHEAPEST_COUNTRY:
+                return lambda: self._item(
+                    self._cheapest_country_use_case.execute(self._average_prices_per_country(prices))
+                )
+            case ReportName.PRICE_CHANGE_PER_COUNTRY:
+                return lambda: self._items(
+                    PRICE_CHANGE_SCHEMA,
+                    self._calculate_price_change_use_case.execute(
+                        self._get_extremities_per_country_use_case.execute(prices)
+                    ),
+                )
+            case ReportName.FULL_REPORT:
+                return lambda: self._full_report(self._build_full_report_use_case.execute(prices))
+
+    def _raw_data_renderer(
+        self,
+        prices: list[PriceEntry],
+        query: dict[str, str],
+    ) -> Callable[[], dict[str, typing.Any]]:
+        parameters: QueryParameters = QueryParameters(query)
+        parameters.accept_only(_RAW_DATA_FILTERS)
+
+        country_text: str | None = parameters.text('country')
+        currency_text: str | None = parameters.text('currency')
+        country: str | None = None if country_text is None else country_text.casefold()
+        currency: str | None = None if currency_text is None else currency_text.upper()
+        start: datetime.date | None = parameters.date('from')
+        end: datetime.date | None = parameters.date('to')
+        page: int = parameters.integer('page', 1, 1)
+        page_size: int = parameters.integer('page_size', _DEFAULT_PAGE_SIZE, 1, _MAX_PAGE_SIZE)
+
+        def render() -> dict[str, typing.Any]:
+            matching: list[PriceEntry] = [
+                p for p in prices
+                if (country is None or p.country_name.value.casefold() == country)
+                and (currency is None or p.price.original_currency.value == currency)
+                and (start is None or p.date >= start)
+                and (end is None or p.date <= end)
+            ]
+            offset: int = (page - 1) * page_size
+
+            return {
+                'page': page,
+                'page_size': page_size,
+                'pages': max(1, math.ceil(len(matching) / page_size)),
+                'total': len(matching),
+                'items': [PRICE_ENTRY_SCHEMA.as_record(p) for p in matching[offset:offset + page_size]],
+            }
+
+        return render
+
+    def _average_prices_per_country(self, prices: list[PriceEntry]) -> list[AveragePriceEntry]:
+        result: Result = self._average_price_per_country_use_case.execute(prices)
+
+        return typing.cast(Ok, result).value if result.is_ok() else []
+
+    def _full_report(self, report: FullReport) -> dict[str, typing.Any]:
+        return {
+            'summary': PRICE_SUMMARY_SCHEMA.as_record(report.summary),
+            'average_price_per_country': self._items(AVERAGE_PRICE_ENTRY_SCHEMA, report.average_prices)['items'],
+            'most_expensive_country': self._item(report.most_expensive_country)['item'],
+            'cheapest_country': self._item(report.cheapest_country)['item'],
+            'price_change_per_country': self._items(PRICE_CHANGE_SCHEMA, report.price_changes)['items'],
+        }
+
+    @staticmethod
+    def _items(schema: ExportSchema, entries: list[typing.Any]) -> dict[str, typing.Any]:
+        return {'items': [schema.as_record(e) for e in entries]}
+
+    @staticmethod
+    def _item(option: Option[SingleCountryPrice]) -> dict[str, typing.Any]:
+        if option.is_empty():
+            return {'item': None}
+
+        return {'item': SINGLE_COUNTRY_PRICE_SCHEMA.as_record(typing.cast(Some, option).value)}
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import datetime
+import enum
+import typing
+from collections.abc import Collection
+
+_EnumT = typing.TypeVar('_EnumT', bound=enum.Enum)
+
+
+class QueryParameters:
+    """Typed access to the query parameters of a request, raising ``InvalidQueryParameter`` on bad values."""
+    _values: dict[str, str]
+
+    def __init__(self, values: dict[str, str]) -> None:
+        self._values = values
+
+    def accept_only(self, names: Collection[str]) -> None:
+        unknown: list[str] = sorted(set(self._values) - set(names))
+
+        if unknown:
+            raise InvalidQueryParameter(f'Unknown query parameter {unknown[0]}')
+
+    def text(self, name: str) -> str | None:
+        value: str | None = self._values.get(name)
+
+        return None if value is None else value.strip()
+
+    def required_text(self, name: str) -> str:
+        value: str | None = self.text(name)
+
+        if not value:
+            raise InvalidQueryParameter(f'{name} is required')
+
+        return value
+
+    def required_date(self, name: str) -> datetime.date:
+        value: datetime.date | None = self.date(name)
+
+        if value is None:
+            raise InvalidQueryParameter(f'{name} is required')
+
+        return value
+
+    def date(self, name: str) -> datetime.date | None:
+        if name not in self._values:
+            return None
+
+        try:
+            return datetime.date.fromisoformat(self._values[name])
+        except ValueError as error:
+            raise InvalidQueryParameter(f'{name} must be a date formatted as YYYY-MM-DD') from error
+
+    def integer(self, name: str, default: int, minimum: int, maximum: int | None = None) -> int:
+        if name not in self._values:
+            return default
+
+        value: str = self._values[name]
+
+        if not value.isdigit() or int(value) < minimum or (maximum is not None and int(value) > maximum):
+            upper_bound: str = '' if maximum is None else f' and at most {maximum}'
+
+            raise InvalidQueryParameter(f'{name} must be an integer of at least {minimum}{upper_bound}')
+
+        return int(value)
+
+    def decimal(self, name: str, default: float, minimum: float) -> float:
+        if name not in self._values:
+            return default
+
+        try:
+            value: float = float(self._values[name])
+        except ValueError as error:
+            raise InvalidQueryParameter(f'{name} must be a number') from error
+
+        if not value >= minimum:
+            raise InvalidQueryParameter(f'{name} must be at least {minimum}')
+
+        return value
+
+    def choice(self, name: str, choices: type[_EnumT], default: _EnumT) -> _EnumT:
+        if name not in self._values:
+            return default
+
+        try:
+            return choices(self._values[name].strip().casefold())
+        except ValueError as error:
+            options: str = ', '.join(str(c.value) for c in choices)
+
+            raise InvalidQueryParameter(f'{name} must be one of {options}') from error
+
+    def choices(self, name: str, choices: type[_EnumT], default: Collection[_EnumT]) -> tuple[_EnumT, ...]:
+        """Comma separated choices, in the order given and without repetitions."""
+        if name not in self._values:
+            return tuple(default)
+
+        values: list[_EnumT] = []
+
+        for value in self._values[name].split(','):
+            try:
+                choice: _EnumT = choices(value.strip().casefold())
+            except ValueError as error:
+                options: str = ', '.join(str(c.value) for c in choices)
+
+                raise InvalidQueryParameter(f'{name} must be a comma separated list of {options}') from error
+
+            if choice not in values:
+                values.append(choice)
+
+        return tuple(values)
+
+    def decimals(self, name: str, default: Collection[float], minimum: float, maximum: float) -> tuple[float, ...]:
+        """Comma separated numbers, in the order given and without repetitions."""
+        if name not in self._values:
+            return tuple(default)
+
+        values: list[float] = []
+
+        for text in self._values[name].split(','):
+            try:
+                value: float = float(text)
+            except ValueError as error:
+                raise InvalidQueryParameter(f'{name} must be a comma separated list of numbers') from error
+
+            if not minimum <= value <= maximum:
+                raise InvalidQueryParameter(f'{name} must be between {minimum} and {maximum}')
+
+            if value not in values:
+                values.append(value)
+
+        return tuple(values)
+
+    def flag(self, name: str) -> bool:
+        value: str = self._values.get(name, 'false').strip().casefold()
+
+        if value not in ('true', 'false', '1', '0'):
+            raise InvalidQueryParameter(f'{name} must be true or false')
+
+        return value in ('true', '1')
+
+
+class InvalidQueryParameter(Exception):
+    details: str
+
+    def __init__(self, details: str) -> None:
+        self.details = details
+        super().__init__()
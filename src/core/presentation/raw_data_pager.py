@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from src.core.utils.option import Option
+from src.features.price_loading.entities.price_entry import PriceEntry
+
+
+class RawDataPager:
+    """Page and country offsets over a loaded price list, computed once so paging never reads other rows."""
+    _page_offsets: list[int]
+    _country_offsets: dict[str, int]
+    _size: int
+    _page_size: int
+
+    def __init__(self, prices: Sequence[PriceEntry], page_size: int) -> None:
+        self._size = len(prices)
+        self._page_size = max(1, page_size)
+        self._page_offsets = list(range(0, self._size, self._page_size)) or [0]
+        self._country_offsets = {}
+
+        for offset, price in enumerate(prices):
+            self._country_offsets.setdefault(price.country_name.value.casefold(), offset)
+
+    @property
+    def page_count(self) -> int:
+        return len(self._page_offsets)
+
+    def clamp(self, page: int) -> int:
+        return min(max(page, 1), self.page_count)
+
+    def page_bounds(self, page: int) -> tuple[int, int]:
+        start: int = self._page_offsets[self.clamp(page) - 1]
+
+        return start, min(start + self._page_size, self._size)
+
+    def page_of_country(self, country_name: str) -> Option[int]:
+        offset: int | None = self._country_offsets.get(country_name.strip().casefold())
+
+        if offset is None:
+            return Option.empty()
+
+        return Option.some(offset // self._page_size + 1)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import collections
+import dataclasses
+from collections.abc import Callable, Generator, Iterable, Iterator
+
+from src.core.presentation.report_name import ReportName
+
+_DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ReportCacheKey:
+    report: ReportName
+    dataset_version: int
+    parameters: tuple[tuple[str, str], ...] = ()
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ReportCacheStatistics:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        requests: int = self.hits + self.misses
+
+        return self.hits / requests if requests else 0.0
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _CachedReport:
+    lines: tuple[str, ...]
+    size_bytes: int
+
+
+class RenderedReportCache:
+    """LRU cache of rendered report lines, storing a report only once fully consumed and within the byte cap."""
+    _max_bytes: int
+    _entries: collections.OrderedDict[ReportCacheKey, _CachedReport]
+    _size_bytes: int
+    _latest_dataset_version: int
+    _hits: int
+    _misses: int
+    _evictions: int
+
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES) -> None:
+        self._max_bytes = max(0, max_bytes)
+        self._entries = collections.OrderedDict()
+        self._size_bytes = 0
+        self._latest_dataset_version = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def from_megabytes(megabytes: float) -> RenderedReportCache:
+        return RenderedReportCache(max_bytes=int(megabytes * 1024 * 1024))
+
+    @property
+    def statistics(self) -> ReportCacheStatistics:
+        return ReportCacheStatistics(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            size_bytes=self._size_bytes,
+            max_bytes=self._max_bytes,
+        )
+
+    def lines(self, key: ReportCacheKey, render: Callable[[], Iterable[str]]) -> Iterator[str]:
+        """Returns the cached lines of ``key``, or renders them and caches them as they are consumed."""
+        if key.dataset_version > self._latest_dataset_version:
+            self.clear()
+            self._latest_dataset_version = key.dataset_version
+
+        cached: _CachedReport | None = self._entries.get(key)
+
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return iter(cached.lines)
+
+        self._misses += 1
+
+        if key.dataset_version < self._latest_dataset_version or self._max_bytes == 0:
+            return iter(render())
+
+        return self._render_and_store(key, render())
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size_bytes = 0
+
+    def _render_and_store(self, key: ReportCacheKey, lines: Iterable[str]) -> Generator[str, None, None]:
+        recorded: list[str] | None = []
+        size_bytes: int = 0
+
+        for line in lines:
+            if recorded is not None:
+                size_bytes += len(line.encode('utf-8'))
+
+                if size_bytes > self._max_bytes:
+                    recorded = None
+                else:
+                    recorded.append(line)
+
+            yield line
+
+        if recorded is not None and key.dataset_version == self._latest_dataset_version:
+            self._store(key, _CachedReport(lines=tuple(recorded), size_bytes=size_bytes))
+
+    def _store(self, key: ReportCacheKey, report: _CachedReport) -> None:
+        replaced: _CachedReport | None = self._entries.pop(key, None)
+
+        if replaced is not None:
+            self._size_bytes -= replaced.size_bytes
+
+        self._entries[key] = report
+        self._size_bytes += report.size_bytes
+
+        while self._size_bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size_bytes -= evicted.size_bytes
+            self._evictions += 1
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import csv
+import io
+import itertools
+import json
+import typing
+from collections.abc import Iterable, Iterator
+
+from src.core.presentation.export_schema import ExportSchema
+
+_ROWS_PER_WRITE: int = 4096
+
+
+class ReportExporter:
+    """Streams report entries as CSV, JSON Lines or a JSON array, one write per ``rows_per_write`` entries."""
+    _output: typing.TextIO
+    _rows_per_write: int
+
+    def __init__(self, output: typing.TextIO, rows_per_write: int = _ROWS_PER_WRITE) -> None:
+        self._output = output
+        self._rows_per_write = max(1, rows_per_write)
+
+    def write_csv(self, schema: ExportSchema, entries: Iterable[typing.Any]) -> int:
+        buffer: io.StringIO = io.StringIO()
+        writer: typing.Any = csv.writer(buffer, lineterminator='\n')
+        rows: int = 0
+
+        writer.writerow(schema.columns)
+
+        for batch in self._batches(entries):
+            writer.writerows(schema.as_row(e) for e in batch)
+            rows += len(batch)
+            self._output.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+
+        if rows == 0:
+            self._output.write(buffer.getvalue())
+
+        return rows
+
+    def write_json_lines(self, schema: ExportSchema, entries: Iterable[typing.Any], report: str | None = None) -> int:
+        """Writes one JSON object per line, led by a ``report`` field when a report name is given."""
+        prefix: dict[str, str] = {} if report is None else {'report': report}
+        rows: int = 0
+
+        for batch in self._batches(entries):
+            self._output.write(''.join(json.dumps(prefix | schema.as_record(e)) + '\n' for e in batch))
+            rows += len(batch)
+
+        return rows
+
+    def write_json_array(self, schema: ExportSchema, entries: Iterable[typing.Any]) -> int:
+        separator: str = ''
+        rows: int = 0
+
+        self._output.write('[')
+
+        for batch in self._batches(entries):
+            # A single dumps call per batch is markedly faster than one per record; only the brackets are dropped.
+            self._output.write(separator + json.dumps([schema.as_record(e) for e in batch])[1:-1])
+            separator = ','
+            rows += len(batch)
+
+        self._output.write(']')
+
+        return rows
+
+    def _batches(self, entries: Iterable[typing.Any]) -> Iterator[list[typing.Any]]:
+        iterator: Iterator[typing.Any] = iter(entries)
+
+        while batch := list(itertools.islice(iterator, self._rows_per_write)):
+            yield batch
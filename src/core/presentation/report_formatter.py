@@ -0,0 +1,96 @@
+import datetime
+import typing
+from collections.abc import Generator, Iterable
+
+from src.core.utils.option import Option, Some
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.average_price_entry import AveragePriceEntry
+from src.features.statistics.domain.entities.full_report import FullReport, PriceSummary
+from src.features.statistics.domain.entities.price_change import PriceChange
+from src.features.statistics.domain.entities.single_country_price import SingleCountryPrice
+
+
+class ReportFormatter:
+
+    @staticmethod
+    def price_as_raw_lines(price: PriceEntry) -> Generator[str, None, None]:
+        yield '-' * 150
+        yield ReportFormatter._display_country_name(price.country_name)
+        yield 'Price in USD: ' + ReportFormatter._float_as_str(price.price.amount_in_dollars.value)
+        yield 'Amount in original currency: {0} {1}'.format(
+            price.price.original_currency.value,
+            ReportFormatter._float_as_str(price.price.amount_in_original_currency.value)
+        )
+        yield 'USD exchange rate: ' + ReportFormatter._float_as_str(price.price.dollar_exchange_rate.value)
+        yield 'Date: ' + ReportFormatter._date_as_str(price.date)
+
+    @staticmethod
+    def average_price_as_raw_lines(price: AveragePriceEntry) -> Generator[str, None, None]:
+        yield '-' * 150
+        yield ReportFormatter._display_country_name(price.country)
+        yield 'Average price in USD: ' + ReportFormatter._float_as_str(price.price.value)
+
+    @staticmethod
+    def single_country_price_as_raw_lines(value: SingleCountryPrice) -> Generator[str, None, None]:
+        yield '-' * 150
+        yield ReportFormatter._display_country_name(value.country_name)
+        yield 'Average price in USD: ' + ReportFormatter._float_as_str(value.price.value)
+
+    @staticmethod
+    def price_changes_as_lines(price_changes: Iterable[PriceChange]) -> Generator[str, None, None]:
+        for p in price_changes:
+            yield '-' * 150
+            yield ReportFormatter._display_country_name(p.country)
+            yield 'Price ' + f'{"decreased" if p.percentage.is_negative else "increased"} by ' \
+                             f'{p.percentage.value:.2f}% since first measurement'
+
+    @staticmethod
+    def price_summary_as_lines(summary: PriceSummary) -> Generator[str, None, None]:
+        yield '-' * 150
+        yield f'Prices: {summary.prices}'
+        yield f'Countries: {summary.countries}'
+
+        if summary.first_date is not None and summary.last_date is not None:
+            yield 'Dates: {0} to {1}'.format(
+                ReportFormatter._date_as_str(summary.first_date),
+                ReportFormatter._date_as_str(summary.last_date),
+            )
+
+    @staticmethod
+    def full_report_as_lines(report: FullReport) -> Generator[str, None, None]:
+        yield ReportFormatter.section_header('Raw data summary')
+        yield from ReportFormatter.price_summary_as_lines(report.summary)
+        yield ReportFormatter.section_header('Average price per country')
+
+        for average_price in report.average_prices:
+            yield from ReportFormatter.average_price_as_raw_lines(average_price)
+
+        yield ReportFormatter.section_header('Most expensive country on average')
+        yield from ReportFormatter._optional_country_as_lines(report.most_expensive_country)
+        yield ReportFormatter.section_header('Cheapest country on average')
+        yield from ReportFormatter._optional_country_as_lines(report.cheapest_country)
+        yield ReportFormatter.section_header('Price change per country')
+        yield from ReportFormatter.price_changes_as_lines(report.price_changes)
+
+    @staticmethod
+    def section_header(title: str) -> str:
+        return f' {title} '.center(150, '-')
+
+    @staticmethod
+    def _optional_country_as_lines(country: Option[SingleCountryPrice]) -> Iterable[str]:
+        if country.is_empty():
+            return ['No prices found']
+
+        return ReportFormatter.single_country_price_as_raw_lines(typing.cast(Some, country).value)
+
+    @staticmethod
+    def _float_as_str(value: float) -> str:
+        return f'{round(value, 2):.2f}'
+
+    @staticmethod
+    def _date_as_str(date: datetime.date) -> str:
+        return date.strftime('%Y.%m.%d')
+
+    @staticmethod
+    def _display_country_name(name: CountryName) -> str:
+        return 'Country: ' + name.value
@@ -0,0 +1,10 @@
+import enum
+
+
+class ReportName(str, enum.Enum):
+    RAW_DATA = 'raw-data'
+    AVERAGE_PRICE_PER_COUNTRY = 'average-price-per-country'
+    MOST_EXPENSIVE_COUNTRY = 'most-expensive-country'
+    CHEAPEST_COUNTRY = 'cheapest-country'
+    PRICE_CHANGE_PER_COUNTRY = 'price-change-per-country'
+    FULL_REPORT = 'full-report'
@@ -8,3 +8,4 @@ class MainMenuViewModel:
     title: str
     body: str
     option_input_message: str
+    browse_input_message: str
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import math
+import random
+from collections.abc import Iterable
+
+_CAPACITY_DECAY: float = 2 / 3
+
+
+class KllSketch:
+    """Mergeable KLL quantile sketch (Karnin, Lang and Liberty), ranks within about ``1.7 / k`` in ``3 * k`` values."""
+    _k: int
+    _levels: list[list[float]]
+    _size: int
+    _count: int
+    _random: random.Random
+
+    def __init__(self, k: int = 200, seed: int | None = 0) -> None:
+        self._k = max(8, k)
+        self._levels = [[]]
+        self._size = 0
+        self._count = 0
+        self._random = random.Random(seed)
+
+    @property
+    def count(self) -> int:
+        """Number of values added to the sketch."""
+        return self._count
+
+    @property
+    def retained(self) -> int:
+        """Number of values the sketch holds."""
+        return self._size
+
+    def update(self, value: float) -> None:
+        self._levels[0].append(value)
+        self._size += 1
+        self._count += 1
+
+        if self._size >= self._max_size():
+            self._compress()
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.update(value)
+
+    def merge(self, other: KllSketch) -> None:
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+
+        for level, values in enumerate(other._levels):
+            self._levels[level].extend(values)
+
+        self._size += other._size
+        self._count += other._count
+
+        while self._size >= self._max_size():
+            self._compress()
+
+    def quantile(self, probability: float) -> float:
+        """Value of approximate rank ``probability * count``, ``NaN`` for an empty sketch."""
+        if not self._count:
+            return math.nan
+
+        weighted: list[tuple[float, int]] = sorted(
+            (value, 1 << level) for level, values in enumerate(self._levels) for value in values
+        )
+        target: float = probability * self._count
+        cumulative_weight: int = 0
+
+        for value, weight in weighted:
+            cumulative_weight += weight
+
+            if cumulative_weight >= target:
+                return value
+
+        return weighted[-1][0]
+
+    def _capacity(self, level: int) -> int:
+        return max(2, math.ceil(self._k * _CAPACITY_DECAY ** (len(self._levels) - level - 1)))
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(level) for level in range(len(self._levels)))
+
+    def _compress(self) -> None:
+        for level, values in enumerate(self._levels):
+            if len(values) < self._capacity(level):
+                continue
+
+            if level + 1 == len(self._levels):
+                self._levels.append([])
+
+            values.sort()
+            # An odd value out stays at its level, so that the weights always add up to the count.
+            kept: list[float] = [values.pop()] if len(values) % 2 else []
+            promoted: list[float] = values[self._random.randrange(2)::2]
+            self._levels[level + 1].extend(promoted)
+            self._levels[level] = kept
+            self._size -= len(values) - len(promoted)
+            return
@@ -7,9 +7,11 @@ _T = typing.TypeVar('_T')
 
 
 class Option(typing.Generic[_T], abc.ABC):
+    __slots__ = ()
+
     @staticmethod
     def some(value: _T) -> Some[_T]:
-        return Some[_T](value)
+        return Some(value)
 
     @staticmethod
     def empty() -> Empty[_T]:
@@ -25,6 +27,7 @@ class Option(typing.Generic[_T], abc.ABC):
 
 
 class Some(Option[_T]):
+    __slots__ = ('_value',)
     _value: _T
 
     def __init__(self, value: _T) -> None:
@@ -42,6 +45,15 @@ class Some(Option[_T]):
 
 
 class Empty(Option[_T]):
+    """Carries no state, so every ``Empty()`` is the same shared instance."""
+    __slots__ = ()
+    _instance: typing.ClassVar[Empty[typing.Any] | None] = None
+
+    def __new__(cls) -> Empty[_T]:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+
+        return cls._instance
 
     def is_some(self) -> bool:
         return False  # pragma: nocover
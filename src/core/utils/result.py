@@ -2,20 +2,38 @@ from __future__ import annotations
 
 import abc
 import typing
+from collections.abc import Iterable
 
 OkT = typing.TypeVar('OkT')
 ErrT = typing.TypeVar('ErrT')
 
 
 class Result(typing.Generic[OkT, ErrT], abc.ABC):
+    __slots__ = ()
 
     @staticmethod
     def ok(ok_value: OkT) -> Ok[OkT, ErrT]:
-        return Ok[OkT, ErrT](ok_value)
+        return Ok(ok_value)
 
     @staticmethod
     def error(err_value: ErrT) -> Error[OkT, ErrT]:
-        return Error[OkT, ErrT](err_value)
+        return Error(err_value)
+
+    @staticmethod
+    def partition(results: Iterable[Result[OkT, ErrT]]) -> tuple[list[OkT], list[ErrT]]:
+        """Splits results into their ok values and their error values in a single pass, keeping order."""
+        values: list[OkT] = []
+        errors: list[ErrT] = []
+        append_value: typing.Callable[[OkT], None] = values.append
+        append_error: typing.Callable[[ErrT], None] = errors.append
+
+        for result in results:
+            if isinstance(result, Ok):
+                append_value(result.value)
+            else:
+                append_error(typing.cast(Error, result).value)
+
+        return values, errors
 
     @abc.abstractmethod
     def is_ok(self) -> bool:
@@ -27,6 +45,7 @@ class Result(typing.Generic[OkT, ErrT], abc.ABC):
 
 
 class Ok(Result, typing.Generic[OkT, ErrT]):
+    __slots__ = ('_value',)
     _value: OkT
 
     def __init__(self, value: OkT) -> None:
@@ -44,6 +63,7 @@ class Ok(Result, typing.Generic[OkT, ErrT]):
 
 
 class Error(Result, typing.Generic[OkT, ErrT]):
+    __slots__ = ('_value',)
     _value: ErrT
 
     def __init__(self, value: ErrT) -> None:
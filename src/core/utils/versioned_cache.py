@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import collections
+import typing
+from collections.abc import Callable, Hashable
+
+_KeyT = typing.TypeVar('_KeyT', bound=Hashable)
+_ValueT = typing.TypeVar('_ValueT')
+
+
+class VersionedCache(typing.Generic[_KeyT, _ValueT]):
+    """Keeps the ``max_entries`` most recently used values of the latest dataset version only."""
+    _max_entries: int
+    _version: int | None
+    _values: collections.OrderedDict[_KeyT, _ValueT]
+    _hits: int
+    _misses: int
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self._max_entries = max(1, max_entries)
+        self._version = None
+        self._values = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, version: int, key: _KeyT, build: Callable[[], _ValueT]) -> _ValueT:
+        if version != self._version:
+            self._values.clear()
+            self._version = version
+
+        if key in self._values:
+            self._values.move_to_end(key)
+            self._hits += 1
+            return self._values[key]
+
+        self._misses += 1
+        value: _ValueT = build()
+        self._values[key] = value
+
+        if len(self._values) > self._max_entries:
+            self._values.popitem(last=False)
+
+        return value
@@ -14,6 +14,8 @@ from src.features.price_loading.data.data_sources.utils.csv_file_reader import (
     CsvFileReaderNonExistingFileFailure, CsvFileReaderNotAFileFailure,
 )
 
+_FileT = typing.TypeVar('_FileT')
+
 
 class CsvDataSource:
     _csv_file_path: pathlib.Path
@@ -34,11 +36,34 @@ class CsvDataSource:
         except _ReaderGenericFailure:
             return Result.error(CsvDataSourceDependenciesFailure(reason='Unexpected csv file reader failure'))
 
+    async def load_chunks(
+        self,
+        rows_per_chunk: int,
+    ) -> Result[typing.Iterator[list[CsvPriceModel]], CsvDataSourceFailure]:
+        try:
+            file_chunks: typing.Iterator[CsvFileOutput] = await self._load_csv_file_chunks(rows_per_chunk)
+
+            return Result.ok(self._to_model_chunks(file_chunks))
+        except (_ReaderNotAFileFailure, _ReaderNonExistingFileFailure) as reader_file_failure:
+            return Result.error(CsvDataSourceDependenciesFailure(reason=reader_file_failure.details))
+        except _ReaderGenericFailure:
+            return Result.error(CsvDataSourceDependenciesFailure(reason='Unexpected csv file reader failure'))
+
     async def _load_csv_file(self) -> CsvFileOutput:
         file_result: Result[CsvFileOutput, CsvFileReaderFailure] = await self._csv_file_reader.read(self._csv_file_path)
 
+        return self._unwrap_file_result(file_result)
+
+    async def _load_csv_file_chunks(self, rows_per_chunk: int) -> typing.Iterator[CsvFileOutput]:
+        file_result: Result[typing.Iterator[CsvFileOutput], CsvFileReaderFailure] = \
+            await self._csv_file_reader.read_chunks(self._csv_file_path, rows_per_chunk)
+
+        return self._unwrap_file_result(file_result)
+
+    @staticmethod
+    def _unwrap_file_result(file_result: Result[_FileT, CsvFileReaderFailure]) -> _FileT:
         if file_result.is_err():
-            err_result: Error[CsvFileOutput, CsvFileReaderFailure] = typing.cast(Error, file_result)
+            err_result: Error[_FileT, CsvFileReaderFailure] = typing.cast(Error, file_result)
             failure: CsvFileReaderFailure = err_result.value
 
             if isinstance(failure, CsvFileReaderNotAFileFailure):
@@ -55,10 +80,18 @@ class CsvDataSource:
 
             raise _ReaderGenericFailure()
 
-        file_ok_result: Ok[CsvFileOutput, CsvFileReaderFailure] = typing.cast(Ok, file_result)
+        file_ok_result: Ok[_FileT, CsvFileReaderFailure] = typing.cast(Ok, file_result)
 
         return file_ok_result.value
 
+    def _to_model_chunks(self, file_chunks: typing.Iterator[CsvFileOutput]) -> typing.Iterator[list[CsvPriceModel]]:
+        for file_contents in file_chunks:
+            models: list[CsvPriceModel] = self._to_models(file_contents)
+            del file_contents
+
+            yield models
+            del models
+
     def _to_models(self, file_contents: CsvFileOutput) -> list[CsvPriceModel]:
         return [self._to_model(p) for p in file_contents.values()]
 
@@ -5,30 +5,65 @@ import dataclasses
 import pathlib
 import typing
 
-import pandas  # type: ignore
-
 from src.core.utils.result import Result
 
+if typing.TYPE_CHECKING:
+    import pandas  # type: ignore
+
 
 class CsvFileReader:
 
     @staticmethod
     async def read(path: pathlib.Path) -> Result[CsvFileOutput, CsvFileReaderFailure]:
-        is_not_a_file: bool = not path.is_file()
-        does_not_exist: bool = not path.exists()
-        has_file_error: bool = is_not_a_file or does_not_exist
+        file_failure: CsvFileReaderFailure | None = CsvFileReader._file_failure(path)
 
-        if has_file_error:
-            if is_not_a_file:
-                return Result.error(CsvFileReaderNotAFileFailure(details='Given file path is not a file'))
+        if file_failure is not None:
+            return Result.error(file_failure)
 
-            return Result.error(CsvFileReaderNonExistingFileFailure(details='Given file path does not exist'))
+        import pandas  # type: ignore  # pylint: disable=import-outside-toplevel
 
         pandas_data_frame: pandas.DataFrame = pandas.read_csv(path)
         output: CsvFileOutput = pandas_data_frame.to_dict(orient='index')
 
         return Result.ok(output)
 
+    @staticmethod
+    async def read_chunks(
+        path: pathlib.Path,
+        rows_per_chunk: int,
+    ) -> Result[typing.Iterator[CsvFileOutput], CsvFileReaderFailure]:
+        file_failure: CsvFileReaderFailure | None = CsvFileReader._file_failure(path)
+
+        if file_failure is not None:
+            return Result.error(file_failure)
+
+        return Result.ok(CsvFileReader._chunks(path, rows_per_chunk))
+
+    @staticmethod
+    def _chunks(path: pathlib.Path, rows_per_chunk: int) -> typing.Iterator[CsvFileOutput]:
+        import pandas  # type: ignore  # pylint: disable=import-outside-toplevel
+
+        with pandas.read_csv(path, chunksize=rows_per_chunk) as chunked_reader:
+            for pandas_data_frame in chunked_reader:
+                output: CsvFileOutput = pandas_data_frame.to_dict(orient='index')
+                del pandas_data_frame
+
+                yield output
+                del output
+
+    @staticmethod
+    def _file_failure(path: pathlib.Path) -> CsvFileReaderFailure | None:
+        is_not_a_file: bool = not path.is_file()
+        does_not_exist: bool = not path.exists()
+
+        if is_not_a_file:
+            return CsvFileReaderNotAFileFailure(details='Given file path is not a file')
+
+        if does_not_exist:
+            return CsvFileReaderNonExistingFileFailure(details='Given file path does not exist')
+
+        return None
+
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CsvFileReaderFailure(abc.ABC):
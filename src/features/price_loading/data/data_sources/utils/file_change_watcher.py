@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import pathlib
+import typing
+from collections.abc import Callable
+
+
+class FileChangeWatcher:
+    """Polls a file's modification time and size and calls ``on_change`` whenever either moves."""
+    _path: pathlib.Path
+    _interval_seconds: float
+    _on_change: Callable[[], typing.Any]
+    _task: asyncio.Task[None] | None
+
+    def __init__(self, path: pathlib.Path, interval_seconds: float, on_change: Callable[[], typing.Any]) -> None:
+        self._path = path
+        self._interval_seconds = interval_seconds
+        self._on_change = on_change
+        self._task = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._watch())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _watch(self) -> None:
+        last_signature: tuple[int, int] | None = self._signature()
+
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            signature: tuple[int, int] | None = self._signature()
+
+            if signature != last_signature:
+                last_signature = signature
+
+                if signature is not None:
+                    self._on_change()
+
+    def _signature(self) -> tuple[int, int] | None:
+        try:
+            stat_result: os.stat_result = self._path.stat()
+        except OSError:
+            return None
+
+        return stat_result.st_mtime_ns, stat_result.st_size
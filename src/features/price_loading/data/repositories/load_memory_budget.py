@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import dataclasses
+
+# The reader's dict rows, the models and the not yet released pandas chunk of a generated dataset peaked at
+# 300 to 900 bytes per row of a chunk above the final entities under tracemalloc, the most for the smallest
+# chunks. This leaves headroom over the worst of them; test_load_memory_budget.py checks the peak.
+_INTERMEDIATE_BYTES_PER_ROW: int = 1536
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class LoadMemoryBudget:
+    intermediate_bytes: int
+
+    @staticmethod
+    def from_megabytes(megabytes: float) -> LoadMemoryBudget:
+        return LoadMemoryBudget(intermediate_bytes=int(megabytes * 1024 * 1024))
+
+    @property
+    def rows_per_chunk(self) -> int:
+        return max(1, self.intermediate_bytes // _INTERMEDIATE_BYTES_PER_ROW)
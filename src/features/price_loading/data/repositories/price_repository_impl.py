@@ -7,7 +7,8 @@ from src.features.price_loading.data.data_sources.csv_data_source import (
     CsvDataSourceFailure,
 )
 from src.features.price_loading.data.data_sources.models.csv_price_model import CsvPriceModel
-from src.features.price_loading.data.repositories.mappers.csv_price_mapper import CsvPriceMapper, CsvPriceMapperFailure
+from src.features.price_loading.data.repositories.load_memory_budget import LoadMemoryBudget
+from src.features.price_loading.data.repositories.mappers.csv_price_mapper import CsvPriceMapper
 from src.features.price_loading.entities.price_entry import PriceEntry
 from src.features.price_loading.repository.price_repository import (
     PriceRepository,
@@ -19,12 +20,22 @@ from src.features.price_loading.repository.price_repository import (
 class PriceRepositoryImpl(PriceRepository):
     _csv_data_source: CsvDataSource
     _csv_price_model_mapper: CsvPriceMapper
-
-    def __init__(self, csv_data_source: CsvDataSource, csv_price_model_mapper: CsvPriceMapper) -> None:
+    _memory_budget: LoadMemoryBudget | None
+
+    def __init__(
+        self,
+        csv_data_source: CsvDataSource,
+        csv_price_model_mapper: CsvPriceMapper,
+        memory_budget: LoadMemoryBudget | None = None,
+    ) -> None:
         self._csv_data_source = csv_data_source
         self._csv_price_model_mapper = csv_price_model_mapper
+        self._memory_budget = memory_budget
 
     async def fetch(self) -> Result[list[PriceEntry], PriceRepositoryFailure]:
+        if self._memory_budget is not None:
+            return await self._fetch_in_chunks(self._memory_budget)
+
         csv_models_result: Result[list[CsvPriceModel], CsvDataSourceFailure] = await self._load_models()
 
         if csv_models_result.is_err():
@@ -40,17 +51,41 @@ class PriceRepositoryImpl(PriceRepository):
 
         return Result.ok(entities)
 
+    async def _fetch_in_chunks(
+        self,
+        memory_budget: LoadMemoryBudget,
+    ) -> Result[list[PriceEntry], PriceRepositoryFailure]:
+        csv_chunks_result: Result[typing.Iterator[list[CsvPriceModel]], CsvDataSourceFailure] = \
+            await self._csv_data_source.load_chunks(memory_budget.rows_per_chunk)
+
+        if csv_chunks_result.is_err():
+            err_result: Error[typing.Iterator[list[CsvPriceModel]], CsvDataSourceFailure] = \
+                typing.cast(Error, csv_chunks_result)
+
+            return self._handle_failure(err_result.value)
+
+        csv_chunks_ok_result: Ok = typing.cast(Ok, csv_chunks_result)
+        model_chunks: typing.Iterator[list[CsvPriceModel]] = csv_chunks_ok_result.value
+        del csv_chunks_ok_result, csv_chunks_result
+
+        entities: list[PriceEntry] = []
+
+        for models in model_chunks:
+            entities.extend(self._to_entities(models))
+            del models
+
+        return Result.ok(entities)
+
     async def _load_models(self) -> Result[list[CsvPriceModel], CsvDataSourceFailure]:
         csv_models_result: Result[list[CsvPriceModel], CsvDataSourceFailure] = await self._csv_data_source.load()
 
         return csv_models_result
 
     def _to_entities(self, models: list[CsvPriceModel]) -> list[PriceEntry]:
-        entity_results: list[Result[PriceEntry, CsvPriceMapperFailure]] = [self._csv_price_model_mapper.map(m)
-                                                                           for m in models]
-        filtered_entities: list[PriceEntry] = [(typing.cast(Ok, e)).value for e in entity_results if e.is_ok()]
+        entities: list[PriceEntry]
+        entities, _ = Result.partition(self._csv_price_model_mapper.map(m) for m in models)
 
-        return filtered_entities
+        return entities
 
     @staticmethod
     def _handle_failure(failure: CsvDataSourceFailure) -> Error[list[PriceEntry], PriceRepositoryFailure]:
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from src.features.price_loading.domain.use_cases.load_prices_use_case import LoadPricesUseCase
+from src.features.price_loading.entities.price_dataset import PriceDataset
+from src.features.price_loading.entities.price_entry import PriceEntry
+
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
+
+class PriceDatasetStore:
+    """Owns the loaded prices and swaps in rebuilt ones, loaded on a worker thread, in a single assignment."""
+    _load_prices_use_case: LoadPricesUseCase
+    _current: PriceDataset | None
+    _load_task: asyncio.Task[PriceDataset] | None
+    _reload_requested: bool
+    _next_version: int
+
+    def __init__(self, load_prices_use_case: LoadPricesUseCase) -> None:
+        self._load_prices_use_case = load_prices_use_case
+        self._current = None
+        self._load_task = None
+        self._reload_requested = False
+        self._next_version = 1
+
+    @property
+    def is_reloading(self) -> bool:
+        return self._current is not None and self._load_task is not None and not self._load_task.done()
+
+    async def get(self) -> PriceDataset:
+        if self._current is not None:
+            return self._current
+
+        return await self.load()
+
+    def load(self) -> asyncio.Task[PriceDataset]:
+        """Starts the initial load unless one is already running, and returns the running load."""
+        if self._load_task is None or (self._current is None and self._load_task.done()):
+            self._load_task = self._start_rebuild()
+
+        return self._load_task
+
+    def reload(self) -> asyncio.Task[PriceDataset]:
+        """Rebuilds the dataset in the background, a reload requested meanwhile loads the file once more after it."""
+        if self._load_task is not None and not self._load_task.done():
+            self._reload_requested = True
+            return self._load_task
+
+        self._load_task = self._start_rebuild()
+
+        return self._load_task
+
+    def _start_rebuild(self) -> asyncio.Task[PriceDataset]:
+        task: asyncio.Task[PriceDataset] = asyncio.create_task(self._rebuild())
+        task.add_done_callback(_log_failure)
+
+        return task
+
+    async def _rebuild(self) -> PriceDataset:
+        while True:
+            self._reload_requested = False
+            prices: list[PriceEntry] | None = await self._load_prices()
+
+            if self._current is None or prices:
+                self._current = PriceDataset(version=self._next_version, prices=prices or [])
+                self._next_version += 1
+
+            if not self._reload_requested:
+                return self._current
+
+    async def _load_prices(self) -> list[PriceEntry] | None:
+        """The loaded prices, or ``None`` when a reload failed and the current dataset should be kept."""
+        if self._current is None:
+            return await self._load_prices_in_worker_thread()
+
+        try:
+            prices: list[PriceEntry] = await self._load_prices_in_worker_thread()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception('Reloading the prices failed, keeping dataset version %d', self._current.version)
+            return None
+
+        if not prices:
+            _LOGGER.warning('Reloading the prices found none, keeping dataset version %d', self._current.version)
+
+        return prices
+
+    async def _load_prices_in_worker_thread(self) -> list[PriceEntry]:
+        # Reading and mapping the file is synchronous, on the event loop it would stall every reader
+        return await asyncio.to_thread(self._run_load_prices_use_case)
+
+    def _run_load_prices_use_case(self) -> list[PriceEntry]:
+        return asyncio.run(self._load_prices_use_case.execute())
+
+
+def _log_failure(task: asyncio.Task[PriceDataset]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        _LOGGER.error('Loading the prices failed', exc_info=task.exception())
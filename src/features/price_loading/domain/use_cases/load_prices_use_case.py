@@ -4,9 +4,13 @@ import abc
 import dataclasses
 import typing
 
-from src.core.utils.result import Ok, Result
+from src.core.utils.result import Error, Ok, Result
 from src.features.price_loading.entities.price_entry import PriceEntry
-from src.features.price_loading.repository.price_repository import PriceRepository, PriceRepositoryFailure
+from src.features.price_loading.repository.price_repository import (
+    PriceRepository,
+    PriceRepositoryDependenciesFailure,
+    PriceRepositoryFailure,
+)
 
 
 class LoadPricesUseCase:
@@ -16,14 +20,29 @@ class LoadPricesUseCase:
         self._price_repository = price_repository
 
     async def execute(self) -> list[PriceEntry]:
-        prices_result: Result[list[PriceEntry], PriceRepositoryFailure] = await self._price_repository.fetch()
+        prices_result: Result[list[PriceEntry], LoadPricesUseCaseFailure] = await self.try_execute()
 
         if prices_result.is_err():
             return []
 
-        prices_ok_result: Ok[list[PriceEntry], PriceRepositoryFailure] = typing.cast(Ok, prices_result)
+        prices_ok_result: Ok[list[PriceEntry], LoadPricesUseCaseFailure] = typing.cast(Ok, prices_result)
         return prices_ok_result.value
 
+    async def try_execute(self) -> Result[list[PriceEntry], LoadPricesUseCaseFailure]:
+        prices_result: Result[list[PriceEntry], PriceRepositoryFailure] = await self._price_repository.fetch()
+
+        if prices_result.is_err():
+            err_result: Error[list[PriceEntry], PriceRepositoryFailure] = typing.cast(Error, prices_result)
+            failure: PriceRepositoryFailure = err_result.value
+
+            if isinstance(failure, PriceRepositoryDependenciesFailure):
+                return Result.error(LoadPricesUseCaseDependenciesFailure(reason=failure.reason))
+
+            return Result.error(LoadPricesUseCaseGenericFailure())
+
+        prices_ok_result: Ok[list[PriceEntry], PriceRepositoryFailure] = typing.cast(Ok, prices_result)
+        return Result.ok(prices_ok_result.value)
+
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class LoadPricesUseCaseFailure(abc.ABC):
@@ -33,3 +52,8 @@ class LoadPricesUseCaseFailure(abc.ABC):
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class LoadPricesUseCaseGenericFailure(LoadPricesUseCaseFailure):
     pass
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class LoadPricesUseCaseDependenciesFailure(LoadPricesUseCaseFailure):
+    reason: str
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import dataclasses
+
+from src.features.price_loading.entities.price_entry import PriceEntry
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PriceDataset:
+    version: int
+    prices: list[PriceEntry]
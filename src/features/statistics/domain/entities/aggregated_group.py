@@ -0,0 +1,25 @@
+import dataclasses
+import enum
+
+
+class Reducer(str, enum.Enum):
+    """Aggregate of a group of prices, ``FIRST`` and ``LAST`` take the value of the oldest and newest release."""
+    SUM = 'sum'
+    COUNT = 'count'
+    MEAN = 'mean'
+    MIN = 'min'
+    MAX = 'max'
+    FIRST = 'first'
+    LAST = 'last'
+
+
+class AggregatedField(str, enum.Enum):
+    DOLLAR_PRICE = 'dollar_price'
+    LOCAL_PRICE = 'local_price'
+    DOLLAR_EXCHANGE_RATE = 'dollar_exchange_rate'
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AggregatedGroup:
+    key: str
+    values: dict[Reducer, float]
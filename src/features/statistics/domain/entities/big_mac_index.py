@@ -0,0 +1,15 @@
+import dataclasses
+
+import numpy
+
+from src.features.price_loading.entities.price_entry import CountryName
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BigMacIndex:
+    """Implied PPP rate and valuation of every row of ``columns`` against the base country, ``NaN`` without one."""
+    base_country: CountryName
+    columns: PriceColumns
+    implied_ppp_rates: numpy.ndarray
+    valuation_percentages: numpy.ndarray
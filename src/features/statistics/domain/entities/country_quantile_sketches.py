@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from src.core.utils.kll_sketch import KllSketch
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+
+
+class CountryQuantileSketches:
+    """One ``KllSketch`` of dollar prices per country, fed chunk by chunk and mergeable across shards."""
+    _k: int
+    _sketches: dict[CountryName, KllSketch]
+
+    def __init__(self, k: int = 200) -> None:
+        self._k = k
+        self._sketches = {}
+
+    @property
+    def sketches(self) -> dict[CountryName, KllSketch]:
+        return self._sketches
+
+    def update(self, prices: Iterable[PriceEntry]) -> None:
+        for price in prices:
+            sketch: KllSketch | None = self._sketches.get(price.country_name)
+
+            if sketch is None:
+                sketch = self._sketches[price.country_name] = KllSketch(self._k)
+
+            sketch.update(price.price.amount_in_dollars.value)
+
+    def merge(self, other: CountryQuantileSketches) -> None:
+        for country, other_sketch in other.sketches.items():
+            sketch: KllSketch | None = self._sketches.get(country)
+
+            if sketch is None:
+                sketch = self._sketches[country] = KllSketch(self._k)
+
+            sketch.merge(other_sketch)
@@ -0,0 +1,17 @@
+import dataclasses
+import enum
+
+from src.features.price_loading.entities.price_entry import CountryName
+
+
+class QuantileMode(str, enum.Enum):
+    EXACT = 'exact'
+    APPROXIMATE = 'approximate'
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CountryQuantiles:
+    """Dollar price quantiles of a country, keyed by probability."""
+    country: CountryName
+    prices: int
+    quantiles: dict[float, float]
@@ -0,0 +1,6 @@
+import enum
+
+
+class DateMatch(str, enum.Enum):
+    EXACT = 'exact'
+    NEAREST = 'nearest'
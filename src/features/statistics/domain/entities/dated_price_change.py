@@ -0,0 +1,15 @@
+import dataclasses
+import datetime
+
+from src.features.price_loading.entities.price_entry import CountryName
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class DatedPriceChange:
+    """Change of a country's dollar price between two of its releases, ``percentage`` is negative on a drop."""
+    country: CountryName
+    start_date: datetime.date
+    end_date: datetime.date
+    start_price: float
+    end_price: float
+    percentage: float
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+
+from src.core.utils.option import Option
+from src.features.statistics.domain.entities.average_price_entry import AveragePriceEntry
+from src.features.statistics.domain.entities.price_change import PriceChange
+from src.features.statistics.domain.entities.single_country_price import SingleCountryPrice
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class FullReport:
+    summary: PriceSummary
+    average_prices: list[AveragePriceEntry]
+    most_expensive_country: Option[SingleCountryPrice]
+    cheapest_country: Option[SingleCountryPrice]
+    price_changes: list[PriceChange]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PriceSummary:
+    prices: int
+    countries: int
+    first_date: datetime.date | None
+    last_date: datetime.date | None
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import abc
+from collections.abc import Callable, Mapping
+
+import numpy
+
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+
+
+class GroupKey(abc.ABC):
+    """What prices are grouped by, read from one price at a time."""
+    name: str
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    @abc.abstractmethod
+    def of(self, entry: PriceEntry) -> str:
+        pass
+
+
+class ColumnGroupKey(GroupKey):
+    """Group key that can also be computed for whole price columns at once."""
+
+    @abc.abstractmethod
+    def encode(self, columns: PriceColumns) -> tuple[list[str], numpy.ndarray]:
+        """Labels of the groups and the group code of every price."""
+
+
+class CountryGroupKey(ColumnGroupKey):
+
+    def __init__(self) -> None:
+        super().__init__('country')
+
+    def of(self, entry: PriceEntry) -> str:
+        return entry.country_name.value
+
+    def encode(self, columns: PriceColumns) -> tuple[list[str], numpy.ndarray]:
+        return [c.value for c in columns.countries], columns.country_codes
+
+
+class CurrencyGroupKey(ColumnGroupKey):
+
+    def __init__(self) -> None:
+        super().__init__('currency')
+
+    def of(self, entry: PriceEntry) -> str:
+        return entry.price.original_currency.value
+
+    def encode(self, columns: PriceColumns) -> tuple[list[str], numpy.ndarray]:
+        return list(columns.currencies), columns.currency_codes
+
+
+class YearGroupKey(ColumnGroupKey):
+
+    def __init__(self) -> None:
+        super().__init__('year')
+
+    def of(self, entry: PriceEntry) -> str:
+        return str(entry.date.year)
+
+    def encode(self, columns: PriceColumns) -> tuple[list[str], numpy.ndarray]:
+        years, year_codes = numpy.unique(
+            numpy.array([d.year for d in columns.dates], dtype=numpy.int32),
+            return_inverse=True,
+        )
+
+        return [str(y) for y in years.tolist()], year_codes[columns.date_codes]
+
+
+class RegionGroupKey(ColumnGroupKey):
+    """Groups by the region ``regions`` joins every country to, ``default`` for countries it does not list."""
+    _regions: Mapping[CountryName, str]
+    _default: str
+
+    def __init__(self, regions: Mapping[CountryName, str], default: str = 'Other') -> None:
+        super().__init__('region')
+        self._regions = regions
+        self._default = default
+
+    def of(self, entry: PriceEntry) -> str:
+        return self._regions.get(entry.country_name, self._default)
+
+    def encode(self, columns: PriceColumns) -> tuple[list[str], numpy.ndarray]:
+        region_codes: dict[str, int] = {}
+        country_regions: numpy.ndarray = numpy.array(
+            [
+                region_codes.setdefault(self._regions.get(country, self._default), len(region_codes))
+                for country in columns.countries
+            ],
+            dtype=numpy.int32,
+        )
+
+        return list(region_codes), country_regions[columns.country_codes]
+
+
+class FunctionGroupKey(GroupKey):
+    """Groups by any function of a price, always aggregated row by row."""
+    _of: Callable[[PriceEntry], str]
+
+    def __init__(self, name: str, of: Callable[[PriceEntry], str]) -> None:
+        super().__init__(name)
+        self._of = of
+
+    def of(self, entry: PriceEntry) -> str:
+        return self._of(entry)
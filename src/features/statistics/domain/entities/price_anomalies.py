@@ -0,0 +1,20 @@
+import dataclasses
+
+import numpy
+
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PriceAnomalies:
+    """Exchange rate consistency and release to release change outliers of every row of ``columns``."""
+    columns: PriceColumns
+    implied_dollar_prices: numpy.ndarray
+    is_inconsistent: numpy.ndarray
+    change_percentages: numpy.ndarray
+    change_z_scores: numpy.ndarray
+    is_outlier: numpy.ndarray
+
+    @property
+    def flagged_rows(self) -> numpy.ndarray:
+        return numpy.flatnonzero(self.is_inconsistent | self.is_outlier)
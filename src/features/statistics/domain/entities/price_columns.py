@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+
+import numpy
+
+from src.features.price_loading.entities.price_entry import CountryName
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PriceColumns:
+    """One NumPy array per price field, countries and currencies coded by first appearance, dates ascending."""
+    countries: list[CountryName]
+    currencies: list[str]
+    dates: list[datetime.date]
+    country_codes: numpy.ndarray
+    currency_codes: numpy.ndarray
+    date_codes: numpy.ndarray
+    dollar_prices: numpy.ndarray
+    local_prices: numpy.ndarray
+    exchange_rates: numpy.ndarray
+
+    def release_values(self, rows: numpy.ndarray, values: numpy.ndarray) -> numpy.ndarray:
+        """Table of ``values[rows]`` by release date code, the last price of a release winning, ``NaN`` elsewhere."""
+        table: numpy.ndarray = numpy.full(len(self.dates), numpy.nan)
+        table[self.date_codes[rows]] = values[rows]
+
+        return table
+
+    def select(self, rows: numpy.ndarray) -> PriceColumns:
+        """The prices ``rows`` selects, with the same country, currency and date codes."""
+        return dataclasses.replace(
+            self,
+            country_codes=self.country_codes[rows],
+            currency_codes=self.currency_codes[rows],
+            date_codes=self.date_codes[rows],
+            dollar_prices=self.dollar_prices[rows],
+            local_prices=self.local_prices[rows],
+            exchange_rates=self.exchange_rates[rows],
+        )
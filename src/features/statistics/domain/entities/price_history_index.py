@@ -0,0 +1,58 @@
+import dataclasses
+import datetime
+
+import numpy
+
+from src.features.price_loading.entities.price_entry import CountryName
+from src.features.statistics.domain.entities.date_match import DateMatch
+
+# Spacing of the composite (country, date) keys, above the ordinal of ``datetime.date.max``.
+_KEY_SPAN: int = 1 << 22
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PriceHistoryIndex:
+    """Prices sorted by country and release date, ``country_starts[c]`` opening the segment of ``countries[c]``."""
+    countries: list[CountryName]
+    country_starts: numpy.ndarray
+    country_codes: numpy.ndarray
+    release_ordinals: numpy.ndarray
+    dollar_prices: numpy.ndarray
+    keys: numpy.ndarray
+
+    @staticmethod
+    def key(country_codes: numpy.ndarray, release_ordinals: numpy.ndarray) -> numpy.ndarray:
+        return country_codes.astype(numpy.int64) * _KEY_SPAN + release_ordinals
+
+    def locate(self, date: datetime.date, match: DateMatch) -> numpy.ndarray:
+        """Position of the release matching ``date`` for every country, ``-1`` where a country has none."""
+        return self.match_releases(
+            numpy.arange(len(self.countries)),
+            numpy.full(len(self.countries), date.toordinal()),
+            match,
+        )
+
+    def match_releases(self, country_codes: numpy.ndarray, ordinals: numpy.ndarray, match: DateMatch) -> numpy.ndarray:
+        """Position of the release of ``country_codes[i]`` matching ``ordinals[i]``, ``-1`` where there is none."""
+        starts: numpy.ndarray = self.country_starts[country_codes]
+        ends: numpy.ndarray = self.country_starts[country_codes + 1]
+        after: numpy.ndarray = numpy.searchsorted(self.keys, self.key(country_codes, ordinals))
+
+        if match == DateMatch.EXACT:
+            is_found: numpy.ndarray = after < ends
+            is_found[is_found] = self.release_ordinals[after[is_found]] == ordinals[is_found]
+
+            return numpy.where(is_found, after, -1)
+
+        has_releases: numpy.ndarray = ends > starts
+
+        if not has_releases.any():
+            return numpy.full(len(country_codes), -1)
+
+        # Countries without releases would otherwise fall through to a neighbouring country's segment
+        before: numpy.ndarray = numpy.where(has_releases, numpy.maximum(after - 1, starts), 0)
+        after = numpy.where(has_releases, numpy.minimum(after, ends - 1), 0)
+        is_before_closer: numpy.ndarray = \
+            ordinals - self.release_ordinals[before] <= self.release_ordinals[after] - ordinals
+
+        return numpy.where(has_releases, numpy.where(is_before_closer, before, after), -1)
@@ -0,0 +1,42 @@
+import dataclasses
+import datetime
+import math
+
+import numpy
+
+from src.core.utils.option import Option
+from src.features.price_loading.entities.price_entry import CountryName
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PriceMatrix:
+    """Dense country by ascending release date matrices, ``NaN`` where a country has no price."""
+    countries: list[CountryName]
+    dates: list[datetime.date]
+    country_positions: dict[CountryName, int]
+    date_positions: dict[datetime.date, int]
+    dollar_prices: numpy.ndarray
+    local_prices: numpy.ndarray
+    exchange_rates: numpy.ndarray
+    is_forward_filled: bool
+
+    def country_row(self, country: CountryName) -> Option[numpy.ndarray]:
+        position: int | None = self.country_positions.get(country)
+
+        return Option.empty() if position is None else Option.some(self.dollar_prices[position])
+
+    def date_column(self, date: datetime.date) -> Option[numpy.ndarray]:
+        position: int | None = self.date_positions.get(date)
+
+        return Option.empty() if position is None else Option.some(self.dollar_prices[:, position])
+
+    def price_at(self, country: CountryName, date: datetime.date) -> Option[float]:
+        country_position: int | None = self.country_positions.get(country)
+        date_position: int | None = self.date_positions.get(date)
+
+        if country_position is None or date_position is None:
+            return Option.empty()
+
+        price: float = float(self.dollar_prices[country_position, date_position])
+
+        return Option.empty() if math.isnan(price) else Option.some(price)
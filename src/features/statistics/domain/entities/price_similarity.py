@@ -0,0 +1,56 @@
+import dataclasses
+import enum
+
+import numpy
+
+from src.core.utils.option import Option
+from src.features.price_loading.entities.price_entry import CountryName
+
+
+class SimilarityMeasure(str, enum.Enum):
+    CORRELATION = 'correlation'
+    COSINE = 'cosine'
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SimilarCountry:
+    country: CountryName
+    similarity: float
+    common_releases: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PriceSimilarity:
+    """Pairwise similarity of the dollar price trajectories over the releases both countries list."""
+    countries: list[CountryName]
+    country_positions: dict[CountryName, int]
+    measure: SimilarityMeasure
+    similarities: numpy.ndarray
+    common_releases: numpy.ndarray
+
+    def nearest(self, country: CountryName, k: int) -> Option[list[SimilarCountry]]:
+        """The ``k`` countries most similar to ``country``, most similar first."""
+        position: int | None = self.country_positions.get(country)
+
+        if position is None:
+            return Option.empty()
+
+        similarities: numpy.ndarray = self.similarities[position].copy()
+        similarities[position] = numpy.nan
+        candidates: numpy.ndarray = numpy.flatnonzero(~numpy.isnan(similarities))
+
+        if k < len(candidates):
+            candidates = candidates[numpy.argpartition(-similarities[candidates], k - 1)[:k]]
+
+        candidates = candidates[numpy.lexsort((candidates, -similarities[candidates]))]
+
+        return Option.some(
+            [
+                SimilarCountry(
+                    country=self.countries[c],
+                    similarity=float(similarities[c]),
+                    common_releases=int(self.common_releases[position, c]),
+                )
+                for c in candidates.tolist()
+            ]
+        )
@@ -0,0 +1,28 @@
+import dataclasses
+
+import numpy
+
+from src.core.utils.option import Option
+from src.features.price_loading.entities.price_entry import CountryName
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class PriceTrends:
+    """Per release statistics aligned with ``PriceHistoryIndex``, ``NaN`` where a history is too short."""
+    window: int
+    countries: list[CountryName]
+    country_starts: numpy.ndarray
+    release_ordinals: numpy.ndarray
+    dollar_prices: numpy.ndarray
+    rolling_means: numpy.ndarray
+    year_over_year_percentages: numpy.ndarray
+    compound_annual_growth_percentages: numpy.ndarray
+
+    def country_releases(self, country: CountryName) -> Option[slice]:
+        """Positions of the releases of ``country`` in the flat arrays."""
+        if country not in self.countries:
+            return Option.empty()
+
+        country_code: int = self.countries.index(country)
+
+        return Option.some(slice(self.country_starts[country_code], self.country_starts[country_code + 1]))
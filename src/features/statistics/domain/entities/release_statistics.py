@@ -0,0 +1,14 @@
+import dataclasses
+import datetime
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ReleaseStatistics:
+    """Distribution of the dollar prices of every country on one release date."""
+    date: datetime.date
+    countries: int
+    mean: float
+    median: float
+    standard_deviation: float
+    minimum: float
+    maximum: float
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import math
+from collections.abc import Collection
+
+import numpy
+
+from src.features.price_loading.entities.price_entry import PriceEntry
+from src.features.statistics.domain.entities.aggregated_group import AggregatedField, AggregatedGroup, Reducer
+from src.features.statistics.domain.entities.group_key import ColumnGroupKey, GroupKey
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+
+_DEFAULT_VECTORIZED_THRESHOLD: int = 10_000
+
+
+class AggregatePricesUseCase:
+    """Computes every reducer per group in one pass, with NumPy from ``vectorized_threshold`` prices on."""
+    _build_price_columns_use_case: BuildPriceColumnsUseCase
+    _vectorized_threshold: int
+
+    def __init__(
+        self,
+        build_price_columns_use_case: BuildPriceColumnsUseCase,
+        vectorized_threshold: int = _DEFAULT_VECTORIZED_THRESHOLD,
+    ) -> None:
+        self._build_price_columns_use_case = build_price_columns_use_case
+        self._vectorized_threshold = vectorized_threshold
+
+    def execute(
+        self,
+        prices: list[PriceEntry],
+        key: GroupKey,
+        reducers: Collection[Reducer],
+        field: AggregatedField = AggregatedField.DOLLAR_PRICE,
+    ) -> list[AggregatedGroup]:
+        if isinstance(key, ColumnGroupKey) and len(prices) >= self._vectorized_threshold:
+            return self.aggregate_columns(self._build_price_columns_use_case.execute(prices), key, reducers, field)
+
+        return self._aggregate_rows(prices, key, reducers, field)
+
+    @staticmethod
+    def aggregate_columns(
+        columns: PriceColumns,
+        key: ColumnGroupKey,
+        reducers: Collection[Reducer],
+        field: AggregatedField = AggregatedField.DOLLAR_PRICE,
+    ) -> list[AggregatedGroup]:
+        """The vectorized backend, for columns already built."""
+        labels, codes = key.encode(columns)
+        label_order: numpy.ndarray = numpy.argsort(numpy.array(labels, dtype=object), kind='stable')
+        label_ranks: numpy.ndarray = numpy.empty(len(labels), dtype=numpy.int64)
+        label_ranks[label_order] = numpy.arange(len(labels))
+        ranks: numpy.ndarray = label_ranks[codes]
+        order: numpy.ndarray = numpy.lexsort((columns.date_codes, ranks))
+        ranks = ranks[order]
+        values: numpy.ndarray = _field_values(columns, field)[order]
+
+        if not len(values):
+            return []
+
+        starts: numpy.ndarray = numpy.flatnonzero(numpy.concatenate(([True], ranks[1:] != ranks[:-1])))
+        counts: numpy.ndarray = numpy.diff(numpy.append(starts, len(values)))
+        sums: numpy.ndarray = numpy.add.reduceat(values, starts)
+        reduced: dict[Reducer, list[float]] = {}
+
+        for reducer in reducers:
+            match reducer:
+                case Reducer.SUM:
+                    reduced[reducer] = sums.tolist()
+                case Reducer.COUNT:
+                    reduced[reducer] = counts.tolist()
+                case Reducer.MEAN:
+                    reduced[reducer] = (sums / counts).tolist()
+                case Reducer.MIN:
+                    reduced[reducer] = numpy.minimum.reduceat(values, starts).tolist()
+                case Reducer.MAX:
+                    reduced[reducer] = numpy.maximum.reduceat(values, starts).tolist()
+                case Reducer.FIRST:
+                    reduced[reducer] = values[starts].tolist()
+                case Reducer.LAST:
+                    reduced[reducer] = values[starts + counts - 1].tolist()
+
+        return [
+            AggregatedGroup(key=labels[label_order[rank]], values={r: v[i] for r, v in reduced.items()})
+            for i, rank in enumerate(ranks[starts].tolist())
+        ]
+
+    @staticmethod
+    def _aggregate_rows(
+        prices: list[PriceEntry],
+        key: GroupKey,
+        reducers: Collection[Reducer],
+        field: AggregatedField,
+    ) -> list[AggregatedGroup]:
+        groups: dict[str, _Group] = {}
+
+        for entry in prices:
+            label: str = key.of(entry)
+            value: float = _field_value(entry, field)
+            group: _Group | None = groups.get(label)
+
+            if group is None:
+                groups[label] = _Group(
+                    count=1,
+                    total=value,
+                    minimum=value,
+                    maximum=value,
+                    first_date=entry.date,
+                    first=value,
+                    last_date=entry.date,
+                    last=value,
+                )
+                continue
+
+            group.count += 1
+            group.total += value
+            group.minimum = min(group.minimum, value)
+            group.maximum = max(group.maximum, value)
+
+            if entry.date < group.first_date:
+                group.first_date, group.first = entry.date, value
+
+            if entry.date >= group.last_date:
+                group.last_date, group.last = entry.date, value
+
+        return [
+            AggregatedGroup(key=label, values={r: groups[label].reduce(r) for r in reducers})
+            for label in sorted(groups)
+        ]
+
+
+@dataclasses.dataclass(kw_only=True)
+class _Group:
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+    first_date: datetime.date
+    first: float
+    last_date: datetime.date
+    last: float
+
+    def reduce(self, reducer: Reducer) -> float:
+        match reducer:
+            case Reducer.SUM:
+                return self.total
+            case Reducer.COUNT:
+                return self.count
+            case Reducer.MEAN:
+                return self.total / self.count
+            case Reducer.MIN:
+                return self.minimum
+            case Reducer.MAX:
+                return self.maximum
+            case Reducer.FIRST:
+                return self.first
+            case Reducer.LAST:
+                return self.last
+
+        return math.nan
+
+
+def _field_value(entry: PriceEntry, field: AggregatedField) -> float:
+    match field:
+        case AggregatedField.LOCAL_PRICE:
+            return entry.price.amount_in_original_currency.value
+        case AggregatedField.DOLLAR_EXCHANGE_RATE:
+            return entry.price.dollar_exchange_rate.value
+
+    return entry.price.amount_in_dollars.value
+
+
+def _field_values(columns: PriceColumns, field: AggregatedField) -> numpy.ndarray:
+    match field:
+        case AggregatedField.LOCAL_PRICE:
+            return columns.local_prices
+        case AggregatedField.DOLLAR_EXCHANGE_RATE:
+            return columns.exchange_rates
+
+    return columns.dollar_prices
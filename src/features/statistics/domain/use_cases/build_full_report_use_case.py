@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+
+from src.features.price_loading.entities.price import Amount
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.average_price_entry import AveragePrice, AveragePriceEntry
+from src.features.statistics.domain.entities.country_extremes import CountryExtremes
+from src.features.statistics.domain.entities.full_report import FullReport, PriceSummary
+from src.features.statistics.domain.use_cases.calculate_cheapest_country_use_case import CalculateCheapestCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_most_expensive_country_use_case import \
+    CalculateMostExpensiveCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_price_change_use_case import CalculatePriceChangeUseCase
+
+
+class BuildFullReportUseCase:
+    """Builds every menu report from one grouping pass, matching the individual use cases including ties."""
+    _most_expensive_country_use_case: CalculateMostExpensiveCountryUseCase
+    _cheapest_country_use_case: CalculateCheapestCountryUseCase
+    _calculate_price_change_use_case: CalculatePriceChangeUseCase
+
+    def __init__(
+        self,
+        calculate_most_expensive_country_use_case: CalculateMostExpensiveCountryUseCase,
+        calculate_cheapest_country_use_case: CalculateCheapestCountryUseCase,
+        calculate_price_change_use_case: CalculatePriceChangeUseCase,
+    ) -> None:
+        self._most_expensive_country_use_case = calculate_most_expensive_country_use_case
+        self._cheapest_country_use_case = calculate_cheapest_country_use_case
+        self._calculate_price_change_use_case = calculate_price_change_use_case
+
+    def execute(self, prices: list[PriceEntry]) -> FullReport:
+        groups: dict[CountryName, _CountryGroup] = self._group_by_country(prices)
+        average_prices: list[AveragePriceEntry] = [
+            AveragePriceEntry(country=country, price=AveragePrice(value=round(group.price_sum / group.count, 2)))
+            for country, group in groups.items()
+        ]
+        extremes: list[CountryExtremes] = [
+            CountryExtremes(
+                country=country,
+                oldest_price=group.oldest_price,
+                newest_price=group.newest_price,
+            )
+            for country, group in groups.items()
+        ]
+
+        return FullReport(
+            summary=self._summarize(prices, groups),
+            average_prices=average_prices,
+            most_expensive_country=self._most_expensive_country_use_case.execute(average_prices),
+            cheapest_country=self._cheapest_country_use_case.execute(average_prices),
+            price_changes=self._calculate_price_change_use_case.execute(extremes),
+        )
+
+    @staticmethod
+    def _group_by_country(prices: list[PriceEntry]) -> dict[CountryName, _CountryGroup]:
+        groups: dict[CountryName, _CountryGroup] = {}
+
+        for price in prices:
+            amount: Amount = price.price.amount_in_dollars
+            group: _CountryGroup | None = groups.get(price.country_name)
+
+            if group is None:
+                groups[price.country_name] = _CountryGroup(
+                    price_sum=amount.value,
+                    count=1,
+                    oldest_date=price.date,
+                    oldest_price=amount,
+                    newest_date=price.date,
+                    newest_price=amount,
+                )
+                continue
+
+            group.price_sum += amount.value
+            group.count += 1
+
+            if price.date < group.oldest_date:
+                group.oldest_date = price.date
+                group.oldest_price = amount
+            if price.date > group.newest_date:
+                group.newest_date = price.date
+                group.newest_price = amount
+
+        return groups
+
+    @staticmethod
+    def _summarize(prices: list[PriceEntry], groups: dict[CountryName, _CountryGroup]) -> PriceSummary:
+        return PriceSummary(
+            prices=len(prices),
+            countries=len(groups),
+            first_date=min((g.oldest_date for g in groups.values()), default=None),
+            last_date=max((g.newest_date for g in groups.values()), default=None),
+        )
+
+
+@dataclasses.dataclass(kw_only=True)
+class _CountryGroup:
+    price_sum: float
+    count: int
+    oldest_date: datetime.date
+    oldest_price: Amount
+    newest_date: datetime.date
+    newest_price: Amount
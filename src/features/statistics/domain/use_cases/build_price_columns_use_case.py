@@ -0,0 +1,50 @@
+import datetime
+
+import numpy
+
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+
+
+class BuildPriceColumnsUseCase:
+
+    def execute(self, prices: list[PriceEntry]) -> PriceColumns:
+        country_index: dict[CountryName, int] = {}
+        currency_index: dict[str, int] = {}
+        date_index: dict[datetime.date, int] = {}
+        size: int = len(prices)
+
+        country_codes: numpy.ndarray = numpy.fromiter(
+            (country_index.setdefault(p.country_name, len(country_index)) for p in prices),
+            dtype=numpy.int32,
+            count=size,
+        )
+        currency_codes: numpy.ndarray = numpy.fromiter(
+            (currency_index.setdefault(p.price.original_currency.value, len(currency_index)) for p in prices),
+            dtype=numpy.int32,
+            count=size,
+        )
+        first_seen_date_codes: numpy.ndarray = numpy.fromiter(
+            (date_index.setdefault(p.date, len(date_index)) for p in prices),
+            dtype=numpy.int32,
+            count=size,
+        )
+        dates: list[datetime.date] = sorted(date_index)
+        sorted_positions: numpy.ndarray = numpy.empty(len(dates), dtype=numpy.int32)
+        sorted_positions[[date_index[d] for d in dates]] = numpy.arange(len(dates), dtype=numpy.int32)
+
+        return PriceColumns(
+            countries=list(country_index),
+            currencies=list(currency_index),
+            dates=dates,
+            country_codes=country_codes,
+            currency_codes=currency_codes,
+            date_codes=sorted_positions[first_seen_date_codes],
+            dollar_prices=numpy.fromiter((p.price.amount_in_dollars.value for p in prices), numpy.float64, size),
+            local_prices=numpy.fromiter(
+                (p.price.amount_in_original_currency.value for p in prices),
+                numpy.float64,
+                size,
+            ),
+            exchange_rates=numpy.fromiter((p.price.dollar_exchange_rate.value for p in prices), numpy.float64, size),
+        )
@@ -0,0 +1,26 @@
+import numpy
+
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+from src.features.statistics.domain.entities.price_history_index import PriceHistoryIndex
+
+
+class BuildPriceHistoryIndexUseCase:
+    """Sorts price columns by country and release date, keeping the last price of a country for a release."""
+
+    def execute(self, columns: PriceColumns) -> PriceHistoryIndex:
+        date_ordinals: numpy.ndarray = numpy.array([d.toordinal() for d in columns.dates], dtype=numpy.int64)
+        keys: numpy.ndarray = PriceHistoryIndex.key(columns.country_codes, date_ordinals[columns.date_codes])
+        order: numpy.ndarray = numpy.argsort(keys, kind='stable')
+        sorted_keys: numpy.ndarray = keys[order]
+        is_last_of_release: numpy.ndarray = numpy.append(sorted_keys[1:] != sorted_keys[:-1], True)[:len(keys)]
+        order = order[is_last_of_release]
+        country_codes: numpy.ndarray = columns.country_codes[order]
+
+        return PriceHistoryIndex(
+            countries=columns.countries,
+            country_starts=numpy.searchsorted(country_codes, numpy.arange(len(columns.countries) + 1)),
+            country_codes=country_codes,
+            release_ordinals=date_ordinals[columns.date_codes[order]],
+            dollar_prices=columns.dollar_prices[order],
+            keys=sorted_keys[is_last_of_release],
+        )
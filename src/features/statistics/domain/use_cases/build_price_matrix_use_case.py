@@ -0,0 +1,46 @@
+import numpy
+
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+from src.features.statistics.domain.entities.price_matrix import PriceMatrix
+
+
+class BuildPriceMatrixUseCase:
+    """With ``forward_fill`` a skipped release takes the latest earlier price, the last price of a release wins."""
+
+    def execute(self, columns: PriceColumns, forward_fill: bool = False) -> PriceMatrix:
+        shape: tuple[int, int] = (len(columns.countries), len(columns.dates))
+        dollar_prices: numpy.ndarray = self._scatter(shape, columns, columns.dollar_prices)
+        local_prices: numpy.ndarray = self._scatter(shape, columns, columns.local_prices)
+        exchange_rates: numpy.ndarray = self._scatter(shape, columns, columns.exchange_rates)
+
+        if forward_fill:
+            sources: numpy.ndarray = self._forward_fill_sources(~numpy.isnan(dollar_prices))
+            dollar_prices = numpy.take_along_axis(dollar_prices, sources, axis=1)
+            local_prices = numpy.take_along_axis(local_prices, sources, axis=1)
+            exchange_rates = numpy.take_along_axis(exchange_rates, sources, axis=1)
+
+        return PriceMatrix(
+            countries=columns.countries,
+            dates=columns.dates,
+            country_positions={c: i for i, c in enumerate(columns.countries)},
+            date_positions={d: i for i, d in enumerate(columns.dates)},
+            dollar_prices=dollar_prices,
+            local_prices=local_prices,
+            exchange_rates=exchange_rates,
+            is_forward_filled=forward_fill,
+        )
+
+    @staticmethod
+    def _scatter(shape: tuple[int, int], columns: PriceColumns, values: numpy.ndarray) -> numpy.ndarray:
+        matrix: numpy.ndarray = numpy.full(shape, numpy.nan)
+        matrix[columns.country_codes, columns.date_codes] = values
+
+        return matrix
+
+    @staticmethod
+    def _forward_fill_sources(is_present: numpy.ndarray) -> numpy.ndarray:
+        """Column of the latest present value at or before every cell, 0 before a row's first value."""
+        sources: numpy.ndarray = numpy.where(is_present, numpy.arange(is_present.shape[1]), 0)
+        numpy.maximum.accumulate(sources, axis=1, out=sources)
+
+        return sources
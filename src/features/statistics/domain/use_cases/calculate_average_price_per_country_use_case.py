@@ -7,7 +7,6 @@ from src.core.utils.result import Result
 from src.features.price_loading.entities.price import Amount
 from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
 from src.features.statistics.domain.entities.average_price_entry import AveragePrice, AveragePriceEntry
-from src.features.statistics.domain.entities.statistics_failure import StatisticsFailure
 
 PriceSumPerCountry: typing.TypeAlias = dict[CountryName, tuple[Amount, int]]
 
@@ -20,7 +19,7 @@ class CalculateAveragePricePerCountryUseCase:
     ) -> Result[list[AveragePriceEntry], CalculateAveragePriceUseCaseFailure]:
         average_prices: list[AveragePriceEntry] = self._get_average_prices(entries)
 
-        return Result[list[AveragePriceEntry], StatisticsFailure].ok(average_prices)  # type: ignore
+        return Result.ok(average_prices)
 
     def _get_average_prices(self, entries: list[PriceEntry]) -> list[AveragePriceEntry]:
         sum_per_country: PriceSumPerCountry = self._get_price_sum_per_country(entries)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import dataclasses
+
+import numpy
+
+from src.core.utils.result import Result
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.big_mac_index import BigMacIndex
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+
+DEFAULT_BASE_COUNTRY: CountryName = CountryName(value='United States')
+
+
+class CalculateBigMacIndexUseCase:
+    """The Big Mac index of every price against a base country, joined through a table by release date."""
+    _build_price_columns_use_case: BuildPriceColumnsUseCase
+
+    def __init__(self, build_price_columns_use_case: BuildPriceColumnsUseCase) -> None:
+        self._build_price_columns_use_case = build_price_columns_use_case
+
+    def execute(
+        self,
+        prices: list[PriceEntry],
+        base_country: CountryName = DEFAULT_BASE_COUNTRY,
+    ) -> Result[BigMacIndex, CalculateBigMacIndexUseCaseFailure]:
+        return self.calculate(self._build_price_columns_use_case.execute(prices), base_country)
+
+    @staticmethod
+    def calculate(
+        columns: PriceColumns,
+        base_country: CountryName = DEFAULT_BASE_COUNTRY,
+    ) -> Result[BigMacIndex, CalculateBigMacIndexUseCaseFailure]:
+        """Same as ``execute`` over columns already built."""
+        if base_country not in columns.countries:
+            return Result.error(CalculateBigMacIndexUseCaseFailure(details=f'No prices for {base_country.value}'))
+
+        base_rows: numpy.ndarray = columns.country_codes == columns.countries.index(base_country)
+        base_local_prices: numpy.ndarray = columns.release_values(base_rows, columns.local_prices)[columns.date_codes]
+        base_exchange_rates: numpy.ndarray = \
+            columns.release_values(base_rows, columns.exchange_rates)[columns.date_codes]
+        implied_ppp_rates: numpy.ndarray = columns.local_prices / base_local_prices
+        market_rates: numpy.ndarray = columns.exchange_rates / base_exchange_rates
+
+        return Result.ok(
+            BigMacIndex(
+                base_country=base_country,
+                columns=columns,
+                implied_ppp_rates=implied_ppp_rates,
+                valuation_percentages=(implied_ppp_rates / market_rates - 1) * 100,
+            )
+        )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CalculateBigMacIndexUseCaseFailure:
+    details: str
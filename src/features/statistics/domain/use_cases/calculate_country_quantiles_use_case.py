@@ -0,0 +1,52 @@
+from collections.abc import Sequence
+
+import numpy
+
+from src.features.price_loading.entities.price_entry import PriceEntry
+from src.features.statistics.domain.entities.country_quantiles import CountryQuantiles
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+
+
+class CalculateCountryQuantilesUseCase:
+    """Exact dollar price quantiles of every country, linearly interpolated, selecting rather than sorting."""
+    _build_price_columns_use_case: BuildPriceColumnsUseCase
+
+    def __init__(self, build_price_columns_use_case: BuildPriceColumnsUseCase) -> None:
+        self._build_price_columns_use_case = build_price_columns_use_case
+
+    def execute(self, prices: list[PriceEntry], probabilities: Sequence[float]) -> list[CountryQuantiles]:
+        return self.calculate(self._build_price_columns_use_case.execute(prices), probabilities)
+
+    def calculate(self, columns: PriceColumns, probabilities: Sequence[float]) -> list[CountryQuantiles]:
+        """Same as ``execute`` over columns already built, probabilities between 0 and 1."""
+        order: numpy.ndarray = numpy.argsort(columns.country_codes, kind='stable')
+        prices: numpy.ndarray = columns.dollar_prices[order]
+        starts: numpy.ndarray = numpy.searchsorted(
+            columns.country_codes[order],
+            numpy.arange(len(columns.countries) + 1),
+        )
+        country_quantiles: list[CountryQuantiles] = []
+
+        for country_code, country in enumerate(columns.countries):
+            country_prices: numpy.ndarray = prices[starts[country_code]:starts[country_code + 1]]
+
+            if len(country_prices) == 0:
+                continue
+
+            ranks: numpy.ndarray = numpy.asarray(probabilities, dtype=numpy.float64) * (len(country_prices) - 1)
+            lower: numpy.ndarray = numpy.floor(ranks).astype(numpy.int64)
+            upper: numpy.ndarray = numpy.ceil(ranks).astype(numpy.int64)
+            selected: numpy.ndarray = numpy.partition(country_prices, numpy.unique(numpy.concatenate((lower, upper))))
+            values: numpy.ndarray = selected[lower] + (selected[upper] - selected[lower]) * (ranks - lower)
+
+            country_quantiles.append(
+                CountryQuantiles(
+                    country=country,
+                    prices=len(country_prices),
+                    quantiles=dict(zip(probabilities, values.tolist())),
+                )
+            )
+
+        return country_quantiles
+
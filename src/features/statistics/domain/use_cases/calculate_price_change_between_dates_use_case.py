@@ -0,0 +1,46 @@
+import datetime
+
+import numpy
+
+from src.features.statistics.domain.entities.date_match import DateMatch
+from src.features.statistics.domain.entities.dated_price_change import DatedPriceChange
+from src.features.statistics.domain.entities.price_history_index import PriceHistoryIndex
+
+
+class CalculatePriceChangeBetweenDatesUseCase:
+    """Change of every dollar price between two matched releases, countries missing either are left out."""
+
+    def execute(
+        self,
+        index: PriceHistoryIndex,
+        start: datetime.date,
+        end: datetime.date,
+        match: DateMatch = DateMatch.EXACT,
+    ) -> list[DatedPriceChange]:
+        start_positions: numpy.ndarray = index.locate(start, match)
+        end_positions: numpy.ndarray = index.locate(end, match)
+        country_codes: numpy.ndarray = numpy.flatnonzero((start_positions >= 0) & (end_positions >= 0))
+        start_positions = start_positions[country_codes]
+        end_positions = end_positions[country_codes]
+        start_prices: numpy.ndarray = index.dollar_prices[start_positions]
+        end_prices: numpy.ndarray = index.dollar_prices[end_positions]
+        percentages: numpy.ndarray = (end_prices - start_prices) / start_prices * 100
+
+        return [
+            DatedPriceChange(
+                country=index.countries[country_code],
+                start_date=datetime.date.fromordinal(start_ordinal),
+                end_date=datetime.date.fromordinal(end_ordinal),
+                start_price=start_price,
+                end_price=end_price,
+                percentage=percentage,
+            )
+            for country_code, start_ordinal, end_ordinal, start_price, end_price, percentage in zip(
+                country_codes.tolist(),
+                index.release_ordinals[start_positions].tolist(),
+                index.release_ordinals[end_positions].tolist(),
+                start_prices.tolist(),
+                end_prices.tolist(),
+                percentages.tolist(),
+            )
+        ]
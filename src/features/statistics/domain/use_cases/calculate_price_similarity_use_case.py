@@ -0,0 +1,87 @@
+import numpy
+
+from src.features.price_loading.entities.price_entry import PriceEntry
+from src.features.statistics.domain.entities.price_matrix import PriceMatrix
+from src.features.statistics.domain.entities.price_similarity import PriceSimilarity, SimilarityMeasure
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.build_price_matrix_use_case import BuildPriceMatrixUseCase
+
+DEFAULT_MIN_COMMON_RELEASES: int = 3
+_RELATIVE_VARIANCE_FLOOR: float = 1e-12
+
+
+class CalculatePriceSimilarityUseCase:
+    """Pearson correlation or cosine similarity of every pair of countries from matrix products."""
+    _build_price_columns_use_case: BuildPriceColumnsUseCase
+    _build_price_matrix_use_case: BuildPriceMatrixUseCase
+
+    def __init__(
+        self,
+        build_price_columns_use_case: BuildPriceColumnsUseCase,
+        build_price_matrix_use_case: BuildPriceMatrixUseCase,
+    ) -> None:
+        self._build_price_columns_use_case = build_price_columns_use_case
+        self._build_price_matrix_use_case = build_price_matrix_use_case
+
+    def execute(
+        self,
+        prices: list[PriceEntry],
+        measure: SimilarityMeasure = SimilarityMeasure.CORRELATION,
+        min_common_releases: int = DEFAULT_MIN_COMMON_RELEASES,
+    ) -> PriceSimilarity:
+        return self.calculate(
+            self._build_price_matrix_use_case.execute(self._build_price_columns_use_case.execute(prices)),
+            measure,
+            min_common_releases,
+        )
+
+    @staticmethod
+    def calculate(
+        matrix: PriceMatrix,
+        measure: SimilarityMeasure = SimilarityMeasure.CORRELATION,
+        min_common_releases: int = DEFAULT_MIN_COMMON_RELEASES,
+    ) -> PriceSimilarity:
+        """Same as ``execute`` over a price matrix already built, which should not be forward filled."""
+        is_present: numpy.ndarray = ~numpy.isnan(matrix.dollar_prices)
+        presence: numpy.ndarray = is_present.astype(numpy.float64)
+        trajectories: numpy.ndarray = numpy.where(is_present, matrix.dollar_prices, 0.0)
+        shared: numpy.ndarray = presence @ presence.T
+
+        if measure == SimilarityMeasure.CORRELATION:
+            # Shifting a trajectory leaves its correlations unchanged, centring it first only limits cancellation
+            counts: numpy.ndarray = presence.sum(axis=1, keepdims=True)
+            means: numpy.ndarray = numpy.divide(
+                trajectories.sum(axis=1, keepdims=True),
+                counts,
+                out=numpy.zeros_like(counts),
+                where=counts > 0,
+            )
+            trajectories = numpy.where(is_present, trajectories - means, 0.0)
+
+        products: numpy.ndarray = trajectories @ trajectories.T
+        squares: numpy.ndarray = (trajectories * trajectories) @ presence.T
+
+        if measure == SimilarityMeasure.CORRELATION:
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                sums: numpy.ndarray = trajectories @ presence.T
+                products = products - sums * sums.T / shared
+                variances: numpy.ndarray = squares - sums * sums / shared
+
+            # Rounding leaves a trace of variance on releases where a country's price does not change
+            squares = numpy.where(variances > _RELATIVE_VARIANCE_FLOOR * squares, variances, 0.0)
+
+        common_releases: numpy.ndarray = numpy.rint(shared).astype(numpy.int64)
+        norms: numpy.ndarray = numpy.sqrt(squares * squares.T)
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            similarities: numpy.ndarray = numpy.clip(products / norms, -1.0, 1.0)
+
+        similarities[~(norms > 0.0) | (common_releases < min_common_releases)] = numpy.nan
+
+        return PriceSimilarity(
+            countries=matrix.countries,
+            country_positions=matrix.country_positions,
+            measure=measure,
+            similarities=similarities,
+            common_releases=common_releases,
+        )
@@ -0,0 +1,85 @@
+import numpy
+
+from src.features.price_loading.entities.price_entry import PriceEntry
+from src.features.statistics.domain.entities.date_match import DateMatch
+from src.features.statistics.domain.entities.price_history_index import PriceHistoryIndex
+from src.features.statistics.domain.entities.price_trends import PriceTrends
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.build_price_history_index_use_case import \
+    BuildPriceHistoryIndexUseCase
+
+_DAYS_PER_YEAR: float = 365.25
+
+
+class CalculatePriceTrendsUseCase:
+    """Rolling mean, year-over-year change and compound annual growth of every country at once."""
+    _build_price_columns_use_case: BuildPriceColumnsUseCase
+    _build_price_history_index_use_case: BuildPriceHistoryIndexUseCase
+
+    def __init__(
+        self,
+        build_price_columns_use_case: BuildPriceColumnsUseCase,
+        build_price_history_index_use_case: BuildPriceHistoryIndexUseCase,
+    ) -> None:
+        self._build_price_columns_use_case = build_price_columns_use_case
+        self._build_price_history_index_use_case = build_price_history_index_use_case
+
+    def execute(self, prices: list[PriceEntry], window: int = 4, year_tolerance_days: int = 45) -> PriceTrends:
+        return self.calculate(
+            self._build_price_history_index_use_case.execute(self._build_price_columns_use_case.execute(prices)),
+            window,
+            year_tolerance_days,
+        )
+
+    def calculate(self, index: PriceHistoryIndex, window: int = 4, year_tolerance_days: int = 45) -> PriceTrends:
+        """Same as ``execute`` over an index already built, ``window`` must be at least 1."""
+        return PriceTrends(
+            window=window,
+            countries=index.countries,
+            country_starts=index.country_starts,
+            release_ordinals=index.release_ordinals,
+            dollar_prices=index.dollar_prices,
+            rolling_means=self._rolling_means(index, window),
+            year_over_year_percentages=self._year_over_year_percentages(index, year_tolerance_days),
+            compound_annual_growth_percentages=self._compound_annual_growth_percentages(index),
+        )
+
+    @staticmethod
+    def _rolling_means(index: PriceHistoryIndex, window: int) -> numpy.ndarray:
+        positions: numpy.ndarray = numpy.arange(len(index.dollar_prices))
+        window_starts: numpy.ndarray = positions - window + 1
+        is_full: numpy.ndarray = window_starts >= index.country_starts[index.country_codes]
+        window_starts = numpy.where(is_full, window_starts, positions)
+        # Running sums restart with every country, so rounding does not build up across the whole dataset
+        sums: numpy.ndarray = numpy.zeros(len(index.dollar_prices) + 1)
+
+        for start, end in zip(index.country_starts[:-1].tolist(), index.country_starts[1:].tolist()):
+            numpy.cumsum(index.dollar_prices[start:end], out=sums[start + 1:end + 1])
+
+        lagged_sums: numpy.ndarray = numpy.where(
+            window_starts > index.country_starts[index.country_codes],
+            sums[window_starts],
+            0.0,
+        )
+
+        return numpy.where(is_full, (sums[positions + 1] - lagged_sums) / window, numpy.nan)
+
+    @staticmethod
+    def _year_over_year_percentages(index: PriceHistoryIndex, year_tolerance_days: int) -> numpy.ndarray:
+        year_ago_ordinals: numpy.ndarray = index.release_ordinals - round(_DAYS_PER_YEAR)
+        year_ago: numpy.ndarray = index.match_releases(index.country_codes, year_ago_ordinals, DateMatch.NEAREST)
+        is_matched: numpy.ndarray = \
+            numpy.abs(index.release_ordinals[year_ago] - year_ago_ordinals) <= year_tolerance_days
+        year_ago_prices: numpy.ndarray = index.dollar_prices[year_ago]
+
+        return numpy.where(is_matched, (index.dollar_prices / year_ago_prices - 1) * 100, numpy.nan)
+
+    @staticmethod
+    def _compound_annual_growth_percentages(index: PriceHistoryIndex) -> numpy.ndarray:
+        firsts: numpy.ndarray = index.country_starts[:-1]
+        lasts: numpy.ndarray = index.country_starts[1:] - 1
+        years: numpy.ndarray = (index.release_ordinals[lasts] - index.release_ordinals[firsts]) / _DAYS_PER_YEAR
+        growth: numpy.ndarray = index.dollar_prices[lasts] / index.dollar_prices[firsts]
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            return numpy.where(years > 0, (growth ** (1 / years) - 1) * 100, numpy.nan)
@@ -0,0 +1,65 @@
+import datetime
+
+import numpy
+
+from src.features.price_loading.entities.price_entry import PriceEntry
+from src.features.statistics.domain.entities.price_history_index import PriceHistoryIndex
+from src.features.statistics.domain.entities.release_statistics import ReleaseStatistics
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.build_price_history_index_use_case import \
+    BuildPriceHistoryIndexUseCase
+
+
+class CalculateReleaseStatisticsUseCase:
+    """Dollar price distribution of every release date, counting a country once with its last price."""
+    _build_price_columns_use_case: BuildPriceColumnsUseCase
+    _build_price_history_index_use_case: BuildPriceHistoryIndexUseCase
+
+    def __init__(
+        self,
+        build_price_columns_use_case: BuildPriceColumnsUseCase,
+        build_price_history_index_use_case: BuildPriceHistoryIndexUseCase,
+    ) -> None:
+        self._build_price_columns_use_case = build_price_columns_use_case
+        self._build_price_history_index_use_case = build_price_history_index_use_case
+
+    def execute(self, prices: list[PriceEntry]) -> list[ReleaseStatistics]:
+        return self.calculate(
+            self._build_price_history_index_use_case.execute(self._build_price_columns_use_case.execute(prices))
+        )
+
+    def calculate(self, index: PriceHistoryIndex) -> list[ReleaseStatistics]:
+        """Same as ``execute`` over an index already built, ordered by release date."""
+        if not len(index.dollar_prices):
+            return []
+
+        order: numpy.ndarray = numpy.lexsort((index.dollar_prices, index.release_ordinals))
+        ordinals: numpy.ndarray = index.release_ordinals[order]
+        prices: numpy.ndarray = index.dollar_prices[order]
+        starts: numpy.ndarray = numpy.flatnonzero(numpy.concatenate(([True], ordinals[1:] != ordinals[:-1])))
+        counts: numpy.ndarray = numpy.diff(numpy.append(starts, len(prices)))
+        means: numpy.ndarray = numpy.add.reduceat(prices, starts) / counts
+        deviations: numpy.ndarray = prices - numpy.repeat(means, counts)
+        standard_deviations: numpy.ndarray = numpy.sqrt(numpy.add.reduceat(deviations * deviations, starts) / counts)
+        medians: numpy.ndarray = (prices[starts + (counts - 1) // 2] + prices[starts + counts // 2]) / 2
+
+        return [
+            ReleaseStatistics(
+                date=datetime.date.fromordinal(ordinal),
+                countries=countries,
+                mean=mean,
+                median=median,
+                standard_deviation=standard_deviation,
+                minimum=minimum,
+                maximum=maximum,
+            )
+            for ordinal, countries, mean, median, standard_deviation, minimum, maximum in zip(
+                ordinals[starts].tolist(),
+                counts.tolist(),
+                means.tolist(),
+                medians.tolist(),
+                standard_deviations.tolist(),
+                prices[starts].tolist(),
+                prices[starts + counts - 1].tolist(),
+            )
+        ]
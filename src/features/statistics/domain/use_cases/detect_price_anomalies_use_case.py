@@ -0,0 +1,97 @@
+import numpy
+
+from src.features.price_loading.entities.price_entry import PriceEntry
+from src.features.statistics.domain.entities.price_anomalies import PriceAnomalies
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+
+DEFAULT_TOLERANCE: float = 0.01
+DEFAULT_Z_THRESHOLD: float = 3.0
+MIN_CHANGES_FOR_Z_SCORES: int = 3
+
+
+class DetectPriceAnomaliesUseCase:
+    """Flags prices that disagree with their exchange rate and outlying jumps between releases."""
+    _build_price_columns_use_case: BuildPriceColumnsUseCase
+
+    def __init__(self, build_price_columns_use_case: BuildPriceColumnsUseCase) -> None:
+        self._build_price_columns_use_case = build_price_columns_use_case
+
+    def execute(
+        self,
+        prices: list[PriceEntry],
+        tolerance: float = DEFAULT_TOLERANCE,
+        z_threshold: float = DEFAULT_Z_THRESHOLD,
+    ) -> PriceAnomalies:
+        return self.calculate(self._build_price_columns_use_case.execute(prices), tolerance, z_threshold)
+
+    def calculate(
+        self,
+        columns: PriceColumns,
+        tolerance: float = DEFAULT_TOLERANCE,
+        z_threshold: float = DEFAULT_Z_THRESHOLD,
+    ) -> PriceAnomalies:
+        """Same as ``execute`` over columns already built."""
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            implied_dollar_prices: numpy.ndarray = columns.local_prices / columns.exchange_rates
+
+        order: numpy.ndarray = numpy.lexsort((columns.date_codes, columns.country_codes))
+        changes, z_scores, is_outlier = self._release_changes(
+            columns.country_codes[order],
+            columns.dollar_prices[order],
+            len(columns.countries),
+            z_threshold,
+        )
+        change_percentages: numpy.ndarray = numpy.empty(len(order))
+        change_z_scores: numpy.ndarray = numpy.empty(len(order))
+        is_change_outlier: numpy.ndarray = numpy.empty(len(order), dtype=bool)
+        change_percentages[order] = changes * 100
+        change_z_scores[order] = z_scores
+        is_change_outlier[order] = is_outlier
+
+        return PriceAnomalies(
+            columns=columns,
+            implied_dollar_prices=implied_dollar_prices,
+            is_inconsistent=~(
+                numpy.abs(implied_dollar_prices - columns.dollar_prices) <= tolerance * numpy.abs(columns.dollar_prices)
+            ),
+            change_percentages=change_percentages,
+            change_z_scores=change_z_scores,
+            is_outlier=is_change_outlier,
+        )
+
+    @staticmethod
+    def _release_changes(
+        country_codes: numpy.ndarray,
+        prices: numpy.ndarray,
+        countries: int,
+        z_threshold: float,
+    ) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """Relative changes, their z-scores and outlier flags of prices sorted by country and release date."""
+        has_previous: numpy.ndarray = numpy.concatenate(([False], country_codes[1:] == country_codes[:-1]))
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            changes: numpy.ndarray = numpy.where(
+                has_previous,
+                prices / numpy.concatenate(([numpy.nan], prices[:-1])) - 1,
+                numpy.nan,
+            )
+
+        is_finite: numpy.ndarray = numpy.isfinite(changes)
+        finite_changes: numpy.ndarray = numpy.where(is_finite, changes, 0.0)
+        counts: numpy.ndarray = numpy.bincount(country_codes, weights=is_finite, minlength=countries)
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            means: numpy.ndarray = numpy.bincount(country_codes, weights=finite_changes, minlength=countries) / counts
+            deviations: numpy.ndarray = numpy.where(is_finite, finite_changes - means[country_codes], 0.0)
+            standard_deviations: numpy.ndarray = numpy.sqrt(
+                numpy.bincount(country_codes, weights=deviations * deviations, minlength=countries) / counts
+            )
+            z_scores: numpy.ndarray = deviations / standard_deviations[country_codes]
+
+        has_z_score: numpy.ndarray = is_finite & (counts[country_codes] >= MIN_CHANGES_FOR_Z_SCORES) \
+            & (standard_deviations[country_codes] > 0)
+        z_scores = numpy.where(has_z_score, z_scores, numpy.nan)
+        is_outlier: numpy.ndarray = (numpy.abs(z_scores) > z_threshold) | (has_previous & ~is_finite)
+
+        return changes, z_scores, is_outlier
@@ -0,0 +1,33 @@
+from collections.abc import Sequence
+
+from src.features.price_loading.entities.price_entry import PriceEntry
+from src.features.statistics.domain.entities.country_quantile_sketches import CountryQuantileSketches
+from src.features.statistics.domain.entities.country_quantiles import CountryQuantiles
+
+
+class EstimateCountryQuantilesUseCase:
+    """Approximate dollar price quantiles of every country from KLL sketches mergeable across chunks."""
+    _k: int
+
+    def __init__(self, k: int = 200) -> None:
+        self._k = k
+
+    def execute(self, prices: list[PriceEntry], probabilities: Sequence[float]) -> list[CountryQuantiles]:
+        return self.summarize(self.sketch(prices), probabilities)
+
+    def sketch(self, prices: list[PriceEntry]) -> CountryQuantileSketches:
+        sketches: CountryQuantileSketches = CountryQuantileSketches(self._k)
+        sketches.update(prices)
+
+        return sketches
+
+    @staticmethod
+    def summarize(sketches: CountryQuantileSketches, probabilities: Sequence[float]) -> list[CountryQuantiles]:
+        return [
+            CountryQuantiles(
+                country=country,
+                prices=sketch.count,
+                quantiles={p: sketch.quantile(p) for p in probabilities},
+            )
+            for country, sketch in sketches.sketches.items()
+        ]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import dataclasses
+
+import numpy
+
+from src.core.utils.result import Result
+from src.features.price_loading.entities.price_entry import PriceEntry
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+
+DOLLAR_CURRENCY: str = 'USD'
+
+
+class RebasePricesUseCase:
+    """Rebases price columns onto a listed currency, dropping releases without a price in it."""
+    _build_price_columns_use_case: BuildPriceColumnsUseCase
+
+    def __init__(self, build_price_columns_use_case: BuildPriceColumnsUseCase) -> None:
+        self._build_price_columns_use_case = build_price_columns_use_case
+
+    def execute(
+        self,
+        prices: list[PriceEntry],
+        base_currency: str,
+    ) -> Result[PriceColumns, RebasePricesUseCaseFailure]:
+        return self.calculate(self._build_price_columns_use_case.execute(prices), base_currency)
+
+    @staticmethod
+    def calculate(columns: PriceColumns, base_currency: str) -> Result[PriceColumns, RebasePricesUseCaseFailure]:
+        """Same as ``execute`` over columns already built."""
+        if base_currency == DOLLAR_CURRENCY:
+            return Result.ok(columns)
+
+        if base_currency not in columns.currencies:
+            return Result.error(RebasePricesUseCaseFailure(details=f'No prices in {base_currency}'))
+
+        base_rows: numpy.ndarray = columns.currency_codes == columns.currencies.index(base_currency)
+        base_rates: numpy.ndarray = columns.release_values(base_rows, columns.exchange_rates)[columns.date_codes]
+        rebased: PriceColumns = dataclasses.replace(
+            columns,
+            dollar_prices=columns.dollar_prices * base_rates,
+            exchange_rates=columns.exchange_rates / base_rates,
+        )
+
+        return Result.ok(rebased.select(numpy.flatnonzero(~numpy.isnan(base_rates))))
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RebasePricesUseCaseFailure:
+    details: str
@@ -0,0 +1,82 @@
+import pathlib
+from collections.abc import Generator
+
+import pytest
+
+from benchmarks.dataset_generator import DatasetGenerator, DatasetSpec
+
+
+class TestDatasetGenerator:
+    _generator: DatasetGenerator
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._generator = DatasetGenerator()
+
+        yield
+
+        # Tear Down
+
+    def test_should_match_original_layout(self, tmp_path: pathlib.Path) -> None:
+        path: pathlib.Path = tmp_path.joinpath('prices.csv')
+        original_header: str = pathlib.Path('input/big_mac_prices.csv').read_text(encoding='utf-8').splitlines()[0]
+
+        self._generator.write(DatasetSpec(rows=3, countries=2, dates=2), path)
+
+        lines: list[str] = path.read_text(encoding='utf-8').splitlines()
+
+        assert lines[0] == original_header
+        assert lines[1].startswith('"2000-04-01",USD            ,United States       ,')
+        assert [len(line.split(',')[0]) for line in lines] == [12] * 4
+        assert lines[2].startswith('"2000-09-30",USD')
+
+    @pytest.mark.parametrize(
+        'spec',
+        [
+            DatasetSpec(rows=10),
+            DatasetSpec(rows=1000, countries=200, dates=5, seed=3),
+        ]
+    )
+    def test_should_be_deterministic(self, spec: DatasetSpec, tmp_path: pathlib.Path) -> None:
+        first: pathlib.Path = tmp_path.joinpath('first.csv')
+        second: pathlib.Path = tmp_path.joinpath('second.csv')
+
+        self._generator.write(spec, first)
+        self._generator.write(spec, second)
+
+        assert first.read_bytes() == second.read_bytes()
+        assert len(first.read_text(encoding='utf-8').splitlines()) == spec.rows + 1
+
+    def test_should_add_releases_rather_than_repeat_country_dates(self, tmp_path: pathlib.Path) -> None:
+        path: pathlib.Path = tmp_path.joinpath('prices.csv')
+
+        self._generator.write(DatasetSpec(rows=100, countries=3, dates=2), path)
+
+        lines: list[str] = path.read_text(encoding='utf-8').splitlines()[1:]
+        keys: list[tuple[str, str]] = [(line.split(',')[0], line.split(',')[2].strip()) for line in lines]
+
+        assert len(keys) == 100
+        assert len(set(keys)) == 100
+
+    @pytest.mark.parametrize(
+        'spec',
+        [
+            DatasetSpec(rows=1000),
+            DatasetSpec(rows=150, countries=20, dates=10),
+        ]
+    )
+    def test_should_hold_every_date_and_country(self, spec: DatasetSpec, tmp_path: pathlib.Path) -> None:
+        path: pathlib.Path = tmp_path.joinpath('prices.csv')
+
+        self._generator.write(spec, path)
+
+        lines: list[str] = path.read_text(encoding='utf-8').splitlines()[1:]
+
+        assert len({line.split(',')[0] for line in lines}) == spec.dates
+        assert len({line.split(',')[2] for line in lines}) == spec.countries
+        assert max(line.split(',')[0] for line in lines) < '"2100'
+
+    def test_should_reject_more_releases_than_days_available(self, tmp_path: pathlib.Path) -> None:
+        with pytest.raises(ValueError):
+            self._generator.write(DatasetSpec(rows=3_000_000, countries=1), tmp_path.joinpath('prices.csv'))
@@ -0,0 +1,85 @@
+import threading
+import typing
+from collections.abc import Generator
+
+import pytest
+
+from src.core.instrumentation.memory_profiler import MemoryProfiler, StageMemory
+
+
+class _Stage:
+    retained: list[bytes]
+
+    def __init__(self) -> None:
+        self.retained = []
+
+    def retain(self, amount: int) -> list[bytes]:
+        self.retained = [bytes(1024) for _ in range(amount)]
+        return self.retained
+
+    def transient(self, amount: int) -> list[int]:
+        scratch: list[bytes] = [bytes(1024) for _ in range(amount)]
+        return [len(scratch)]
+
+
+class TestMemoryProfiler:
+    _profiler: MemoryProfiler
+    _stage: _Stage
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._profiler = MemoryProfiler()
+        self._stage = _Stage()
+
+        yield
+
+        # Tear Down
+        self._profiler.stop_tracing()
+
+    def test_should_report_retained_allocations_as_net(self) -> None:
+        self._profiler.instrument(self._stage, 'retain')
+        self._stage.retain(100)
+
+        memory: StageMemory = self._profiler.stages[0]
+
+        assert memory.rows == 100
+        assert memory.net_bytes >= 100 * 1024
+        assert memory.peak_bytes >= memory.net_bytes
+        assert memory.bytes_per_row is not None and memory.bytes_per_row >= 1024
+
+    def test_should_report_transient_allocations_as_peak_only(self) -> None:
+        self._profiler.instrument(self._stage, 'transient')
+        self._stage.transient(100)
+
+        memory: StageMemory = self._profiler.stages[0]
+
+        assert memory.net_bytes < 10 * 1024
+        assert memory.peak_bytes >= 100 * 1024
+
+    def test_should_propagate_nested_peaks_to_parent(self) -> None:
+        self._profiler.instrument(self._stage, 'transient', stage='inner')
+        outer_stage: _Stage = _Stage()
+        setattr(outer_stage, 'retain', lambda amount: self._stage.transient(amount))
+        self._profiler.instrument(outer_stage, 'retain', stage='outer')
+
+        outer_stage.retain(100)
+
+        outer, inner = self._profiler.stages
+
+        assert (outer.stage, outer.depth, inner.stage, inner.depth) == ('outer', 0, 'inner', 1)
+        assert outer.peak_bytes >= inner.peak_bytes >= 100 * 1024
+
+    def test_should_nest_stages_per_thread(self) -> None:
+        self._profiler.instrument(self._stage, 'transient')
+        worker: threading.Thread = threading.Thread(target=self._stage.transient, args=(100,))
+
+        token: typing.Any = self._profiler.start('outer')
+        worker.start()
+        worker.join()
+        self._profiler.stop('outer', token, None)
+
+        outer, inner = self._profiler.stages
+
+        assert (outer.stage, outer.depth, inner.stage, inner.depth) == ('outer', 0, '_Stage.transient', 0)
+        assert inner.peak_bytes >= 100 * 1024
@@ -0,0 +1,99 @@
+import json
+import threading
+from collections.abc import Generator
+
+import pytest
+
+from src.core.instrumentation.stage_probe import count_single_row
+from src.core.instrumentation.tracer import Tracer, TraceSpan
+from src.core.utils.result import Result
+
+
+class _Stage:
+
+    def rows(self, amount: int) -> list[int]:
+        return list(range(amount))
+
+    async def rows_async(self, amount: int) -> Result[list[int], str]:
+        return Result.ok(self.rows(amount))
+
+    @staticmethod
+    def single(value: int) -> Result[int, str]:
+        return Result.ok(value) if value >= 0 else Result.error('negative')
+
+
+class TestTracer:
+    _tracer: Tracer
+    _stage: _Stage
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._tracer = Tracer()
+        self._stage = _Stage()
+
+        yield
+
+        # Tear Down
+
+    @pytest.mark.parametrize(
+        'amounts, expected_rows',
+        [
+            ([0], 0),
+            ([3], 3),
+            ([2, 5], 7),
+        ]
+    )
+    def test_should_count_calls_and_rows(self, amounts: list[int], expected_rows: int) -> None:
+        self._tracer.instrument(self._stage, 'rows')
+
+        for amount in amounts:
+            self._stage.rows(amount)
+
+        span: TraceSpan = self._tracer.spans[0]
+
+        assert span.stage == '_Stage.rows'
+        assert span.calls == len(amounts)
+        assert span.rows == expected_rows
+        assert span.wall_time_seconds >= 0
+        assert span.cpu_time_seconds >= 0
+
+    @pytest.mark.asyncio
+    async def test_should_trace_coroutines_and_nest_stages(self) -> None:
+        self._tracer.instrument(self._stage, 'rows_async', stage='outer')
+        self._tracer.instrument(self._stage, 'rows', stage='inner')
+
+        result: Result[list[int], str] = await self._stage.rows_async(4)
+
+        assert result.is_ok()
+        assert [(s.stage, s.depth, s.rows) for s in self._tracer.spans] == [('outer', 0, 4), ('inner', 1, 4)]
+
+    def test_should_nest_stages_per_thread(self) -> None:
+        self._tracer.instrument(self._stage, 'rows')
+        worker: threading.Thread = threading.Thread(target=self._stage.rows, args=(3,))
+
+        token: tuple[int, int] = self._tracer.start('outer')
+        worker.start()
+        worker.join()
+        self._tracer.stop('outer', token, None)
+
+        assert [(s.stage, s.depth, s.calls) for s in self._tracer.spans] == [('outer', 0, 1), ('_Stage.rows', 0, 1)]
+
+    def test_should_count_single_rows_only_when_ok(self) -> None:
+        self._tracer.instrument(self._stage, 'single', row_counter=count_single_row)
+
+        for value in (1, -1, 2):
+            self._stage.single(value)
+
+        assert self._tracer.spans[0].calls == 3
+        assert self._tracer.spans[0].rows == 2
+
+    def test_should_export_json_and_text(self) -> None:
+        self._tracer.instrument(self._stage, 'rows')
+        self._stage.rows(2)
+
+        exported: dict = json.loads(self._tracer.as_json())
+
+        assert exported['spans'][0]['stage'] == '_Stage.rows'
+        assert exported['spans'][0]['rows'] == 2
+        assert '_Stage.rows' in self._tracer.as_text()
@@ -0,0 +1,330 @@
+import datetime
+import json
+import typing
+from collections.abc import Generator
+
+import pytest
+
+from src.core.presentation.analytics_service_controller import AnalyticsServiceController
+from src.core.presentation.http_server import HttpRequest, HttpResponse
+from src.features.price_loading.domain.price_dataset_store import PriceDatasetStore
+from src.features.price_loading.domain.use_cases.load_prices_use_case import LoadPricesUseCase
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.group_key import CountryGroupKey, RegionGroupKey
+from src.features.statistics.domain.use_cases.aggregate_prices_use_case import AggregatePricesUseCase
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.build_price_history_index_use_case import \
+    BuildPriceHistoryIndexUseCase
+from src.features.statistics.domain.use_cases.build_price_matrix_use_case import BuildPriceMatrixUseCase
+from src.features.statistics.domain.use_cases.calculate_big_mac_index_use_case import CalculateBigMacIndexUseCase
+from src.features.statistics.domain.use_cases.calculate_country_quantiles_use_case import \
+    CalculateCountryQuantilesUseCase
+from src.features.statistics.domain.use_cases.calculate_price_change_between_dates_use_case import \
+    CalculatePriceChangeBetweenDatesUseCase
+from src.features.statistics.domain.use_cases.calculate_price_similarity_use_case import \
+    CalculatePriceSimilarityUseCase
+from src.features.statistics.domain.use_cases.calculate_price_trends_use_case import CalculatePriceTrendsUseCase
+from src.features.statistics.domain.use_cases.calculate_release_statistics_use_case import \
+    CalculateReleaseStatisticsUseCase
+from src.features.statistics.domain.use_cases.detect_price_anomalies_use_case import DetectPriceAnomaliesUseCase
+from src.features.statistics.domain.use_cases.estimate_country_quantiles_use_case import \
+    EstimateCountryQuantilesUseCase
+from src.features.statistics.domain.use_cases.rebase_prices_use_case import RebasePricesUseCase
+
+
+def _price(country_name: str, currency: str, dollars: float, year: int) -> PriceEntry:
+    return PriceEntry(
+        country_name=CountryName(value=country_name),
+        price=Price(
+            original_currency=OriginalCurrency(value=currency),
+            amount_in_original_currency=Amount(value=dollars * 2),
+            amount_in_dollars=Amount(value=dollars),
+            dollar_exchange_rate=ExchangeRate(value=2.0),
+        ),
+        date=datetime.date(year=year, month=1, day=1),
+    )
+
+
+class _FixedLoadPricesUseCase(LoadPricesUseCase):
+
+    def __init__(self) -> None:
+        super().__init__(price_repository=None)  # type: ignore
+
+    async def execute(self) -> list[PriceEntry]:
+        return [
+            _price('Argentina', 'ARS', 2.0, 2000),
+            _price('Brazil', 'BRL', 5.0, 2000),
+            _price('Argentina', 'ARS', 4.0, 2001),
+            _price('Argentina', 'ARS', 3.0, 2002),
+            _price('Brazil', 'BRL', 6.0, 2002),
+        ]
+
+
+def _request(path: str, **query: str) -> HttpRequest:
+    return HttpRequest(method='GET', path=path, query=query, headers={}, version='HTTP/1.1')
+
+
+class TestAnalyticsServiceController:
+    _controller: AnalyticsServiceController
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._controller = AnalyticsServiceController(
+            price_dataset_store=PriceDatasetStore(load_prices_use_case=_FixedLoadPricesUseCase()),
+            build_price_columns_use_case=BuildPriceColumnsUseCase(),
+            build_price_matrix_use_case=BuildPriceMatrixUseCase(),
+            build_price_history_index_use_case=BuildPriceHistoryIndexUseCase(),
+            calculate_price_change_between_dates_use_case=CalculatePriceChangeBetweenDatesUseCase(),
+            calculate_price_trends_use_case=CalculatePriceTrendsUseCase(
+                build_price_columns_use_case=BuildPriceColumnsUseCase(),
+                build_price_history_index_use_case=BuildPriceHistoryIndexUseCase(),
+            ),
+            calculate_release_statistics_use_case=CalculateReleaseStatisticsUseCase(
+                build_price_columns_use_case=BuildPriceColumnsUseCase(),
+                build_price_history_index_use_case=BuildPriceHistoryIndexUseCase(),
+            ),
+            aggregate_prices_use_case=AggregatePricesUseCase(build_price_columns_use_case=BuildPriceColumnsUseCase()),
+            group_keys=[CountryGroupKey(), RegionGroupKey({CountryName(value='Brazil'): 'Latin America'})],
+            calculate_country_quantiles_use_case=CalculateCountryQuantilesUseCase(
+                build_price_columns_use_case=BuildPriceColumnsUseCase(),
+            ),
+            estimate_country_quantiles_use_case=EstimateCountryQuantilesUseCase(),
+            calculate_big_mac_index_use_case=CalculateBigMacIndexUseCase(
+                build_price_columns_use_case=BuildPriceColumnsUseCase(),
+            ),
+            rebase_prices_use_case=RebasePricesUseCase(build_price_columns_use_case=BuildPriceColumnsUseCase()),
+            calculate_price_similarity_use_case=CalculatePriceSimilarityUseCase(
+                build_price_columns_use_case=BuildPriceColumnsUseCase(),
+                build_price_matrix_use_case=BuildPriceMatrixUseCase(),
+            ),
+            detect_price_anomalies_use_case=DetectPriceAnomaliesUseCase(
+                build_price_columns_use_case=BuildPriceColumnsUseCase(),
+            ),
+        )
+
+        yield
+
+        # Tear Down
+
+    async def _payload(self, path: str, **query: str) -> dict[str, typing.Any]:
+        response: HttpResponse = await self._controller.handle(_request(path, **query))
+
+        return {'status': response.status} | json.loads(response.body)
+
+    @pytest.mark.asyncio
+    async def test_price_matrix_should_use_null_for_missing_releases(self) -> None:
+        payload: dict[str, typing.Any] = await self._payload('/analytics/price-matrix')
+
+        assert payload['countries'] == ['Argentina', 'Brazil']
+        assert payload['dates'] == ['2000-01-01', '2001-01-01', '2002-01-01']
+        assert payload['currency'] == 'USD'
+        assert payload['prices'] == [[2.0, 4.0, 3.0], [5.0, None, 6.0]]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'query, expected',
+        [
+            ({'country': 'brazil'}, {'country': 'Brazil', 'prices': [5.0, 5.0, 6.0]}),
+            ({'date': '2001-01-01'}, {'date': '2001-01-01', 'prices': [4.0, 5.0]}),
+            ({'country': 'Brazil', 'date': '2001-01-01'}, {'country': 'Brazil', 'price': 5.0}),
+            ({'country': 'Brazil', 'date': '2002-01-01', 'currency': 'brl'}, {'currency': 'BRL', 'price': 12.0}),
+        ],
+    )
+    async def test_price_matrix_should_slice_the_forward_filled_matrix(
+        self,
+        query: dict[str, str],
+        expected: dict[str, typing.Any],
+    ) -> None:
+        payload: dict[str, typing.Any] = await self._payload('/analytics/price-matrix', forward_fill='true', **query)
+
+        assert payload['status'] == 200
+        assert {k: payload[k] for k in expected} == expected
+
+    @pytest.mark.asyncio
+    async def test_price_change_should_match_the_nearest_releases(self) -> None:
+        payload: dict[str, typing.Any] = await self._payload(
+            '/analytics/price-change',
+            **{'from': '1999-06-01', 'to': '2001-02-01', 'match': 'nearest'},
+        )
+
+        assert payload['items'] == [
+            {
+                'country_name': 'Argentina',
+                'start_date': '2000-01-01',
+                'end_date': '2001-01-01',
+                'start_dollar_price': 2.0,
+                'end_dollar_price': 4.0,
+                'percentage': 100.0,
+            },
+            {
+                'country_name': 'Brazil',
+                'start_date': '2000-01-01',
+                'end_date': '2002-01-01',
+                'start_dollar_price': 5.0,
+                'end_dollar_price': 6.0,
+                'percentage': 20.0,
+            },
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'query',
+        [{'from': '2000-01-01'}, {'from': '2000-01-01', 'to': '2002-01-01', 'match': 'closest'}],
+    )
+    async def test_price_change_should_reject_invalid_queries(self, query: dict[str, str]) -> None:
+        assert (await self._payload('/analytics/price-change', **query))['status'] == 400
+
+    @pytest.mark.asyncio
+    async def test_price_trends_should_list_every_release_of_the_country(self) -> None:
+        payload: dict[str, typing.Any] = await self._payload('/analytics/price-trends', window='2', country='brazil')
+
+        assert payload['window'] == 2
+        assert [i['country_name'] for i in payload['items']] == ['Brazil']
+        assert payload['items'][0]['compound_annual_growth_percentage'] == pytest.approx(9.54, abs=0.01)
+        assert payload['items'][0]['releases'] == [
+            {'date': '2000-01-01', 'dollar_price': 5.0, 'rolling_mean': None, 'year_over_year_percentage': None},
+            {'date': '2002-01-01', 'dollar_price': 6.0, 'rolling_mean': 5.5, 'year_over_year_percentage': None},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_release_statistics_should_be_filtered_by_date(self) -> None:
+        payload: dict[str, typing.Any] = await self._payload('/analytics/release-statistics', to='2001-12-31')
+
+        assert [(i['date'], i['countries'], i['median_dollar_price']) for i in payload['items']] == [
+            ('2000-01-01', 2, 3.5),
+            ('2001-01-01', 1, 4.0),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_aggregate_should_group_by_the_requested_key(self) -> None:
+        payload: dict[str, typing.Any] = await self._payload(
+            '/analytics/aggregate',
+            by='region',
+            reducers='count,last,first',
+        )
+
+        assert payload['items'] == [
+            {'region': 'Latin America', 'count': 2, 'last': 6.0, 'first': 5.0},
+            {'region': 'Other', 'count': 3, 'last': 3.0, 'first': 2.0},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_aggregate_should_rebase_prices_onto_the_requested_currency(self) -> None:
+        payload: dict[str, typing.Any] = await self._payload(
+            '/analytics/aggregate',
+            by='country',
+            reducers='count,mean',
+            currency='brl',
+        )
+
+        assert payload['currency'] == 'BRL'
+        assert payload['items'] == [
+            {'country': 'Argentina', 'count': 2, 'mean': 5.0},
+            {'country': 'Brazil', 'count': 2, 'mean': 11.0},
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'query',
+        [{'by': 'continent'}, {'reducers': 'mean,mode'}, {'field': 'price'}, {'currency': 'EUR'}],
+    )
+    async def test_aggregate_should_reject_invalid_queries(self, query: dict[str, str]) -> None:
+        assert (await self._payload('/analytics/aggregate', **query))['status'] == 400
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('mode, median', [('exact', 3.0), ('approximate', 3.0)])
+    async def test_quantiles_should_give_the_median_of_a_country(self, mode: str, median: float) -> None:
+        payload: dict[str, typing.Any] = await self._payload(
+            '/analytics/quantiles',
+            probabilities='0.5',
+            mode=mode,
+            country='Argentina',
+        )
+
+        assert payload['items'] == [
+            {'country_name': 'Argentina', 'prices': 3, 'quantiles': [{'probability': 0.5, 'price': median}]}
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'query',
+        [
+            {'probabilities': '1.5'},
+            {'probabilities': 'half'},
+            {'mode': 'fast'},
+            {'mode': 'approximate', 'currency': 'BRL'},
+        ],
+    )
+    async def test_quantiles_should_reject_invalid_queries(self, query: dict[str, str]) -> None:
+        assert (await self._payload('/analytics/quantiles', **query))['status'] == 400
+
+    @pytest.mark.asyncio
+    async def test_big_mac_index_should_value_currencies_against_the_base_country(self) -> None:
+        payload: dict[str, typing.Any] = await self._payload('/analytics/big-mac-index', base='argentina')
+
+        assert payload['base_country'] == 'Argentina'
+        assert [(i['date'], i['country_name'], i['implied_ppp_rate'], i['valuation_percentage'])
+                for i in payload['items']] == [
+            ('2000-01-01', 'Argentina', 1.0, 0.0),
+            ('2000-01-01', 'Brazil', 2.5, 150.0),
+            ('2001-01-01', 'Argentina', 1.0, 0.0),
+            ('2002-01-01', 'Argentina', 1.0, 0.0),
+            ('2002-01-01', 'Brazil', 2.0, 100.0),
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('query', [{}, {'base': 'Atlantis'}, {'date': '2001-06-01', 'base': 'Brazil'}])
+    async def test_big_mac_index_should_reject_invalid_queries(self, query: dict[str, str]) -> None:
+        assert (await self._payload('/analytics/big-mac-index', **query))['status'] == 400
+
+    @pytest.mark.asyncio
+    async def test_similar_countries_should_rank_the_neighbours_of_a_country(self) -> None:
+        payload: dict[str, typing.Any] = await self._payload(
+            '/analytics/similar-countries',
+            country='argentina',
+            measure='cosine',
+            min_common_releases='2',
+        )
+
+        assert payload['country_name'] == 'Argentina'
+        assert payload['items'] == [
+            {'country_name': 'Brazil', 'similarity': pytest.approx(28 / (13 * 61) ** 0.5), 'common_releases': 2}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_similar_countries_should_leave_out_countries_sharing_too_few_releases(self) -> None:
+        payload: dict[str, typing.Any] = await self._payload('/analytics/similar-countries', country='Brazil')
+
+        assert payload['items'] == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('query', [{}, {'country': 'Atlantis'}, {'country': 'Brazil', 'k': '0'}])
+    async def test_similar_countries_should_reject_invalid_queries(self, query: dict[str, str]) -> None:
+        assert (await self._payload('/analytics/similar-countries', **query))['status'] == 400
+
+    @pytest.mark.asyncio
+    async def test_anomalies_should_be_empty_for_consistent_prices(self) -> None:
+        payload: dict[str, typing.Any] = await self._payload('/analytics/anomalies', tolerance='0')
+
+        assert (payload['inconsistent_prices'], payload['price_jumps'], payload['items']) == (0, 0, [])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('query', [{'tolerance': '-0.1'}, {'z_threshold': 'high'}, {'country': 'Atlantis'}])
+    async def test_anomalies_should_reject_invalid_queries(self, query: dict[str, str]) -> None:
+        assert (await self._payload('/analytics/anomalies', **query))['status'] == 400
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'query',
+        [{'country': 'Atlantis'}, {'date': '2001-06-01'}, {'date': 'yesterday'}, {'sort': 'asc'}],
+    )
+    async def test_invalid_queries_should_be_rejected(self, query: dict[str, str]) -> None:
+        payload: dict[str, typing.Any] = await self._payload('/analytics/price-matrix', **query)
+
+        assert payload['status'] == 400
+
+    @pytest.mark.asyncio
+    async def test_unknown_paths_should_not_be_found(self) -> None:
+        assert (await self._payload('/analytics/unknown'))['status'] == 404
@@ -0,0 +1,190 @@
+import dataclasses
+import datetime
+import io
+import json
+import typing
+from collections.abc import Generator
+
+import decoy
+import pytest
+
+from src.core.presentation.batch_report_runner import BatchOutputFormat, BatchReport, BatchReportRunner
+from src.core.presentation.export_schema import PRICE_ENTRY_SCHEMA, ExportSchema
+from src.core.presentation.report_name import ReportName
+from src.core.utils.result import Error, Result
+from src.features.price_loading.domain.use_cases.load_prices_use_case import (
+    LoadPricesUseCase,
+    LoadPricesUseCaseDependenciesFailure,
+)
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+
+_PRICE: PriceEntry = PriceEntry(
+    country_name=CountryName(value='Argentina'),
+    price=Price(
+        original_currency=OriginalCurrency(value='ARS'),
+        amount_in_original_currency=Amount(value=2.5),
+        amount_in_dollars=Amount(value=2.5),
+        dollar_exchange_rate=ExchangeRate(value=1.0),
+    ),
+    date=datetime.date(year=2000, month=4, day=1),
+)
+
+_COUNT_REPORT: BatchReport = BatchReport(
+    name=ReportName.RAW_DATA,
+    compute=lambda prices: [len(prices)],
+    as_lines=lambda counts: (f'count: {c}' for c in counts),
+    schema=ExportSchema(columns=('count',), as_row=lambda count: (count,)),
+)
+
+_OTHER_COUNT_REPORT: BatchReport = dataclasses.replace(_COUNT_REPORT, name=ReportName.AVERAGE_PRICE_PER_COUNTRY)
+
+
+class TestBatchReportRunner:
+    _decoy: decoy.Decoy
+    _dummy_load_prices_use_case: LoadPricesUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._decoy = decoy.Decoy()
+        self._dummy_load_prices_use_case = self._decoy.mock(cls=LoadPricesUseCase)
+
+        yield
+
+        # Tear Down
+        self._decoy.reset()
+
+    @pytest.mark.asyncio
+    async def test_should_write_text_reports_in_order(self) -> None:
+        output: io.StringIO = io.StringIO()
+        runner: BatchReportRunner = BatchReportRunner(
+            load_prices_use_case=self._dummy_load_prices_use_case,
+            reports=[_COUNT_REPORT, _OTHER_COUNT_REPORT],
+            output_format=BatchOutputFormat.TEXT,
+        )
+
+        self._decoy.when(
+            await self._dummy_load_prices_use_case.try_execute()
+        ).then_return(Result.ok([_PRICE, _PRICE]))
+
+        await runner.run(output)
+
+        lines: list[str] = output.getvalue().splitlines()
+
+        assert lines[0].strip('-') == ' raw-data '
+        assert lines[1:3] == ['count: 2', '']
+        assert lines[3].strip('-') == ' average-price-per-country '
+        assert lines[4:6] == ['count: 2', '']
+
+    @pytest.mark.asyncio
+    async def test_should_write_flattened_json(self) -> None:
+        output: io.StringIO = io.StringIO()
+        runner: BatchReportRunner = BatchReportRunner(
+            load_prices_use_case=self._dummy_load_prices_use_case,
+            reports=[
+                BatchReport(
+                    name=ReportName.RAW_DATA,
+                    compute=lambda prices: prices,
+                    as_lines=iter,
+                    schema=PRICE_ENTRY_SCHEMA,
+                ),
+            ],
+            output_format=BatchOutputFormat.JSON,
+        )
+
+        self._decoy.when(
+            await self._dummy_load_prices_use_case.try_execute()
+        ).then_return(Result.ok([_PRICE]))
+
+        await runner.run(output)
+
+        assert json.loads(output.getvalue()) == {
+            'raw-data': [
+                {
+                    'date': '2000-04-01',
+                    'country_name': 'Argentina',
+                    'currency_code': 'ARS',
+                    'local_price': 2.5,
+                    'dollar_exchange_rate': 1.0,
+                    'dollar_price': 2.5,
+                }
+            ]
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_write_a_report_requested_twice_once(self) -> None:
+        output: io.StringIO = io.StringIO()
+        runner: BatchReportRunner = BatchReportRunner(
+            load_prices_use_case=self._dummy_load_prices_use_case,
+            reports=[_COUNT_REPORT, _OTHER_COUNT_REPORT, dataclasses.replace(_COUNT_REPORT, compute=lambda _: [0])],
+            output_format=BatchOutputFormat.JSON,
+        )
+
+        self._decoy.when(
+            await self._dummy_load_prices_use_case.try_execute()
+        ).then_return(Result.ok([_PRICE]))
+
+        await runner.run(output)
+
+        assert json.loads(output.getvalue(), object_pairs_hook=list) == [
+            ('raw-data', [[('count', 1)]]),
+            ('average-price-per-country', [[('count', 1)]]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_write_one_json_line_per_entry(self) -> None:
+        output: io.StringIO = io.StringIO()
+        runner: BatchReportRunner = BatchReportRunner(
+            load_prices_use_case=self._dummy_load_prices_use_case,
+            reports=[_COUNT_REPORT, _OTHER_COUNT_REPORT],
+            output_format=BatchOutputFormat.JSON_LINES,
+        )
+
+        self._decoy.when(
+            await self._dummy_load_prices_use_case.try_execute()
+        ).then_return(Result.ok([_PRICE]))
+
+        await runner.run(output)
+
+        assert [json.loads(line) for line in output.getvalue().splitlines()] == [
+            {'report': 'raw-data', 'count': 1},
+            {'report': 'average-price-per-country', 'count': 1},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_write_csv_blocks_per_report(self) -> None:
+        output: io.StringIO = io.StringIO()
+        runner: BatchReportRunner = BatchReportRunner(
+            load_prices_use_case=self._dummy_load_prices_use_case,
+            reports=[_COUNT_REPORT, _OTHER_COUNT_REPORT],
+            output_format=BatchOutputFormat.CSV,
+        )
+
+        self._decoy.when(
+            await self._dummy_load_prices_use_case.try_execute()
+        ).then_return(Result.ok([_PRICE, _PRICE]))
+
+        await runner.run(output)
+
+        assert output.getvalue() == 'count\n2\n\ncount\n2\n'
+
+    @pytest.mark.asyncio
+    async def test_should_return_the_load_failure_without_writing_reports(self) -> None:
+        output: io.StringIO = io.StringIO()
+        failure: LoadPricesUseCaseDependenciesFailure = LoadPricesUseCaseDependenciesFailure(reason='missing')
+        runner: BatchReportRunner = BatchReportRunner(
+            load_prices_use_case=self._dummy_load_prices_use_case,
+            reports=[_COUNT_REPORT],
+            output_format=BatchOutputFormat.TEXT,
+        )
+
+        self._decoy.when(
+            await self._dummy_load_prices_use_case.try_execute()
+        ).then_return(Result.error(failure))
+
+        result: Result = await runner.run(output)
+
+        assert result.is_err()
+        assert typing.cast(Error, result).value == failure
+        assert output.getvalue() == ''
@@ -0,0 +1,139 @@
+import asyncio
+import dataclasses
+import gzip
+import typing
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from src.core.presentation.http_server import HttpRequest, HttpResponse, HttpRouter, HttpServer
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple[str, dict[str, str], bytes]:
+    status_line: str = (await reader.readline()).decode('latin-1').strip()
+    headers: dict[str, str] = {}
+
+    while line := (await reader.readline()).decode('latin-1').strip():
+        name, _, value = line.partition(':')
+        headers[name.casefold()] = value.strip()
+
+    return status_line, headers, await reader.readexactly(int(headers['content-length']))
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    requests: list[HttpRequest]
+
+
+@pytest_asyncio.fixture
+async def connection() -> AsyncGenerator[_Connection, None]:
+    requests: list[HttpRequest] = []
+
+    async def handle(request: HttpRequest) -> HttpResponse:
+        requests.append(request)
+
+        return HttpResponse(status=200, body=b'x' * int(request.query.get('size', '2')))
+
+    server: asyncio.Server = await HttpServer(handler=handle, idle_timeout_seconds=1).start('127.0.0.1', 0)
+    reader, writer = await asyncio.open_connection('127.0.0.1', server.sockets[0].getsockname()[1])
+
+    yield _Connection(reader=reader, writer=writer, requests=requests)
+
+    writer.close()
+    await writer.wait_closed()
+    await asyncio.sleep(0.05)
+    server.close()
+    await server.wait_closed()
+
+
+class TestHttpServer:
+
+    @pytest.mark.asyncio
+    async def test_should_answer_several_requests_on_one_connection(self, connection: _Connection) -> None:
+        connection.writer.write(b'GET /a?size=3 HTTP/1.1\r\nHost: x\r\n\r\nGET /b%20c HTTP/1.1\r\nHost: x\r\n\r\n')
+
+        first: tuple[str, dict[str, str], bytes] = await _read_response(connection.reader)
+        second: tuple[str, dict[str, str], bytes] = await _read_response(connection.reader)
+
+        assert first[0] == 'HTTP/1.1 200 OK'
+        assert first[1]['connection'] == 'keep-alive'
+        assert (first[2], second[2]) == (b'xxx', b'xx')
+        assert [r.path for r in connection.requests] == ['/a', '/b c']
+
+    @pytest.mark.asyncio
+    async def test_should_close_when_asked(self, connection: _Connection) -> None:
+        connection.writer.write(b'GET / HTTP/1.1\r\nConnection: close\r\n\r\n')
+
+        _, headers, _ = await _read_response(connection.reader)
+
+        assert headers['connection'] == 'close'
+        assert await connection.reader.read() == b''
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'size,accept_encoding,compressed',
+        [(4096, 'gzip, deflate', True), (4096, 'identity', False), (10, 'gzip', False)],
+    )
+    async def test_should_gzip_large_bodies_for_accepting_clients(
+        self,
+        connection: _Connection,
+        size: int,
+        accept_encoding: str,
+        compressed: bool,
+    ) -> None:
+        connection.writer.write(f'GET /?size={size} HTTP/1.1\r\nAccept-Encoding: {accept_encoding}\r\n\r\n'.encode())
+
+        _, headers, body = await _read_response(connection.reader)
+
+        assert (headers.get('content-encoding') == 'gzip') == compressed
+        assert (gzip.decompress(body) if compressed else body) == b'x' * size
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'raw_request,status',
+        [(b'POST / HTTP/1.1\r\nContent-Length: 2\r\n\r\nab', 405), (b'nonsense\r\n\r\n', 400)],
+    )
+    async def test_should_reject_unsupported_requests(
+        self,
+        connection: _Connection,
+        raw_request: bytes,
+        status: int,
+    ) -> None:
+        connection.writer.write(raw_request)
+
+        status_line, _, _ = await _read_response(connection.reader)
+
+        assert status_line.split()[1] == str(status)
+        assert not connection.requests
+
+
+class TestHttpRouter:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'path, expected',
+        [
+            ('/analytics', b'analytics'),
+            ('/analytics/price-matrix', b'analytics'),
+            ('/analytics/price-matrix/x', b'matrix'),
+            ('/analyticsx', b'default'),
+            ('/status', b'default'),
+        ],
+    )
+    async def test_should_route_to_the_longest_matching_prefix(self, path: str, expected: bytes) -> None:
+        def answer(body: bytes) -> typing.Callable[[HttpRequest], typing.Awaitable[HttpResponse]]:
+            async def handle(_: HttpRequest) -> HttpResponse:
+                return HttpResponse(status=200, body=body)
+
+            return handle
+
+        router: HttpRouter = HttpRouter(
+            routes={'/analytics': answer(b'analytics'), '/analytics/price-matrix/': answer(b'matrix')},
+            default=answer(b'default'),
+        )
+        request: HttpRequest = HttpRequest(method='GET', path=path, query={}, headers={}, version='HTTP/1.1')
+
+        assert (await router.handle(request)).body == expected
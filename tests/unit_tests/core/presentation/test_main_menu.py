@@ -0,0 +1,76 @@
+import asyncio
+import threading
+from collections.abc import Generator, Iterator
+
+import decoy
+import pytest
+
+from src.core.presentation.main_menu import MainMenu
+from src.core.presentation.main_menu_controller import MainMenuController
+
+
+class TestMainMenu:
+    _decoy: decoy.Decoy
+    _dummy_controller: MainMenuController
+    _menu: MainMenu
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._decoy = decoy.Decoy()
+        self._dummy_controller = self._decoy.mock(cls=MainMenuController)
+        self._menu = MainMenu(main_menu_controller=self._dummy_controller)
+
+        yield
+
+        # Tear Down
+        self._decoy.reset()
+
+    @pytest.mark.parametrize(
+        'amount_of_lines',
+        [
+            0,
+            1,
+            50_000,
+        ]
+    )
+    def test_should_write_every_streamed_line(self, amount_of_lines: int, capsys: pytest.CaptureFixture[str]) -> None:
+        lines: list[str] = [f'line {i}' for i in range(amount_of_lines)]
+
+        self._menu._display_lines(iter(lines))
+
+        assert capsys.readouterr().out.splitlines() == lines
+
+    def test_should_write_before_the_stream_is_exhausted(self, capsys: pytest.CaptureFixture[str]) -> None:
+        written_before_end: list[str] = []
+
+        def lines() -> Iterator[str]:
+            for i in range(20_000):
+                yield f'line {i}'
+
+            written_before_end.append(capsys.readouterr().out)
+
+        self._menu._display_lines(lines())
+
+        assert written_before_end[0].startswith('line 0\n')
+
+    @pytest.mark.asyncio
+    async def test_should_read_a_line_from_the_prompt(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr('builtins.input', lambda message: f'{message}2')
+
+        assert await self._menu._read_input('Option: ') == 'Option: 2'
+
+    @pytest.mark.asyncio
+    async def test_cancelled_reads_should_not_hold_up_the_exit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        typed: threading.Event = threading.Event()
+        monkeypatch.setattr('builtins.input', lambda _: str(typed.wait(timeout=5)))
+
+        read: asyncio.Task[str] = asyncio.create_task(self._menu._read_input('Option: '))
+        await asyncio.sleep(0.01)
+        read.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await read
+
+        assert all(t.daemon for t in threading.enumerate() if t.name == 'menu-input')
+        typed.set()
@@ -0,0 +1,149 @@
+import asyncio
+import datetime
+import threading
+from collections.abc import Generator
+
+import pytest
+
+from src.core.presentation.main_menu_controller import MainMenuController
+from src.core.presentation.rendered_report_cache import RenderedReportCache
+from src.core.presentation.view_models.main_menu_view_model import MainMenuViewModel
+from src.features.price_loading.domain.price_dataset_store import PriceDatasetStore
+from src.features.price_loading.domain.use_cases.load_prices_use_case import LoadPricesUseCase
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.use_cases.build_full_report_use_case import BuildFullReportUseCase
+from src.features.statistics.domain.use_cases.calculate_average_price_per_country_use_case import \
+    CalculateAveragePricePerCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_cheapest_country_use_case import CalculateCheapestCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_most_expensive_country_use_case import \
+    CalculateMostExpensiveCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_price_change_use_case import CalculatePriceChangeUseCase
+from src.features.statistics.domain.use_cases.get_extremities_per_country_use_case import \
+    GetExtremitiesPerCountryUseCase
+
+_PRICE: PriceEntry = PriceEntry(
+    country_name=CountryName(value='Argentina'),
+    price=Price(
+        original_currency=OriginalCurrency(value='ARS'),
+        amount_in_original_currency=Amount(value=2.5),
+        amount_in_dollars=Amount(value=2.5),
+        dollar_exchange_rate=ExchangeRate(value=1.0),
+    ),
+    date=datetime.date(year=2000, month=4, day=1),
+)
+
+
+class _BlockingLoadPricesUseCase(LoadPricesUseCase):
+    release: threading.Event
+    calls: int
+
+    def __init__(self) -> None:
+        super().__init__(price_repository=None)  # type: ignore
+        self.release = threading.Event()
+        self.calls = 0
+
+    async def execute(self) -> list[PriceEntry]:
+        self.calls += 1
+        self.release.wait(timeout=5)
+
+        return [_PRICE]
+
+
+class TestMainMenuController:
+    _load_prices_use_case: _BlockingLoadPricesUseCase
+    _price_dataset_store: PriceDatasetStore
+    _controller: MainMenuController
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._load_prices_use_case = _BlockingLoadPricesUseCase()
+        self._price_dataset_store = PriceDatasetStore(load_prices_use_case=self._load_prices_use_case)
+        self._controller = MainMenuController(
+            price_dataset_store=self._price_dataset_store,
+            calculate_average_price_per_country_use_case=CalculateAveragePricePerCountryUseCase(),
+            calculate_most_expensive_country_use_case=CalculateMostExpensiveCountryUseCase(),
+            calculate_cheapest_country_use_case=CalculateCheapestCountryUseCase(),
+            get_extremities_per_country_use_case=GetExtremitiesPerCountryUseCase(),
+            calculate_price_change_use_case=CalculatePriceChangeUseCase(),
+            build_full_report_use_case=BuildFullReportUseCase(
+                calculate_most_expensive_country_use_case=CalculateMostExpensiveCountryUseCase(),
+                calculate_cheapest_country_use_case=CalculateCheapestCountryUseCase(),
+                calculate_price_change_use_case=CalculatePriceChangeUseCase(),
+            ),
+            rendered_report_cache=RenderedReportCache(),
+        )
+
+        yield
+
+        # Tear Down
+        self._load_prices_use_case.release.set()
+
+    @pytest.mark.asyncio
+    async def test_display_should_not_wait_for_prices(self) -> None:
+        view_model: MainMenuViewModel = await asyncio.wait_for(self._controller.display(), timeout=1)
+
+        assert view_model.title.strip('-') == ' Big Mac Prices '
+
+        self._load_prices_use_case.release.set()
+        await self._controller.load_prices()
+
+    @pytest.mark.asyncio
+    async def test_selected_report_should_await_the_background_load_once(self) -> None:
+        await self._controller.display()
+        await self._controller.display()
+
+        report: asyncio.Task = asyncio.create_task(self._controller.on_option_selected('2'))
+        await asyncio.sleep(0.01)
+
+        assert not report.done()
+
+        self._load_prices_use_case.release.set()
+        lines: list[str] = list(await report)
+
+        assert lines[1:] == ['Country: Argentina', 'Average price in USD: 2.50']
+        assert self._load_prices_use_case.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_reload_should_keep_serving_the_previous_prices(self) -> None:
+        self._load_prices_use_case.release.set()
+        await self._controller.load_prices()
+        self._load_prices_use_case.release.clear()
+
+        reload_lines: list[str] = list(await self._controller.on_option_selected('7'))
+        report_lines: list[str] = list(await asyncio.wait_for(self._controller.on_option_selected('2'), timeout=1))
+
+        assert reload_lines == ['Reloading data in the background, reports use the current data until it finishes']
+        assert report_lines[1:] == ['Country: Argentina', 'Average price in USD: 2.50']
+        assert self._price_dataset_store.is_reloading
+
+        self._load_prices_use_case.release.set()
+        await self._price_dataset_store.load()
+
+    @pytest.mark.asyncio
+    async def test_repeated_report_should_be_served_from_the_cache_until_reloaded(self) -> None:
+        self._load_prices_use_case.release.set()
+
+        first: list[str] = list(await self._controller.on_option_selected('2'))
+        second: list[str] = list(await self._controller.on_option_selected('2'))
+
+        assert first == second
+        assert self._controller.report_cache_statistics.hits == 1
+
+        await self._price_dataset_store.reload()
+
+        assert list(await self._controller.on_option_selected('2')) == first
+        assert self._controller.report_cache_statistics.hits == 1
+        assert self._controller.report_cache_statistics.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_raw_data_should_stream_without_being_cached(self) -> None:
+        self._load_prices_use_case.release.set()
+
+        first: list[str] = list(await self._controller.on_option_selected('1'))
+        second: list[str] = list(await self._controller.on_option_selected('1'))
+
+        assert first == second
+        assert self._controller.report_cache_statistics.misses == 0
+        assert self._controller.report_cache_statistics.entries == 0
@@ -0,0 +1,164 @@
+import datetime
+import json
+import typing
+from collections.abc import Generator
+
+import pytest
+
+from src.core.presentation.http_server import HttpRequest, HttpResponse
+from src.core.presentation.price_service_controller import PriceServiceController
+from src.core.presentation.rendered_report_cache import RenderedReportCache
+from src.features.price_loading.domain.price_dataset_store import PriceDatasetStore
+from src.features.price_loading.domain.use_cases.load_prices_use_case import LoadPricesUseCase
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.use_cases.build_full_report_use_case import BuildFullReportUseCase
+from src.features.statistics.domain.use_cases.calculate_average_price_per_country_use_case import \
+    CalculateAveragePricePerCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_cheapest_country_use_case import CalculateCheapestCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_most_expensive_country_use_case import \
+    CalculateMostExpensiveCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_price_change_use_case import CalculatePriceChangeUseCase
+from src.features.statistics.domain.use_cases.get_extremities_per_country_use_case import \
+    GetExtremitiesPerCountryUseCase
+
+
+def _price(country_name: str, currency: str, dollars: float, year: int) -> PriceEntry:
+    return PriceEntry(
+        country_name=CountryName(value=country_name),
+        price=Price(
+            original_currency=OriginalCurrency(value=currency),
+            amount_in_original_currency=Amount(value=dollars * 2),
+            amount_in_dollars=Amount(value=dollars),
+            dollar_exchange_rate=ExchangeRate(value=2.0),
+        ),
+        date=datetime.date(year=year, month=1, day=1),
+    )
+
+
+class _FixedLoadPricesUseCase(LoadPricesUseCase):
+
+    def __init__(self) -> None:
+        super().__init__(price_repository=None)  # type: ignore
+
+    async def execute(self) -> list[PriceEntry]:
+        return [
+            _price('Argentina', 'ARS', 2.0, 2000),
+            _price('Brazil', 'BRL', 5.0, 2000),
+            _price('Argentina', 'ARS', 4.0, 2001),
+            _price('Brazil', 'BRL', 6.0, 2001),
+            _price('Argentina', 'ARS', 3.0, 2002),
+        ]
+
+
+def _request(path: str, **query: str) -> HttpRequest:
+    return HttpRequest(method='GET', path=path, query=query, headers={}, version='HTTP/1.1')
+
+
+def _payload(response: HttpResponse) -> dict[str, typing.Any]:
+    return json.loads(response.body)
+
+
+class TestPriceServiceController:
+    _cache: RenderedReportCache
+    _controller: PriceServiceController
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._cache = RenderedReportCache()
+        self._controller = PriceServiceController(
+            price_dataset_store=PriceDatasetStore(load_prices_use_case=_FixedLoadPricesUseCase()),
+            calculate_average_price_per_country_use_case=CalculateAveragePricePerCountryUseCase(),
+            calculate_most_expensive_country_use_case=CalculateMostExpensiveCountryUseCase(),
+            calculate_cheapest_country_use_case=CalculateCheapestCountryUseCase(),
+            get_extremities_per_country_use_case=GetExtremitiesPerCountryUseCase(),
+            calculate_price_change_use_case=CalculatePriceChangeUseCase(),
+            build_full_report_use_case=BuildFullReportUseCase(
+                calculate_most_expensive_country_use_case=CalculateMostExpensiveCountryUseCase(),
+                calculate_cheapest_country_use_case=CalculateCheapestCountryUseCase(),
+                calculate_price_change_use_case=CalculatePriceChangeUseCase(),
+            ),
+            rendered_report_cache=self._cache,
+        )
+
+        yield
+
+        # Tear Down
+
+    @pytest.mark.asyncio
+    async def test_raw_data_should_filter_and_paginate(self) -> None:
+        response: HttpResponse = await self._controller.handle(
+            _request('/raw-data', country='argentina', **{'from': '2001-01-01', 'page': '2', 'page_size': '1'})
+        )
+        payload: dict[str, typing.Any] = _payload(response)
+
+        assert response.status == 200
+        assert (payload['total'], payload['pages'], payload['page']) == (2, 2, 2)
+        assert payload['items'] == [
+            {
+                'date': '2002-01-01',
+                'country_name': 'Argentina',
+                'currency_code': 'ARS',
+                'local_price': 6.0,
+                'dollar_exchange_rate': 2.0,
+                'dollar_price': 3.0,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reports_should_return_statistics(self) -> None:
+        averages: dict[str, typing.Any] = _payload(
+            await self._controller.handle(_request('/average-price-per-country'))
+        )
+        cheapest: dict[str, typing.Any] = _payload(await self._controller.handle(_request('/cheapest-country')))
+        most_expensive: dict[str, typing.Any] = _payload(
+            await self._controller.handle(_request('/most-expensive-country/'))
+        )
+
+        assert averages['items'] == [
+            {'country_name': 'Argentina', 'average_dollar_price': 3.0},
+            {'country_name': 'Brazil', 'average_dollar_price': 5.5},
+        ]
+        assert cheapest['item']['country_name'] == 'Argentina'
+        assert most_expensive['item']['country_name'] == 'Brazil'
+
+    @pytest.mark.asyncio
+    async def test_full_report_should_hold_every_report(self) -> None:
+        payload: dict[str, typing.Any] = _payload(await self._controller.handle(_request('/full-report')))
+
+        assert payload['summary'] == {
+            'prices': 5,
+            'countries': 2,
+            'first_date': '2000-01-01',
+            'last_date': '2002-01-01',
+        }
+        assert payload['cheapest_country']['country_name'] == 'Argentina'
+        assert payload['most_expensive_country']['country_name'] == 'Brazil'
+        assert len(payload['average_price_per_country']) == len(payload['price_change_per_country']) == 2
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_should_be_served_from_the_cache(self) -> None:
+        first: HttpResponse = await self._controller.handle(_request('/price-change-per-country'))
+        second: HttpResponse = await self._controller.handle(_request('/price-change-per-country'))
+
+        assert first.body == second.body
+        assert self._cache.statistics.hits == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'request_,status',
+        [
+            (_request('/unknown'), 404),
+            (_request('/raw-data', page='0'), 400),
+            (_request('/raw-data', page_size='5000'), 400),
+            (_request('/raw-data', **{'to': '01/01/2000'}), 400),
+            (_request('/raw-data', sort='date'), 400),
+            (_request('/cheapest-country', page='1'), 400),
+        ],
+    )
+    async def test_invalid_requests_should_be_rejected(self, request_: HttpRequest, status: int) -> None:
+        response: HttpResponse = await self._controller.handle(request_)
+
+        assert response.status == status
+        assert 'error' in _payload(response)
@@ -0,0 +1,82 @@
+import datetime
+import typing
+
+import pytest
+
+from src.core.presentation.raw_data_pager import RawDataPager
+from src.core.utils.option import Option, Some
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+
+
+def _price_entry(country: str) -> PriceEntry:
+    return PriceEntry(
+        country_name=CountryName(value=country),
+        price=Price(
+            original_currency=OriginalCurrency(value='ARS'),
+            amount_in_original_currency=Amount(value=1.0),
+            amount_in_dollars=Amount(value=1.0),
+            dollar_exchange_rate=ExchangeRate(value=1.0),
+        ),
+        date=datetime.date(year=2000, month=4, day=1),
+    )
+
+
+class TestRawDataPager:
+
+    @pytest.mark.parametrize(
+        'amount_of_entries, page_size, expected_page_count, expected_last_bounds',
+        [
+            (0, 3, 1, (0, 0)),
+            (1, 3, 1, (0, 1)),
+            (3, 3, 1, (0, 3)),
+            (7, 3, 3, (6, 7)),
+        ]
+    )
+    def test_should_precompute_page_bounds(
+        self,
+        amount_of_entries: int,
+        page_size: int,
+        expected_page_count: int,
+        expected_last_bounds: tuple[int, int],
+    ) -> None:
+        pager: RawDataPager = RawDataPager([_price_entry('a')] * amount_of_entries, page_size)
+
+        assert pager.page_count == expected_page_count
+        assert pager.page_bounds(expected_page_count) == expected_last_bounds
+
+    @pytest.mark.parametrize(
+        'page, expected_page',
+        [
+            (-1, 1),
+            (0, 1),
+            (2, 2),
+            (99, 3),
+        ]
+    )
+    def test_should_clamp_pages(self, page: int, expected_page: int) -> None:
+        pager: RawDataPager = RawDataPager([_price_entry('a')] * 7, 3)
+
+        assert pager.clamp(page) == expected_page
+
+    @pytest.mark.parametrize(
+        'country_name, expected_page',
+        [
+            ('Argentina', 1),
+            (' brazil ', 2),
+            ('CHILE', 3),
+        ]
+    )
+    def test_should_find_first_page_of_country(self, country_name: str, expected_page: int) -> None:
+        prices: list[PriceEntry] = [_price_entry(c) for c in ('Argentina', 'Argentina', 'Brazil', 'Argentina', 'Chile')]
+        pager: RawDataPager = RawDataPager(prices, 2)
+
+        result: Option[int] = pager.page_of_country(country_name)
+
+        assert result.is_some()
+        assert typing.cast(Some, result).value == expected_page
+
+    def test_should_return_empty_for_unknown_country(self) -> None:
+        pager: RawDataPager = RawDataPager([_price_entry('Argentina')], 2)
+
+        assert pager.page_of_country('Atlantis').is_empty()
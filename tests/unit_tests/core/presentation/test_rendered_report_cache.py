@@ -0,0 +1,92 @@
+from collections.abc import Generator, Iterator
+
+import pytest
+
+from src.core.presentation.rendered_report_cache import RenderedReportCache, ReportCacheKey, ReportCacheStatistics
+from src.core.presentation.report_name import ReportName
+
+
+class _Renderer:
+    calls: int
+    lines: list[str]
+
+    def __init__(self, lines: list[str]) -> None:
+        self.calls = 0
+        self.lines = lines
+
+    def __call__(self) -> Iterator[str]:
+        self.calls += 1
+
+        return iter(self.lines)
+
+
+def _key(report: ReportName = ReportName.RAW_DATA, dataset_version: int = 1) -> ReportCacheKey:
+    return ReportCacheKey(report=report, dataset_version=dataset_version)
+
+
+class TestRenderedReportCache:
+    _renderer: _Renderer
+    _cache: RenderedReportCache
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._renderer = _Renderer(['a', 'b'])
+        self._cache = RenderedReportCache()
+
+        yield
+
+        # Tear Down
+
+    def test_fully_consumed_report_should_be_served_from_the_cache(self) -> None:
+        assert list(self._cache.lines(_key(), self._renderer)) == ['a', 'b']
+        assert list(self._cache.lines(_key(), self._renderer)) == ['a', 'b']
+
+        statistics: ReportCacheStatistics = self._cache.statistics
+
+        assert self._renderer.calls == 1
+        assert (statistics.hits, statistics.misses, statistics.entries) == (1, 1, 1)
+        assert statistics.hit_rate == 0.5
+
+    def test_partially_consumed_report_should_not_be_cached(self) -> None:
+        next(self._cache.lines(_key(), self._renderer))
+        list(self._cache.lines(_key(), self._renderer))
+
+        assert self._renderer.calls == 2
+
+    def test_newer_dataset_version_should_drop_older_entries(self) -> None:
+        list(self._cache.lines(_key(dataset_version=1), self._renderer))
+        list(self._cache.lines(_key(dataset_version=2), self._renderer))
+        list(self._cache.lines(_key(dataset_version=1), self._renderer))
+
+        assert self._renderer.calls == 3
+        assert self._cache.statistics.entries == 1
+
+    def test_least_recently_used_report_should_be_evicted_over_the_cap(self) -> None:
+        renderer: _Renderer = _Renderer(['x' * 1000])
+        self._cache = RenderedReportCache(max_bytes=2500)
+
+        list(self._cache.lines(_key(ReportName.RAW_DATA), renderer))
+        list(self._cache.lines(_key(ReportName.CHEAPEST_COUNTRY), renderer))
+        list(self._cache.lines(_key(ReportName.RAW_DATA), renderer))
+        list(self._cache.lines(_key(ReportName.MOST_EXPENSIVE_COUNTRY), renderer))
+        list(self._cache.lines(_key(ReportName.RAW_DATA), renderer))
+        list(self._cache.lines(_key(ReportName.CHEAPEST_COUNTRY), renderer))
+
+        assert renderer.calls == 4
+        assert self._cache.statistics.evictions == 2
+        assert self._cache.statistics.size_bytes <= 2500
+
+    def test_size_should_count_the_encoded_lines(self) -> None:
+        list(self._cache.lines(_key(), _Renderer(['ab', 'é'])))
+
+        assert self._cache.statistics.size_bytes == 4
+
+    @pytest.mark.parametrize('max_bytes', [0, 1])
+    def test_report_larger_than_the_cap_should_stream_uncached(self, max_bytes: int) -> None:
+        self._cache = RenderedReportCache(max_bytes=max_bytes)
+
+        assert list(self._cache.lines(_key(), self._renderer)) == ['a', 'b']
+        assert list(self._cache.lines(_key(), self._renderer)) == ['a', 'b']
+        assert self._renderer.calls == 2
+        assert self._cache.statistics.entries == 0
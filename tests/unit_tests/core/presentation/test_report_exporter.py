@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+import typing
+from collections.abc import Generator
+
+import pytest
+
+from src.core.presentation.export_schema import AVERAGE_PRICE_ENTRY_SCHEMA, PRICE_CHANGE_SCHEMA
+from src.core.presentation.report_exporter import ReportExporter
+from src.features.price_loading.entities.price_entry import CountryName
+from src.features.statistics.domain.entities.average_price_entry import AveragePrice, AveragePriceEntry
+from src.features.statistics.domain.entities.price_change import PriceChange, PriceChangePercentage
+
+
+def _averages(amount: int) -> list[AveragePriceEntry]:
+    return [
+        AveragePriceEntry(country=CountryName(value=f'Country, "{index}"'), price=AveragePrice(value=index / 2))
+        for index in range(amount)
+    ]
+
+
+class _CountingOutput(io.StringIO):
+    writes: int
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+
+        return super().write(text)
+
+
+class TestReportExporter:
+    _output: _CountingOutput
+    _exporter: ReportExporter
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._output = _CountingOutput()
+        self._exporter = ReportExporter(self._output, rows_per_write=2)
+
+        yield
+
+        # Tear Down
+
+    @pytest.mark.parametrize('amount', [0, 1, 5])
+    def test_csv_should_round_trip(self, amount: int) -> None:
+        rows: int = self._exporter.write_csv(AVERAGE_PRICE_ENTRY_SCHEMA, iter(_averages(amount)))
+
+        records: list[dict[str, str]] = list(csv.DictReader(io.StringIO(self._output.getvalue())))
+
+        assert rows == amount
+        assert records == [
+            {'country_name': a.country.value, 'average_dollar_price': str(a.price.value)} for a in _averages(amount)
+        ]
+
+    @pytest.mark.parametrize('amount', [0, 1, 5])
+    def test_json_array_should_round_trip(self, amount: int) -> None:
+        rows: int = self._exporter.write_json_array(AVERAGE_PRICE_ENTRY_SCHEMA, iter(_averages(amount)))
+
+        assert rows == amount
+        assert json.loads(self._output.getvalue()) == [
+            {'country_name': a.country.value, 'average_dollar_price': a.price.value} for a in _averages(amount)
+        ]
+
+    def test_json_lines_should_lead_with_the_report_name(self) -> None:
+        price_change: PriceChange = PriceChange(
+            country=CountryName(value='Argentina'),
+            percentage=PriceChangePercentage(is_negative=True, value=12.5),
+        )
+
+        self._exporter.write_json_lines(PRICE_CHANGE_SCHEMA, [price_change], report='price-change-per-country')
+
+        line: dict[str, typing.Any] = json.loads(self._output.getvalue())
+
+        assert list(line) == ['report', 'country_name', 'is_negative', 'percentage']
+        assert line['is_negative'] is True
+
+    def test_should_write_once_per_batch(self) -> None:
+        self._exporter.write_json_lines(AVERAGE_PRICE_ENTRY_SCHEMA, iter(_averages(5)))
+
+        assert self._output.writes == 3
+        assert len(self._output.getvalue().splitlines()) == 5
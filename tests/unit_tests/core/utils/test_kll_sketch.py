@@ -0,0 +1,57 @@
+import bisect
+import math
+import random
+from collections.abc import Generator
+
+import pytest
+
+from src.core.utils.kll_sketch import KllSketch
+
+
+def _rank(sorted_values: list[float], value: float) -> float:
+    return bisect.bisect_left(sorted_values, value) / len(sorted_values)
+
+
+class TestKllSketch:
+    _values: list[float]
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        rng: random.Random = random.Random(11)
+        self._values = [rng.lognormvariate(1, 0.5) for _ in range(50_000)]
+
+        yield
+
+        # Tear Down
+
+    def test_should_stay_bounded_and_accurate(self) -> None:
+        sketch: KllSketch = KllSketch(k=200)
+        sketch.extend(self._values)
+        sorted_values: list[float] = sorted(self._values)
+
+        assert sketch.count == len(self._values)
+        assert sketch.retained < 3 * 200
+        assert all(abs(_rank(sorted_values, sketch.quantile(q)) - q) < 0.02 for q in (0.1, 0.25, 0.5, 0.75, 0.9))
+
+    def test_merged_shards_should_summarize_the_whole_stream(self) -> None:
+        shards: list[KllSketch] = [KllSketch(k=200, seed=s) for s in range(4)]
+
+        for index, value in enumerate(self._values):
+            shards[index % 4].update(value)
+
+        for shard in shards[1:]:
+            shards[0].merge(shard)
+
+        sorted_values: list[float] = sorted(self._values)
+
+        assert shards[0].count == len(self._values)
+        assert shards[0].retained < 3 * 200
+        assert abs(_rank(sorted_values, shards[0].quantile(0.5)) - 0.5) < 0.02
+
+    def test_small_streams_should_be_exact(self) -> None:
+        sketch: KllSketch = KllSketch()
+        sketch.extend([5.0, 1.0, 3.0, 2.0, 4.0])
+
+        assert [sketch.quantile(q) for q in (0.0, 0.5, 1.0)] == [1.0, 3.0, 5.0]
+        assert math.isnan(KllSketch().quantile(0.5))
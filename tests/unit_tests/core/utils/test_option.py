@@ -0,0 +1,16 @@
+from src.core.utils.option import Empty, Option, Some
+
+
+class TestOption:
+
+    def test_empty_should_be_a_shared_instance(self) -> None:
+        assert Option.empty() is Option.empty()
+        assert Empty() is Option.empty()
+        assert Option.empty().is_empty()
+
+    def test_some_should_construct_plain_slotted_instances(self) -> None:
+        some: Option[int] = Option.some(1)
+
+        assert type(some) is Some
+        assert some.is_some()
+        assert not hasattr(some, '__dict__')
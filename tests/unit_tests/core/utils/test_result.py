@@ -0,0 +1,39 @@
+import typing
+
+import pytest
+
+from src.core.utils.result import Error, Ok, Result
+
+
+class TestResult:
+
+    @pytest.mark.parametrize(
+        'results, expected_values, expected_errors',
+        [
+            ([], [], []),
+            ([Result.ok(1)], [1], []),
+            ([Result.error('a')], [], ['a']),
+            ([Result.ok(1), Result.error('a'), Result.ok(2), Result.error('b')], [1, 2], ['a', 'b']),
+        ]
+    )
+    def test_partition_should_split_values_and_errors_in_order(
+        self,
+        results: list[Result[int, str]],
+        expected_values: list[int],
+        expected_errors: list[str],
+    ) -> None:
+        values, errors = Result.partition(iter(results))
+
+        assert values == expected_values
+        assert errors == expected_errors
+
+    def test_should_construct_plain_slotted_instances(self) -> None:
+        ok_result: Result[int, str] = Result.ok(1)
+        err_result: Result[int, str] = Result.error('a')
+
+        assert type(ok_result) is Ok
+        assert type(err_result) is Error
+        assert typing.cast(Ok, ok_result).value == 1
+        assert typing.cast(Error, err_result).value == 'a'
+        assert not hasattr(ok_result, '__dict__')
+        assert not hasattr(err_result, '__dict__')
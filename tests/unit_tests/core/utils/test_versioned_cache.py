@@ -0,0 +1,45 @@
+from collections.abc import Generator
+
+import pytest
+
+from src.core.utils.versioned_cache import VersionedCache
+
+
+class TestVersionedCache:
+    _cache: VersionedCache[str, str]
+    _builds: list[str]
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._cache = VersionedCache(max_entries=2)
+        self._builds = []
+
+        yield
+
+        # Tear Down
+
+    def _get(self, version: int, key: str) -> str:
+        def build() -> str:
+            self._builds.append(key)
+            return f'{key}@{version}'
+
+        return self._cache.get(version, key, build)
+
+    def test_should_build_each_key_once_per_version(self) -> None:
+        assert self._get(1, 'a') == 'a@1'
+        assert self._get(1, 'a') == 'a@1'
+        assert self._get(2, 'a') == 'a@2'
+
+        assert self._builds == ['a', 'a']
+        assert (self._cache.hits, self._cache.misses) == (1, 2)
+
+    def test_should_evict_the_least_recently_used_key(self) -> None:
+        self._get(1, 'a')
+        self._get(1, 'b')
+        self._get(1, 'a')
+        self._get(1, 'c')
+        self._get(1, 'a')
+        self._get(1, 'b')
+
+        assert self._builds == ['a', 'b', 'c', 'b']
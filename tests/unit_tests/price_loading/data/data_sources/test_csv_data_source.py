@@ -170,3 +170,48 @@ class TestCsvDataSource:
         failure: CsvDataSourceFailure = err_result.value
 
         assert failure == CsvDataSourceDependenciesFailure(reason=expected_reason)
+
+    @pytest.mark.asyncio
+    async def test_load_chunks_should_map_each_chunk(self) -> None:
+        raw_price: dict[str, str | int | float] = {
+            'date      ':         '2000-04-01',
+            'currency_code':      'ARS',
+            'name              ': 'Argentina',
+            'local_price':        '2.5',
+            'dollar_ex':          '1',
+            'dollar_price':       '2.5',
+        }
+        model: CsvPriceModel = CsvPriceModel(
+            date='2000-04-01',
+            currency_code='ARS',
+            name='Argentina',
+            local_price=2.5,
+            dollar_ex=1.0,
+            dollar_price=2.5,
+        )
+
+        self._decoy.when(
+            await self._dummy_csv_reader.read_chunks(self._dummy_csv_file_path, 2)
+        ).then_return(Result.ok(iter([{0: raw_price, 1: raw_price}, {2: raw_price}])))
+
+        result: Result[typing.Iterator[list[CsvPriceModel]], CsvDataSourceFailure] = \
+            await self._data_source.load_chunks(2)
+
+        assert result.is_ok()
+        ok_result: Ok[typing.Iterator[list[CsvPriceModel]], CsvDataSourceFailure] = typing.cast(Ok, result)
+
+        assert list(ok_result.value) == [[model, model], [model]]
+
+    @pytest.mark.asyncio
+    async def test_load_chunks_should_return_dependencies_failure(self) -> None:
+        self._decoy.when(
+            await self._dummy_csv_reader.read_chunks(self._dummy_csv_file_path, 2)
+        ).then_return(Result.error(CsvFileReaderNonExistingFileFailure(details='65ZVn')))
+
+        result: Result[typing.Iterator[list[CsvPriceModel]], CsvDataSourceFailure] = \
+            await self._data_source.load_chunks(2)
+
+        assert result.is_err()
+        err_result: Error[typing.Iterator[list[CsvPriceModel]], CsvDataSourceFailure] = typing.cast(Error, result)
+
+        assert err_result.value == CsvDataSourceDependenciesFailure(reason='65ZVn')
@@ -107,3 +107,41 @@ class TestCsvFileReader:
         output: CsvFileOutput = ok_result.value
 
         assert output is dummy_dict_output
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'rows_per_chunk, expected_chunk_sizes',
+        [
+            (1, [1, 1, 1]),
+            (2, [2, 1]),
+            (5, [3]),
+        ]
+    )
+    async def test_read_chunks_should_split_rows(
+        self,
+        tmp_path: pathlib.Path,
+        rows_per_chunk: int,
+        expected_chunk_sizes: list[int],
+    ) -> None:
+        path: pathlib.Path = tmp_path.joinpath('prices.csv')
+        path.write_text('"date","name"\n"2000-04-01",A\n"2000-04-01",B\n"2001-04-01",A\n', encoding='utf-8')
+
+        result: Result[typing.Iterator[CsvFileOutput], CsvFileReaderFailure] = \
+            await self._reader.read_chunks(path, rows_per_chunk)
+
+        assert result.is_ok()
+        ok_result: Ok[typing.Iterator[CsvFileOutput], CsvFileReaderFailure] = typing.cast(Ok, result)
+        chunks: list[CsvFileOutput] = list(ok_result.value)
+
+        assert [len(c) for c in chunks] == expected_chunk_sizes
+        assert [row['name'] for c in chunks for row in c.values()] == ['A', 'B', 'A']
+
+    @pytest.mark.asyncio
+    async def test_read_chunks_should_return_file_failure_if_path_does_not_exist(self, tmp_path: pathlib.Path) -> None:
+        result: Result[typing.Iterator[CsvFileOutput], CsvFileReaderFailure] = \
+            await self._reader.read_chunks(tmp_path.joinpath('missing.csv'), 10)
+
+        assert result.is_err()
+        err_result: Error[typing.Iterator[CsvFileOutput], CsvFileReaderFailure] = typing.cast(Error, result)
+
+        assert isinstance(err_result.value, CsvFileReaderNotAFileFailure)
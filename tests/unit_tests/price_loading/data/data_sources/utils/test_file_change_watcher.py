@@ -0,0 +1,59 @@
+import asyncio
+import pathlib
+from collections.abc import Generator
+
+import pytest
+
+from src.features.price_loading.data.data_sources.utils.file_change_watcher import FileChangeWatcher
+
+
+class TestFileChangeWatcher:
+    _changes: list[None]
+    _watcher: FileChangeWatcher
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self, tmp_path: pathlib.Path) -> Generator[None, None, None]:
+        # Set Up
+        self._path: pathlib.Path = tmp_path.joinpath('prices.csv')
+        self._path.write_text('a', encoding='utf-8')
+        self._changes = []
+        self._watcher = FileChangeWatcher(
+            path=self._path,
+            interval_seconds=0.01,
+            on_change=lambda: self._changes.append(None),
+        )
+
+        yield
+
+        # Tear Down
+        self._watcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_should_not_notify(self) -> None:
+        self._watcher.start()
+        await asyncio.sleep(0.05)
+
+        assert not self._changes
+
+    @pytest.mark.asyncio
+    async def test_changed_file_should_notify_once(self) -> None:
+        self._watcher.start()
+        await asyncio.sleep(0.02)
+        self._path.write_text('ab', encoding='utf-8')
+        await asyncio.sleep(0.05)
+
+        assert len(self._changes) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_file_should_notify_only_when_it_reappears(self) -> None:
+        self._watcher.start()
+        await asyncio.sleep(0.02)
+        self._path.unlink()
+        await asyncio.sleep(0.05)
+
+        assert not self._changes
+
+        self._path.write_text('abc', encoding='utf-8')
+        await asyncio.sleep(0.05)
+
+        assert len(self._changes) == 1
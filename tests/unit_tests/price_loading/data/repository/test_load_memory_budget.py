@@ -0,0 +1,58 @@
+import pathlib
+import tracemalloc
+import typing
+from collections.abc import Generator
+
+import pytest
+
+from benchmarks.dataset_generator import DatasetGenerator, DatasetSpec
+from src.core.utils.result import Ok, Result
+from src.features.price_loading.data.data_sources.csv_data_source import CsvDataSource
+from src.features.price_loading.data.data_sources.utils.csv_file_reader import CsvFileReader
+from src.features.price_loading.data.repositories.load_memory_budget import LoadMemoryBudget
+from src.features.price_loading.data.repositories.mappers.csv_price_mapper import CsvPriceMapper
+from src.features.price_loading.data.repositories.price_repository_impl import PriceRepositoryImpl
+from src.features.price_loading.entities.price_entry import PriceEntry
+
+_ROWS: int = 5_000
+
+
+class TestLoadMemoryBudget:
+    _csv_file_path: pathlib.Path
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self, tmp_path: pathlib.Path) -> Generator[None, None, None]:
+        # Set Up
+        self._csv_file_path = tmp_path.joinpath('prices.csv')
+        DatasetGenerator().write(DatasetSpec(rows=_ROWS), self._csv_file_path)
+
+        yield
+
+        # Tear Down
+
+    def test_from_megabytes_should_size_chunks_by_the_bytes_per_row(self) -> None:
+        assert LoadMemoryBudget.from_megabytes(1.5).rows_per_chunk == 1024
+        assert LoadMemoryBudget(intermediate_bytes=1).rows_per_chunk == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('megabytes', [0.5, 1.0])
+    async def test_chunked_load_should_peak_within_the_budget_above_the_loaded_prices(self, megabytes: float) -> None:
+        memory_budget: LoadMemoryBudget = LoadMemoryBudget.from_megabytes(megabytes)
+        repository: PriceRepositoryImpl = PriceRepositoryImpl(
+            csv_data_source=CsvDataSource(csv_file_path=self._csv_file_path, csv_file_reader=CsvFileReader()),
+            csv_price_model_mapper=CsvPriceMapper(),
+            memory_budget=memory_budget,
+        )
+
+        tracemalloc.start()
+
+        try:
+            result: Result = await repository.fetch()
+            final_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        entities: list[PriceEntry] = typing.cast(Ok, result).value
+
+        assert len(entities) == _ROWS
+        assert peak_bytes - final_bytes <= memory_budget.intermediate_bytes
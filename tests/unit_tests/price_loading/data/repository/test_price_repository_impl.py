@@ -11,6 +11,7 @@ from src.features.price_loading.data.data_sources.csv_data_source import (
     CsvDataSourceFailure,
 )
 from src.features.price_loading.data.data_sources.models.csv_price_model import CsvPriceModel
+from src.features.price_loading.data.repositories.load_memory_budget import LoadMemoryBudget
 from src.features.price_loading.data.repositories.mappers.csv_price_mapper import CsvPriceMapper, CsvPriceMapperFailure
 from src.features.price_loading.data.repositories.price_repository_impl import PriceRepositoryImpl
 from src.features.price_loading.entities.price_entry import PriceEntry
@@ -187,3 +188,59 @@ class TestPriceRepositoryImpl:
         failure: PriceRepositoryFailure = err_result.value
 
         assert failure == PriceRepositoryDependenciesFailure(reason=expected_reason)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'chunk_sizes',
+        [
+            [],
+            [1],
+            [2, 2, 1],
+        ]
+    )
+    async def test_fetch_with_memory_budget_should_map_every_chunk(self, chunk_sizes: list[int]) -> None:
+        memory_budget: LoadMemoryBudget = LoadMemoryBudget(intermediate_bytes=1)
+        repository: PriceRepositoryImpl = PriceRepositoryImpl(
+            csv_data_source=self._dummy_csv_data_source,
+            csv_price_model_mapper=self._dummy_csv_price_model_mapper,
+            memory_budget=memory_budget,
+        )
+        model_chunks: list[list[CsvPriceModel]] = [
+            [self._decoy.mock(cls=CsvPriceModel) for _ in range(size)] for size in chunk_sizes
+        ]
+        expected_entities: list[PriceEntry] = [self._decoy.mock(cls=PriceEntry) for _ in range(sum(chunk_sizes))]
+
+        self._decoy.when(
+            await self._dummy_csv_data_source.load_chunks(memory_budget.rows_per_chunk)
+        ).then_return(Result.ok(iter(model_chunks)))
+
+        self._decoy.when(
+            self._dummy_csv_price_model_mapper.map(decoy.matchers.Anything())
+        ).then_return(*map(lambda e: Result.ok(e), expected_entities))
+
+        result: Result[list[PriceEntry], PriceRepositoryFailure] = await repository.fetch()
+
+        assert result.is_ok()
+        ok_result: Ok[list[PriceEntry], PriceRepositoryFailure] = typing.cast(Ok, result)
+
+        assert ok_result.value == expected_entities
+
+    @pytest.mark.asyncio
+    async def test_fetch_with_memory_budget_should_return_dependencies_failure(self) -> None:
+        memory_budget: LoadMemoryBudget = LoadMemoryBudget.from_megabytes(1)
+        repository: PriceRepositoryImpl = PriceRepositoryImpl(
+            csv_data_source=self._dummy_csv_data_source,
+            csv_price_model_mapper=self._dummy_csv_price_model_mapper,
+            memory_budget=memory_budget,
+        )
+
+        self._decoy.when(
+            await self._dummy_csv_data_source.load_chunks(memory_budget.rows_per_chunk)
+        ).then_return(Result.error(CsvDataSourceDependenciesFailure(reason='T7KHF')))
+
+        result: Result[list[PriceEntry], PriceRepositoryFailure] = await repository.fetch()
+
+        assert result.is_err()
+        err_result: Error[list[PriceEntry], PriceRepositoryFailure] = typing.cast(Error, result)
+
+        assert err_result.value == PriceRepositoryDependenciesFailure(reason='T7KHF')
@@ -1,14 +1,23 @@
+import typing
 from collections.abc import Generator
 
 import decoy
 import pytest
 
-from src.core.utils.result import Result
+from src.core.utils.result import Error, Ok, Result
 from src.features.price_loading.domain.use_cases.load_prices_use_case import (
     LoadPricesUseCase,
+    LoadPricesUseCaseDependenciesFailure,
+    LoadPricesUseCaseFailure,
+    LoadPricesUseCaseGenericFailure,
 )
 from src.features.price_loading.entities.price_entry import PriceEntry
-from src.features.price_loading.repository.price_repository import PriceRepository, PriceRepositoryFailure
+from src.features.price_loading.repository.price_repository import (
+    PriceRepository,
+    PriceRepositoryDependenciesFailure,
+    PriceRepositoryFailure,
+    PriceRepositoryGenericFailure,
+)
 
 
 class TestLoadPricesUseCase:
@@ -60,3 +69,40 @@ class TestLoadPricesUseCase:
         result: list[PriceEntry] = await self._use_case.execute()
 
         assert result == entries
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'repository_failure, expected_failure',
+        [
+            (PriceRepositoryGenericFailure(), LoadPricesUseCaseGenericFailure()),
+            (
+                PriceRepositoryDependenciesFailure(reason='Given file path is not a file'),
+                LoadPricesUseCaseDependenciesFailure(reason='Given file path is not a file'),
+            ),
+        ]
+    )
+    async def test_try_execute_should_return_failure(
+        self,
+        repository_failure: PriceRepositoryFailure,
+        expected_failure: LoadPricesUseCaseFailure,
+    ) -> None:
+        self._decoy.when(
+            await self._dummy_price_repository.fetch()
+        ).then_return(Result.error(repository_failure))
+
+        result: Result[list[PriceEntry], LoadPricesUseCaseFailure] = await self._use_case.try_execute()
+
+        assert result.is_err()
+        assert typing.cast(Error, result).value == expected_failure
+
+    @pytest.mark.asyncio
+    async def test_try_execute_should_return_entries_returned_by_repository(self) -> None:
+        entries: list[PriceEntry] = [self._decoy.mock(cls=PriceEntry) for _ in range(3)]
+
+        self._decoy.when(
+            await self._dummy_price_repository.fetch()
+        ).then_return(Result.ok(entries))
+
+        result: Result[list[PriceEntry], LoadPricesUseCaseFailure] = await self._use_case.try_execute()
+
+        assert typing.cast(Ok, result).value == entries
@@ -0,0 +1,143 @@
+import asyncio
+import datetime
+import logging
+import threading
+from collections.abc import Generator
+
+import pytest
+
+from src.features.price_loading.domain.price_dataset_store import PriceDatasetStore
+from src.features.price_loading.domain.use_cases.load_prices_use_case import LoadPricesUseCase
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_dataset import PriceDataset
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+
+
+def _price(country_name: str) -> PriceEntry:
+    return PriceEntry(
+        country_name=CountryName(value=country_name),
+        price=Price(
+            original_currency=OriginalCurrency(value='ARS'),
+            amount_in_original_currency=Amount(value=2.5),
+            amount_in_dollars=Amount(value=2.5),
+            dollar_exchange_rate=ExchangeRate(value=1.0),
+        ),
+        date=datetime.date(year=2000, month=4, day=1),
+    )
+
+
+class _BlockingLoadPricesUseCase(LoadPricesUseCase):
+    gate: threading.Event
+    calls: int
+    failure: Exception | None
+    finds_prices: bool
+
+    def __init__(self) -> None:
+        super().__init__(price_repository=None)  # type: ignore
+        self.gate = threading.Event()
+        self.calls = 0
+        self.failure = None
+        self.finds_prices = True
+
+    async def execute(self) -> list[PriceEntry]:
+        self.calls += 1
+        # Blocks the thread running the load, as reading and mapping the file does
+        self.gate.wait(timeout=5)
+
+        if self.failure is not None:
+            raise self.failure
+
+        return [_price(f'Country {self.calls}')] if self.finds_prices else []
+
+
+class TestPriceDatasetStore:
+    _load_prices_use_case: _BlockingLoadPricesUseCase
+    _store: PriceDatasetStore
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._load_prices_use_case = _BlockingLoadPricesUseCase()
+        self._store = PriceDatasetStore(load_prices_use_case=self._load_prices_use_case)
+
+        yield
+
+        # Tear Down
+        self._load_prices_use_case.gate.set()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_should_share_a_single_load(self) -> None:
+        self._store.load()
+        waiting: list[asyncio.Task[PriceDataset]] = [asyncio.create_task(self._store.get()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        self._load_prices_use_case.gate.set()
+
+        datasets: list[PriceDataset] = list(await asyncio.gather(*waiting))
+
+        assert self._load_prices_use_case.calls == 1
+        assert all(d is datasets[0] for d in datasets)
+        assert datasets[0].version == 1
+
+    @pytest.mark.asyncio
+    async def test_get_should_serve_the_previous_dataset_while_reloading(self) -> None:
+        self._load_prices_use_case.gate.set()
+        first: PriceDataset = await self._store.get()
+        self._load_prices_use_case.gate.clear()
+
+        reload: asyncio.Task[PriceDataset] = self._store.reload()
+        await asyncio.sleep(0.01)
+
+        assert self._store.is_reloading
+        assert await asyncio.wait_for(self._store.get(), timeout=1) is first
+
+        self._load_prices_use_case.gate.set()
+        second: PriceDataset = await reload
+
+        assert second.version == 2
+        assert second.prices[0].country_name.value == 'Country 2'
+        assert await self._store.get() is second
+        assert not self._store.is_reloading
+
+    @pytest.mark.asyncio
+    async def test_reloads_requested_while_reloading_should_be_coalesced(self) -> None:
+        self._load_prices_use_case.gate.set()
+        await self._store.get()
+        self._load_prices_use_case.gate.clear()
+
+        running: asyncio.Task[PriceDataset] = self._store.reload()
+        await asyncio.sleep(0.01)
+        reloads: list[asyncio.Task[PriceDataset]] = [self._store.reload() for _ in range(3)]
+        self._load_prices_use_case.gate.set()
+        latest: PriceDataset = await running
+
+        assert all(r is running for r in reloads)
+        assert self._load_prices_use_case.calls == 3
+        assert latest.version == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('failure, finds_prices', [(OSError('file vanished'), True), (None, False)])
+    async def test_failed_or_empty_reloads_should_keep_the_current_dataset(
+        self,
+        failure: Exception | None,
+        finds_prices: bool,
+    ) -> None:
+        self._load_prices_use_case.gate.set()
+        first: PriceDataset = await self._store.get()
+        self._load_prices_use_case.failure = failure
+        self._load_prices_use_case.finds_prices = finds_prices
+
+        assert await self._store.reload() is first
+        assert await self._store.get() is first
+
+    @pytest.mark.asyncio
+    async def test_failures_of_loads_nobody_awaits_should_be_logged(self, caplog: pytest.LogCaptureFixture) -> None:
+        self._load_prices_use_case.failure = OSError('file vanished')
+        self._load_prices_use_case.gate.set()
+
+        load: asyncio.Task[PriceDataset] = self._store.load()
+
+        with caplog.at_level(logging.ERROR):
+            await asyncio.wait([load])
+            await asyncio.sleep(0)
+
+        assert 'Loading the prices failed' in caplog.text
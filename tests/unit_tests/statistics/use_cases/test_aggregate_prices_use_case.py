@@ -0,0 +1,107 @@
+import datetime
+import random
+from collections.abc import Generator
+
+import pytest
+
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.aggregated_group import AggregatedField, AggregatedGroup, Reducer
+from src.features.statistics.domain.entities.group_key import CountryGroupKey, CurrencyGroupKey, \
+    FunctionGroupKey, GroupKey, RegionGroupKey, YearGroupKey
+from src.features.statistics.domain.use_cases.aggregate_prices_use_case import AggregatePricesUseCase
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+
+
+def _random_prices(seed: int, amount: int) -> list[PriceEntry]:
+    rng: random.Random = random.Random(seed)
+
+    return [
+        PriceEntry(
+            country_name=CountryName(value=f'Country {country}'),
+            price=Price(
+                original_currency=OriginalCurrency(value=f'C{country % 3}'),
+                amount_in_original_currency=Amount(value=round(rng.uniform(1, 90), 2)),
+                amount_in_dollars=Amount(value=round(rng.uniform(0.5, 9.5), 2)),
+                dollar_exchange_rate=ExchangeRate(value=1.0),
+            ),
+            # Few distinct dates, so that first and last prices tie within a group.
+            date=datetime.date(year=1998 + rng.randrange(5), month=1 + 6 * rng.randrange(2), day=1),
+        )
+        for country in (rng.randrange(8) for _ in range(amount))
+    ]
+
+
+_KEYS: list[GroupKey] = [
+    CountryGroupKey(),
+    CurrencyGroupKey(),
+    YearGroupKey(),
+    RegionGroupKey({CountryName(value='Country 1'): 'North', CountryName(value='Country 2'): 'South'}),
+]
+
+
+class TestAggregatePricesUseCase:
+    _row_use_case: AggregatePricesUseCase
+    _vectorized_use_case: AggregatePricesUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._row_use_case = AggregatePricesUseCase(
+            build_price_columns_use_case=BuildPriceColumnsUseCase(),
+            vectorized_threshold=10 ** 9,
+        )
+        self._vectorized_use_case = AggregatePricesUseCase(
+            build_price_columns_use_case=BuildPriceColumnsUseCase(),
+            vectorized_threshold=0,
+        )
+
+        yield
+
+        # Tear Down
+
+    @pytest.mark.parametrize('key', _KEYS, ids=[k.name for k in _KEYS])
+    @pytest.mark.parametrize('field', list(AggregatedField))
+    def test_backends_should_agree(self, key: GroupKey, field: AggregatedField) -> None:
+        prices: list[PriceEntry] = _random_prices(seed=5, amount=300)
+
+        rows: list[AggregatedGroup] = self._row_use_case.execute(prices, key, list(Reducer), field)
+        vectorized: list[AggregatedGroup] = self._vectorized_use_case.execute(prices, key, list(Reducer), field)
+
+        assert [g.key for g in vectorized] == [g.key for g in rows] == sorted({key.of(p) for p in prices})
+        assert [g.values for g in vectorized] == [pytest.approx(g.values) for g in rows]
+
+    def test_first_and_last_should_follow_the_release_date(self) -> None:
+        prices: list[PriceEntry] = _random_prices(seed=9, amount=50)
+
+        groups: list[AggregatedGroup] = self._vectorized_use_case.execute(
+            prices,
+            CountryGroupKey(),
+            [Reducer.FIRST, Reducer.LAST, Reducer.COUNT],
+        )
+
+        for group in groups:
+            history: list[PriceEntry] = sorted((p for p in prices if p.country_name.value == group.key),
+                                               key=lambda p: p.date)
+
+            assert group.values == {
+                Reducer.FIRST: history[0].price.amount_in_dollars.value,
+                Reducer.LAST: history[-1].price.amount_in_dollars.value,
+                Reducer.COUNT: len(history),
+            }
+
+    def test_function_keys_should_be_aggregated_row_by_row(self) -> None:
+        key: FunctionGroupKey = FunctionGroupKey('half', lambda p: 'H1' if p.date.month <= 6 else 'H2')
+
+        groups: list[AggregatedGroup] = self._vectorized_use_case.execute(
+            _random_prices(seed=2, amount=40),
+            key,
+            [Reducer.COUNT],
+        )
+
+        assert [g.key for g in groups] == ['H1', 'H2']
+        assert sum(g.values[Reducer.COUNT] for g in groups) == 40
+
+    def test_empty_prices_should_give_no_groups(self) -> None:
+        assert not self._vectorized_use_case.execute([], YearGroupKey(), [Reducer.MEAN])
+        assert not self._row_use_case.execute([], YearGroupKey(), [Reducer.MEAN])
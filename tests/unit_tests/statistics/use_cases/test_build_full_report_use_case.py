@@ -0,0 +1,89 @@
+import datetime
+import random
+import typing
+from collections.abc import Generator
+
+import pytest
+
+from src.core.utils.option import Option, Some
+from src.core.utils.result import Ok
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.full_report import FullReport, PriceSummary
+from src.features.statistics.domain.use_cases.build_full_report_use_case import BuildFullReportUseCase
+from src.features.statistics.domain.use_cases.calculate_average_price_per_country_use_case import \
+    CalculateAveragePricePerCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_cheapest_country_use_case import CalculateCheapestCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_most_expensive_country_use_case import \
+    CalculateMostExpensiveCountryUseCase
+from src.features.statistics.domain.use_cases.calculate_price_change_use_case import CalculatePriceChangeUseCase
+from src.features.statistics.domain.use_cases.get_extremities_per_country_use_case import \
+    GetExtremitiesPerCountryUseCase
+
+
+def _random_prices(seed: int, amount: int) -> list[PriceEntry]:
+    rng: random.Random = random.Random(seed)
+
+    return [
+        PriceEntry(
+            country_name=CountryName(value=f'Country {rng.randrange(7)}'),
+            price=Price(
+                original_currency=OriginalCurrency(value='XXX'),
+                amount_in_original_currency=Amount(value=1.0),
+                amount_in_dollars=Amount(value=round(rng.uniform(0.5, 9.5), 2)),
+                dollar_exchange_rate=ExchangeRate(value=1.0),
+            ),
+            # Few distinct dates, so that oldest and newest prices tie within a country.
+            date=datetime.date(year=2000 + rng.randrange(4), month=1, day=1),
+        )
+        for _ in range(amount)
+    ]
+
+
+class TestBuildFullReportUseCase:
+    _use_case: BuildFullReportUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._use_case = BuildFullReportUseCase(
+            calculate_most_expensive_country_use_case=CalculateMostExpensiveCountryUseCase(),
+            calculate_cheapest_country_use_case=CalculateCheapestCountryUseCase(),
+            calculate_price_change_use_case=CalculatePriceChangeUseCase(),
+        )
+
+        yield
+
+        # Tear Down
+
+    def test_empty_prices_should_give_an_empty_report(self) -> None:
+        assert self._use_case.execute([]) == FullReport(
+            summary=PriceSummary(prices=0, countries=0, first_date=None, last_date=None),
+            average_prices=[],
+            most_expensive_country=Option.empty(),
+            cheapest_country=Option.empty(),
+            price_changes=[],
+        )
+
+    @pytest.mark.parametrize('seed', [0, 1, 2])
+    def test_should_match_the_individual_use_cases(self, seed: int) -> None:
+        prices: list[PriceEntry] = _random_prices(seed, 500)
+
+        report: FullReport = self._use_case.execute(prices)
+
+        average_prices: typing.Any = typing.cast(Ok, CalculateAveragePricePerCountryUseCase().execute(prices)).value
+
+        assert report.summary == PriceSummary(
+            prices=500,
+            countries=len({p.country_name for p in prices}),
+            first_date=min(p.date for p in prices),
+            last_date=max(p.date for p in prices),
+        )
+        assert report.average_prices == average_prices
+        assert typing.cast(Some, report.most_expensive_country).value == \
+            typing.cast(Some, CalculateMostExpensiveCountryUseCase().execute(average_prices)).value
+        assert typing.cast(Some, report.cheapest_country).value == \
+            typing.cast(Some, CalculateCheapestCountryUseCase().execute(average_prices)).value
+        assert report.price_changes == CalculatePriceChangeUseCase().execute(
+            GetExtremitiesPerCountryUseCase().execute(prices)
+        )
@@ -0,0 +1,94 @@
+import datetime
+import math
+import typing
+from collections.abc import Generator
+
+import numpy
+import pytest
+
+from src.core.utils.option import Some
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+from src.features.statistics.domain.entities.price_matrix import PriceMatrix
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.build_price_matrix_use_case import BuildPriceMatrixUseCase
+
+
+def _price(country: str, year: int, dollar_price: float) -> PriceEntry:
+    return PriceEntry(
+        country_name=CountryName(value=country),
+        price=Price(
+            original_currency=OriginalCurrency(value='XXX'),
+            amount_in_original_currency=Amount(value=dollar_price * 2),
+            amount_in_dollars=Amount(value=dollar_price),
+            dollar_exchange_rate=ExchangeRate(value=2.0),
+        ),
+        date=datetime.date(year=year, month=1, day=1),
+    )
+
+
+_PRICES: list[PriceEntry] = [
+    _price('Brazil', 2002, 4.0),
+    _price('Argentina', 2000, 1.0),
+    _price('Brazil', 2000, 3.0),
+    _price('Argentina', 2003, 2.0),
+]
+
+
+class TestBuildPriceMatrixUseCase:
+    _columns: PriceColumns
+    _use_case: BuildPriceMatrixUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._columns = BuildPriceColumnsUseCase().execute(_PRICES)
+        self._use_case = BuildPriceMatrixUseCase()
+
+        yield
+
+        # Tear Down
+
+    def test_columns_should_code_dates_in_ascending_order(self) -> None:
+        assert self._columns.countries == [CountryName(value='Brazil'), CountryName(value='Argentina')]
+        assert self._columns.dates == [datetime.date(year, 1, 1) for year in (2000, 2002, 2003)]
+        assert self._columns.date_codes.tolist() == [1, 0, 0, 2]
+
+    def test_missing_releases_should_be_nan(self) -> None:
+        matrix: PriceMatrix = self._use_case.execute(self._columns)
+
+        assert matrix.dollar_prices.tolist()[0][:2] == [3.0, 4.0]
+        assert math.isnan(matrix.dollar_prices[0, 2])
+        assert math.isnan(matrix.dollar_prices[1, 1])
+        assert matrix.price_at(CountryName(value='Argentina'), datetime.date(2002, 1, 1)).is_empty()
+
+    def test_forward_fill_should_carry_the_latest_earlier_price(self) -> None:
+        matrix: PriceMatrix = self._use_case.execute(self._columns, forward_fill=True)
+
+        assert matrix.dollar_prices.tolist() == [[3.0, 4.0, 4.0], [1.0, 1.0, 2.0]]
+        assert matrix.local_prices.tolist() == [[6.0, 8.0, 8.0], [2.0, 2.0, 4.0]]
+
+    def test_forward_fill_should_leave_releases_before_the_first_price_empty(self) -> None:
+        columns: PriceColumns = BuildPriceColumnsUseCase().execute(_PRICES + [_price('Chile', 2002, 5.0)])
+
+        matrix: PriceMatrix = self._use_case.execute(columns, forward_fill=True)
+
+        assert math.isnan(matrix.dollar_prices[2, 0])
+        assert matrix.dollar_prices[2, 1:].tolist() == [5.0, 5.0]
+
+    def test_rows_and_columns_should_be_views(self) -> None:
+        matrix: PriceMatrix = self._use_case.execute(self._columns)
+
+        row: numpy.ndarray = typing.cast(Some, matrix.country_row(CountryName(value='Brazil'))).value
+        column: numpy.ndarray = typing.cast(Some, matrix.date_column(datetime.date(2000, 1, 1))).value
+
+        assert numpy.shares_memory(row, matrix.dollar_prices)
+        assert numpy.shares_memory(column, matrix.dollar_prices)
+        assert column.tolist() == [3.0, 1.0]
+
+    def test_empty_prices_should_give_an_empty_matrix(self) -> None:
+        matrix: PriceMatrix = self._use_case.execute(BuildPriceColumnsUseCase().execute([]), forward_fill=True)
+
+        assert matrix.dollar_prices.shape == (0, 0)
+        assert matrix.country_row(CountryName(value='Brazil')).is_empty()
@@ -0,0 +1,70 @@
+import datetime
+import typing
+from collections.abc import Generator
+
+import numpy
+import pytest
+
+from src.core.utils.result import Ok, Result
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.big_mac_index import BigMacIndex
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.calculate_big_mac_index_use_case import CalculateBigMacIndexUseCase
+
+
+def _price(country: str, currency: str, local_price: float, exchange_rate: float, year: int) -> PriceEntry:
+    return PriceEntry(
+        country_name=CountryName(value=country),
+        price=Price(
+            original_currency=OriginalCurrency(value=currency),
+            amount_in_original_currency=Amount(value=local_price),
+            amount_in_dollars=Amount(value=local_price / exchange_rate),
+            dollar_exchange_rate=ExchangeRate(value=exchange_rate),
+        ),
+        date=datetime.date(year=year, month=1, day=1),
+    )
+
+
+_PRICES: list[PriceEntry] = [
+    _price('Japan', 'JPY', 400.0, 100.0, 2000),
+    _price('United States', 'USD', 5.0, 1.0, 2000),
+    _price('Britain', 'GBP', 4.0, 0.8, 2000),
+    _price('Japan', 'JPY', 450.0, 90.0, 2001),
+]
+
+
+class TestCalculateBigMacIndexUseCase:
+    _use_case: CalculateBigMacIndexUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._use_case = CalculateBigMacIndexUseCase(build_price_columns_use_case=BuildPriceColumnsUseCase())
+
+        yield
+
+        # Tear Down
+
+    def _index(self, base_country: str) -> BigMacIndex:
+        result: Result = self._use_case.execute(_PRICES, CountryName(value=base_country))
+
+        assert result.is_ok()
+
+        return typing.cast(Ok, result).value
+
+    def test_should_value_currencies_against_the_dollar_by_default(self) -> None:
+        result: Result = self._use_case.execute(_PRICES)
+        index: BigMacIndex = typing.cast(Ok, result).value
+
+        numpy.testing.assert_allclose(index.implied_ppp_rates, [80.0, 1.0, 0.8, numpy.nan])
+        numpy.testing.assert_allclose(index.valuation_percentages, [-20.0, 0.0, 0.0, numpy.nan], atol=1e-9)
+
+    def test_should_support_any_base_country(self) -> None:
+        index: BigMacIndex = self._index('Britain')
+
+        numpy.testing.assert_allclose(index.implied_ppp_rates[:3], [100.0, 1.25, 1.0])
+        numpy.testing.assert_allclose(index.valuation_percentages[:3], [-20.0, 0.0, 0.0], atol=1e-9)
+
+    def test_unknown_base_country_should_fail(self) -> None:
+        assert self._use_case.execute(_PRICES, CountryName(value='Atlantis')).is_err()
@@ -0,0 +1,101 @@
+import datetime
+import random
+from collections.abc import Generator
+
+import numpy
+import pytest
+
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.country_quantile_sketches import CountryQuantileSketches
+from src.features.statistics.domain.entities.country_quantiles import CountryQuantiles
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.calculate_country_quantiles_use_case import \
+    CalculateCountryQuantilesUseCase
+from src.features.statistics.domain.use_cases.estimate_country_quantiles_use_case import \
+    EstimateCountryQuantilesUseCase
+
+_PROBABILITIES: tuple[float, ...] = (0.0, 0.1, 0.5, 0.9, 1.0)
+
+
+def _random_prices(seed: int, amount: int) -> list[PriceEntry]:
+    rng: random.Random = random.Random(seed)
+
+    return [
+        PriceEntry(
+            country_name=CountryName(value=f'Country {rng.randrange(4)}'),
+            price=Price(
+                original_currency=OriginalCurrency(value='XXX'),
+                amount_in_original_currency=Amount(value=1.0),
+                amount_in_dollars=Amount(value=round(rng.uniform(0.5, 9.5), 2)),
+                dollar_exchange_rate=ExchangeRate(value=1.0),
+            ),
+            date=datetime.date(year=2000, month=1, day=1),
+        )
+        for _ in range(amount)
+    ]
+
+
+class TestCalculateCountryQuantilesUseCase:
+    _use_case: CalculateCountryQuantilesUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._use_case = CalculateCountryQuantilesUseCase(build_price_columns_use_case=BuildPriceColumnsUseCase())
+
+        yield
+
+        # Tear Down
+
+    @pytest.mark.parametrize('amount', [1, 2, 37, 500])
+    def test_should_match_numpy_quantiles(self, amount: int) -> None:
+        prices: list[PriceEntry] = _random_prices(seed=amount, amount=amount)
+
+        quantiles: list[CountryQuantiles] = self._use_case.execute(prices, _PROBABILITIES)
+
+        for country_quantiles in quantiles:
+            values: list[float] = [p.price.amount_in_dollars.value for p in prices
+                                   if p.country_name == country_quantiles.country]
+
+            assert country_quantiles.prices == len(values)
+            assert list(country_quantiles.quantiles.values()) == \
+                pytest.approx(numpy.quantile(values, _PROBABILITIES).tolist())
+
+    def test_empty_prices_should_give_no_quantiles(self) -> None:
+        assert not self._use_case.execute([], _PROBABILITIES)
+
+
+class TestEstimateCountryQuantilesUseCase:
+    _use_case: EstimateCountryQuantilesUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._use_case = EstimateCountryQuantilesUseCase(k=64)
+
+        yield
+
+        # Tear Down
+
+    def test_chunked_sketches_should_approximate_the_exact_quantiles(self) -> None:
+        prices: list[PriceEntry] = _random_prices(seed=3, amount=20_000)
+        sketches: CountryQuantileSketches = self._use_case.sketch(prices[:5_000])
+
+        for start in range(5_000, len(prices), 5_000):
+            sketches.merge(self._use_case.sketch(prices[start:start + 5_000]))
+
+        estimated: list[CountryQuantiles] = self._use_case.summarize(sketches, (0.1, 0.5, 0.9))
+        exact: list[CountryQuantiles] = CalculateCountryQuantilesUseCase(BuildPriceColumnsUseCase()).execute(
+            prices,
+            (0.1, 0.5, 0.9),
+        )
+
+        assert [e.country for e in estimated] == [e.country for e in exact]
+        assert [e.prices for e in estimated] == [e.prices for e in exact]
+
+        for estimate, expected in zip(estimated, exact):
+            # Prices are uniform over a range of 9 dollars, a few percent of rank error stays well below 1 dollar.
+            assert list(estimate.quantiles.values()) == pytest.approx(list(expected.quantiles.values()), abs=0.5)
+
+        assert all(s.retained < 3 * 64 for s in sketches.sketches.values())
@@ -0,0 +1,121 @@
+import datetime
+import random
+from collections.abc import Generator
+
+import numpy
+import pytest
+
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.date_match import DateMatch
+from src.features.statistics.domain.entities.dated_price_change import DatedPriceChange
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+from src.features.statistics.domain.entities.price_history_index import PriceHistoryIndex
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.build_price_history_index_use_case import \
+    BuildPriceHistoryIndexUseCase
+from src.features.statistics.domain.use_cases.calculate_price_change_between_dates_use_case import \
+    CalculatePriceChangeBetweenDatesUseCase
+
+
+def _random_prices(seed: int, amount: int) -> list[PriceEntry]:
+    rng: random.Random = random.Random(seed)
+
+    return [
+        PriceEntry(
+            country_name=CountryName(value=f'Country {rng.randrange(5)}'),
+            price=Price(
+                original_currency=OriginalCurrency(value='XXX'),
+                amount_in_original_currency=Amount(value=1.0),
+                amount_in_dollars=Amount(value=round(rng.uniform(0.5, 9.5), 2)),
+                dollar_exchange_rate=ExchangeRate(value=1.0),
+            ),
+            date=datetime.date(2000, 1, 1) + datetime.timedelta(days=30 * rng.randrange(12)),
+        )
+        for _ in range(amount)
+    ]
+
+
+def _expected_change(
+    prices: list[PriceEntry],
+    country: CountryName,
+    start: datetime.date,
+    end: datetime.date,
+    match: DateMatch,
+) -> tuple[datetime.date, datetime.date, float, float] | None:
+    """Linear scan reference, the last price of a release wins and ties go to the earlier release."""
+    history: dict[datetime.date, float] = {p.date: p.price.amount_in_dollars.value for p in prices
+                                           if p.country_name == country}
+
+    def release(date: datetime.date) -> datetime.date | None:
+        if match == DateMatch.EXACT:
+            return date if date in history else None
+
+        return min(history, key=lambda d: (abs((d - date).days), d))
+
+    start_release: datetime.date | None = release(start)
+    end_release: datetime.date | None = release(end)
+
+    if start_release is None or end_release is None:
+        return None
+
+    return start_release, end_release, history[start_release], history[end_release]
+
+
+class TestCalculatePriceChangeBetweenDatesUseCase:
+    _prices: list[PriceEntry]
+    _index: PriceHistoryIndex
+    _use_case: CalculatePriceChangeBetweenDatesUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._prices = _random_prices(seed=7, amount=40)
+        self._index = BuildPriceHistoryIndexUseCase().execute(BuildPriceColumnsUseCase().execute(self._prices))
+        self._use_case = CalculatePriceChangeBetweenDatesUseCase()
+
+        yield
+
+        # Tear Down
+
+    @pytest.mark.parametrize('match', list(DateMatch))
+    @pytest.mark.parametrize('start_day, end_day', [(0, 330), (45, 200), (-100, 500), (120, 15), (60, 60)])
+    def test_should_match_a_linear_scan(self, match: DateMatch, start_day: int, end_day: int) -> None:
+        start: datetime.date = datetime.date(2000, 1, 1) + datetime.timedelta(days=start_day)
+        end: datetime.date = datetime.date(2000, 1, 1) + datetime.timedelta(days=end_day)
+
+        changes: list[DatedPriceChange] = self._use_case.execute(self._index, start, end, match)
+
+        expected: dict[CountryName, tuple[datetime.date, datetime.date, float, float]] = {}
+
+        for country in self._index.countries:
+            change: tuple[datetime.date, datetime.date, float, float] | None = \
+                _expected_change(self._prices, country, start, end, match)
+
+            if change is not None:
+                expected[country] = change
+
+        assert {c.country: (c.start_date, c.end_date, c.start_price, c.end_price) for c in changes} == expected
+        assert all(c.percentage == pytest.approx((c.end_price / c.start_price - 1) * 100) for c in changes)
+
+    def test_empty_prices_should_give_no_changes(self) -> None:
+        index: PriceHistoryIndex = BuildPriceHistoryIndexUseCase().execute(BuildPriceColumnsUseCase().execute([]))
+
+        assert not self._use_case.execute(index, datetime.date(2000, 1, 1), datetime.date(2001, 1, 1))
+
+    @pytest.mark.parametrize('match', list(DateMatch))
+    def test_countries_without_releases_should_not_borrow_a_neighbour_price(self, match: DateMatch) -> None:
+        columns: PriceColumns = BuildPriceColumnsUseCase().execute(self._prices)
+        index: PriceHistoryIndex = BuildPriceHistoryIndexUseCase().execute(
+            columns.select(numpy.flatnonzero(columns.country_codes != 2))
+        )
+
+        changes: list[DatedPriceChange] = self._use_case.execute(
+            index,
+            datetime.date(2000, 1, 1),
+            datetime.date(2000, 12, 1),
+            match,
+        )
+
+        assert columns.countries[2] not in {c.country for c in changes}
+        assert index.locate(datetime.date(2000, 6, 1), match)[2] == -1
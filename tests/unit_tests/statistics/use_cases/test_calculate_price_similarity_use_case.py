@@ -0,0 +1,118 @@
+import datetime
+import typing
+from collections.abc import Generator
+
+import numpy
+import pytest
+
+from src.core.utils.option import Some
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.price_similarity import PriceSimilarity, SimilarCountry, \
+    SimilarityMeasure
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.build_price_matrix_use_case import BuildPriceMatrixUseCase
+from src.features.statistics.domain.use_cases.calculate_price_similarity_use_case import \
+    CalculatePriceSimilarityUseCase
+
+
+def _prices(country: str, dollar_prices: list[float | None]) -> list[PriceEntry]:
+    return [
+        PriceEntry(
+            country_name=CountryName(value=country),
+            price=Price(
+                original_currency=OriginalCurrency(value='XXX'),
+                amount_in_original_currency=Amount(value=dollar_price),
+                amount_in_dollars=Amount(value=dollar_price),
+                dollar_exchange_rate=ExchangeRate(value=1.0),
+            ),
+            date=datetime.date(year=2000 + year, month=1, day=1),
+        )
+        for year, dollar_price in enumerate(dollar_prices)
+        if dollar_price is not None
+    ]
+
+
+_PRICES: list[PriceEntry] = [
+    *_prices('Argentina', [1.0, 2.0, 3.0, 4.0]),
+    *_prices('Brazil', [2.0, 4.0, 6.0, 8.0]),
+    *_prices('Chile', [4.0, 3.0, 2.0, 1.0]),
+    *_prices('Denmark', [1.0, None, 3.0, None]),
+    *_prices('Egypt', [2.0, 2.0, 2.0, 2.0]),
+]
+
+
+class TestCalculatePriceSimilarityUseCase:
+    _use_case: CalculatePriceSimilarityUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._use_case = CalculatePriceSimilarityUseCase(
+            build_price_columns_use_case=BuildPriceColumnsUseCase(),
+            build_price_matrix_use_case=BuildPriceMatrixUseCase(),
+        )
+
+        yield
+
+        # Tear Down
+
+    def test_correlation_should_compare_trajectories_whatever_their_level(self) -> None:
+        similarity: PriceSimilarity = self._use_case.execute(_PRICES)
+
+        numpy.testing.assert_allclose(
+            similarity.similarities,
+            [
+                [1.0, 1.0, -1.0, numpy.nan, numpy.nan],
+                [1.0, 1.0, -1.0, numpy.nan, numpy.nan],
+                [-1.0, -1.0, 1.0, numpy.nan, numpy.nan],
+                [numpy.nan] * 5,
+                [numpy.nan] * 5,
+            ],
+        )
+        numpy.testing.assert_array_equal(similarity.common_releases[3], [2, 2, 2, 2, 2])
+
+    def test_correlation_should_only_use_the_releases_both_countries_list(self) -> None:
+        similarity: PriceSimilarity = self._use_case.execute(
+            [*_prices('Argentina', [1.0, 2.0, 3.0, 4.0]), *_prices('France', [None, 10.0, 9.0, 12.0, 30.0, 40.0])]
+        )
+
+        assert similarity.common_releases[0, 1] == 3
+        assert similarity.similarities[0, 1] == pytest.approx(numpy.corrcoef([2.0, 3.0, 4.0], [10.0, 9.0, 12.0])[0, 1])
+        assert similarity.similarities[1, 0] == pytest.approx(similarity.similarities[0, 1])
+
+    def test_cosine_should_compare_the_prices_as_they_are(self) -> None:
+        similarity: PriceSimilarity = self._use_case.execute(_PRICES, SimilarityMeasure.COSINE, 2)
+
+        assert similarity.similarities[0, 2] == pytest.approx(20 / 30)
+        assert similarity.similarities[0, 3] == pytest.approx(10 / (10 * 10) ** 0.5)
+        assert similarity.similarities[0, 4] == pytest.approx(20 / (30 * 16) ** 0.5)
+
+    @pytest.mark.parametrize(
+        'k, expected',
+        [
+            (1, [('Brazil', 1.0)]),
+            (3, [('Brazil', 1.0), ('Chile', -1.0)]),
+        ],
+    )
+    def test_nearest_should_rank_the_most_similar_countries_first(
+        self,
+        k: int,
+        expected: list[tuple[str, float]],
+    ) -> None:
+        similarity: PriceSimilarity = self._use_case.execute(_PRICES)
+
+        neighbours: list[SimilarCountry] = typing.cast(
+            Some,
+            similarity.nearest(CountryName(value='Argentina'), k),
+        ).value
+
+        assert [(n.country.value, n.similarity) for n in neighbours] == [
+            (country, pytest.approx(value)) for country, value in expected
+        ]
+        assert all(n.common_releases == 4 for n in neighbours)
+
+    def test_nearest_should_be_empty_for_an_unknown_country(self) -> None:
+        similarity: PriceSimilarity = self._use_case.execute(_PRICES)
+
+        assert similarity.nearest(CountryName(value='Atlantis'), 3).is_empty()
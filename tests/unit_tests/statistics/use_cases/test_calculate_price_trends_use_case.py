@@ -0,0 +1,119 @@
+import datetime
+import math
+import random
+import typing
+from collections.abc import Generator
+
+import numpy
+import pytest
+
+from src.core.utils.option import Some
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.price_trends import PriceTrends
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.build_price_history_index_use_case import \
+    BuildPriceHistoryIndexUseCase
+from src.features.statistics.domain.use_cases.calculate_price_trends_use_case import CalculatePriceTrendsUseCase
+
+
+def _price(country: str, date: datetime.date, dollar_price: float) -> PriceEntry:
+    return PriceEntry(
+        country_name=CountryName(value=country),
+        price=Price(
+            original_currency=OriginalCurrency(value='XXX'),
+            amount_in_original_currency=Amount(value=dollar_price),
+            amount_in_dollars=Amount(value=dollar_price),
+            dollar_exchange_rate=ExchangeRate(value=1.0),
+        ),
+        date=date,
+    )
+
+
+def _semiannual_prices(seed: int, countries: int, releases: int) -> list[PriceEntry]:
+    rng: random.Random = random.Random(seed)
+    prices: list[PriceEntry] = [
+        _price(f'Country {c}', datetime.date(2000 + r // 2, 1 + 6 * (r % 2), 1 + rng.randrange(10)),
+               round(rng.uniform(1, 9), 2))
+        for r in range(releases)
+        for c in range(countries)
+        if rng.random() < 0.8
+    ]
+    rng.shuffle(prices)
+
+    return prices
+
+
+class TestCalculatePriceTrendsUseCase:
+    _use_case: CalculatePriceTrendsUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._use_case = CalculatePriceTrendsUseCase(
+            build_price_columns_use_case=BuildPriceColumnsUseCase(),
+            build_price_history_index_use_case=BuildPriceHistoryIndexUseCase(),
+        )
+
+        yield
+
+        # Tear Down
+
+    @pytest.mark.parametrize('window', [1, 3, 5])
+    def test_rolling_means_should_match_a_recomputation_of_every_window(self, window: int) -> None:
+        prices: list[PriceEntry] = _semiannual_prices(seed=3, countries=6, releases=12)
+
+        trends: PriceTrends = self._use_case.execute(prices, window=window)
+
+        for country in trends.countries:
+            releases: slice = typing.cast(Some, trends.country_releases(country)).value
+            history: list[float] = [p.price.amount_in_dollars.value
+                                    for p in sorted(prices, key=lambda p: p.date) if p.country_name == country]
+            expected: list[float] = [
+                math.nan if i + 1 < window else sum(history[i + 1 - window:i + 1]) / window
+                for i in range(len(history))
+            ]
+
+            numpy.testing.assert_allclose(trends.rolling_means[releases], expected)
+
+    def test_rolling_means_should_not_carry_rounding_across_countries(self) -> None:
+        trends: PriceTrends = self._use_case.execute(
+            [
+                *[_price('Argentina', datetime.date(2000 + y, 1, 1), 1_234_567.891) for y in range(10)],
+                *[_price('Brazil', datetime.date(2000 + y, 1, 1), 2.57) for y in range(3)],
+            ],
+            window=2,
+        )
+
+        numpy.testing.assert_allclose(trends.rolling_means[10:], [math.nan, 2.57, 2.57], rtol=1e-15)
+
+    def test_year_over_year_should_compare_with_the_release_about_a_year_earlier(self) -> None:
+        trends: PriceTrends = self._use_case.execute(
+            [
+                _price('Argentina', datetime.date(2000, 1, 10), 2.0),
+                _price('Argentina', datetime.date(2000, 7, 1), 3.0),
+                _price('Argentina', datetime.date(2001, 1, 3), 3.0),
+                _price('Argentina', datetime.date(2003, 1, 1), 4.0),
+            ]
+        )
+
+        assert trends.year_over_year_percentages[2] == pytest.approx(50.0)
+        assert numpy.isnan(trends.year_over_year_percentages[[0, 1, 3]]).all()
+
+    def test_compound_annual_growth_should_span_the_whole_history(self) -> None:
+        trends: PriceTrends = self._use_case.execute(
+            [
+                _price('Argentina', datetime.date(2000, 1, 1), 2.0),
+                _price('Argentina', datetime.date(2004, 1, 1), 4.0),
+                _price('Brazil', datetime.date(2000, 1, 1), 2.0),
+            ]
+        )
+
+        assert trends.compound_annual_growth_percentages[0] == pytest.approx((2 ** (1 / 4) - 1) * 100, abs=0.01)
+        assert numpy.isnan(trends.compound_annual_growth_percentages[1])
+
+    def test_empty_prices_should_give_empty_trends(self) -> None:
+        trends: PriceTrends = self._use_case.execute([])
+
+        assert trends.rolling_means.size == 0
+        assert trends.compound_annual_growth_percentages.size == 0
@@ -0,0 +1,69 @@
+import datetime
+import random
+import statistics
+from collections.abc import Generator
+
+import pytest
+
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.release_statistics import ReleaseStatistics
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.build_price_history_index_use_case import \
+    BuildPriceHistoryIndexUseCase
+from src.features.statistics.domain.use_cases.calculate_release_statistics_use_case import \
+    CalculateReleaseStatisticsUseCase
+
+
+def _random_prices(seed: int, amount: int) -> list[PriceEntry]:
+    rng: random.Random = random.Random(seed)
+
+    return [
+        PriceEntry(
+            country_name=CountryName(value=f'Country {index}'),
+            price=Price(
+                original_currency=OriginalCurrency(value='XXX'),
+                amount_in_original_currency=Amount(value=1.0),
+                amount_in_dollars=Amount(value=round(rng.uniform(0.5, 9.5), 2)),
+                dollar_exchange_rate=ExchangeRate(value=1.0),
+            ),
+            date=datetime.date(year=2000 + rng.randrange(6), month=1, day=1),
+        )
+        for index in range(amount)
+    ]
+
+
+class TestCalculateReleaseStatisticsUseCase:
+    _use_case: CalculateReleaseStatisticsUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._use_case = CalculateReleaseStatisticsUseCase(
+            build_price_columns_use_case=BuildPriceColumnsUseCase(),
+            build_price_history_index_use_case=BuildPriceHistoryIndexUseCase(),
+        )
+
+        yield
+
+        # Tear Down
+
+    @pytest.mark.parametrize('seed', [1, 2, 3])
+    def test_should_match_the_statistics_module_per_release(self, seed: int) -> None:
+        prices: list[PriceEntry] = _random_prices(seed=seed, amount=60)
+
+        releases: list[ReleaseStatistics] = self._use_case.execute(prices)
+
+        assert [r.date for r in releases] == sorted({p.date for p in prices})
+
+        for release in releases:
+            values: list[float] = [p.price.amount_in_dollars.value for p in prices if p.date == release.date]
+
+            assert release.countries == len(values)
+            assert release.mean == pytest.approx(statistics.fmean(values))
+            assert release.median == pytest.approx(statistics.median(values))
+            assert release.standard_deviation == pytest.approx(statistics.pstdev(values))
+            assert (release.minimum, release.maximum) == (min(values), max(values))
+
+    def test_empty_prices_should_give_no_releases(self) -> None:
+        assert not self._use_case.execute([])
@@ -0,0 +1,84 @@
+import datetime
+from collections.abc import Generator
+
+import numpy
+import pytest
+
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.price_anomalies import PriceAnomalies
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.detect_price_anomalies_use_case import DetectPriceAnomaliesUseCase
+
+
+def _price(country: str, local_price: float, exchange_rate: float, dollar_price: float, year: int) -> PriceEntry:
+    return PriceEntry(
+        country_name=CountryName(value=country),
+        price=Price(
+            original_currency=OriginalCurrency(value='XXX'),
+            amount_in_original_currency=Amount(value=local_price),
+            amount_in_dollars=Amount(value=dollar_price),
+            dollar_exchange_rate=ExchangeRate(value=exchange_rate),
+        ),
+        date=datetime.date(year=year, month=1, day=1),
+    )
+
+
+_PRICES: list[PriceEntry] = [
+    _price('Argentina', 6.0, 2.0, 3.0, 2011),
+    *[_price('Argentina', 2.0, 2.0, 1.0, year) for year in range(2000, 2011)],
+    _price('Brazil', 10.0, 2.0, 5.0, 2000),
+    _price('Brazil', 10.0, 2.0, 5.2, 2001),
+    _price('Chile', 0.0, 2.0, 0.0, 2001),
+    _price('Chile', 4.0, 2.0, 2.0, 2002),
+    _price('Chile', 4.0, 2.0, 2.0, 2000),
+]
+
+
+class TestDetectPriceAnomaliesUseCase:
+    _use_case: DetectPriceAnomaliesUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._use_case = DetectPriceAnomaliesUseCase(build_price_columns_use_case=BuildPriceColumnsUseCase())
+
+        yield
+
+        # Tear Down
+
+    @pytest.mark.parametrize('tolerance, inconsistent_rows', [(0.01, [13]), (0.05, [])])
+    def test_should_flag_dollar_prices_off_their_exchange_rate(
+        self,
+        tolerance: float,
+        inconsistent_rows: list[int],
+    ) -> None:
+        anomalies: PriceAnomalies = self._use_case.execute(_PRICES, tolerance=tolerance)
+
+        assert numpy.flatnonzero(anomalies.is_inconsistent).tolist() == inconsistent_rows
+        assert anomalies.implied_dollar_prices[13] == 5.0
+
+    def test_should_score_changes_against_the_country_history(self) -> None:
+        anomalies: PriceAnomalies = self._use_case.execute(_PRICES)
+
+        assert anomalies.change_percentages[0] == pytest.approx(200.0)
+        assert anomalies.change_z_scores[0] == pytest.approx(20 / 40 ** 0.5)
+        assert numpy.isnan(anomalies.change_percentages[1])
+        numpy.testing.assert_allclose(anomalies.change_percentages[12:], [numpy.nan, 4.0, -100.0, numpy.inf, numpy.nan])
+        assert numpy.isnan(anomalies.change_z_scores[12:]).all()
+
+    @pytest.mark.parametrize('z_threshold, outlier_rows', [(3.0, [0, 15]), (3.5, [15])])
+    def test_should_flag_jumps_beyond_the_threshold_and_from_a_zero_price(
+        self,
+        z_threshold: float,
+        outlier_rows: list[int],
+    ) -> None:
+        anomalies: PriceAnomalies = self._use_case.execute(_PRICES, z_threshold=z_threshold)
+
+        assert numpy.flatnonzero(anomalies.is_outlier).tolist() == outlier_rows
+        assert anomalies.flagged_rows.tolist() == sorted(outlier_rows + [13])
+
+    def test_should_flag_nothing_without_prices(self) -> None:
+        anomalies: PriceAnomalies = self._use_case.execute([])
+
+        assert anomalies.flagged_rows.tolist() == []
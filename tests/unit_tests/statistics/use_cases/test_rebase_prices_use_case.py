@@ -0,0 +1,87 @@
+import datetime
+import typing
+from collections.abc import Generator
+
+import numpy
+import pytest
+
+from src.core.utils.result import Error, Ok, Result
+from src.features.price_loading.entities.price import Amount, ExchangeRate, OriginalCurrency, Price
+from src.features.price_loading.entities.price_entry import CountryName, PriceEntry
+from src.features.statistics.domain.entities.price_columns import PriceColumns
+from src.features.statistics.domain.use_cases.build_price_columns_use_case import BuildPriceColumnsUseCase
+from src.features.statistics.domain.use_cases.rebase_prices_use_case import RebasePricesUseCase
+
+
+def _price(country: str, currency: str, local_price: float, exchange_rate: float, year: int) -> PriceEntry:
+    return PriceEntry(
+        country_name=CountryName(value=country),
+        price=Price(
+            original_currency=OriginalCurrency(value=currency),
+            amount_in_original_currency=Amount(value=local_price),
+            amount_in_dollars=Amount(value=local_price / exchange_rate),
+            dollar_exchange_rate=ExchangeRate(value=exchange_rate),
+        ),
+        date=datetime.date(year=year, month=1, day=1),
+    )
+
+
+_PRICES: list[PriceEntry] = [
+    _price('Euro area', 'EUR', 4.0, 0.8, 2000),
+    _price('Japan', 'JPY', 400.0, 100.0, 2000),
+    _price('United States', 'USD', 5.0, 1.0, 2000),
+    _price('Japan', 'JPY', 450.0, 90.0, 2001),
+    _price('Euro area', 'EUR', 4.5, 0.9, 2002),
+    _price('Japan', 'JPY', 360.0, 120.0, 2002),
+]
+
+
+class TestRebasePricesUseCase:
+    _use_case: RebasePricesUseCase
+
+    @pytest.fixture(autouse=True)
+    def set_up_and_tear_down(self) -> Generator[None, None, None]:
+        # Set Up
+        self._use_case = RebasePricesUseCase(build_price_columns_use_case=BuildPriceColumnsUseCase())
+
+        yield
+
+        # Tear Down
+
+    def _rebased(self, base_currency: str) -> PriceColumns:
+        result: Result = self._use_case.execute(_PRICES, base_currency)
+
+        assert result.is_ok()
+
+        return typing.cast(Ok, result).value
+
+    def test_should_convert_prices_with_the_rate_of_their_release(self) -> None:
+        columns: PriceColumns = self._rebased('EUR')
+
+        numpy.testing.assert_allclose(columns.dollar_prices, [4.0, 3.2, 4.0, 4.5, 2.7])
+        numpy.testing.assert_allclose(columns.exchange_rates, [1.0, 125.0, 1.25, 1.0, 120.0 / 0.9])
+        numpy.testing.assert_array_equal(columns.local_prices, [4.0, 400.0, 5.0, 4.5, 360.0])
+
+    def test_should_leave_out_releases_without_the_base_currency(self) -> None:
+        columns: PriceColumns = self._rebased('EUR')
+
+        assert [columns.dates[d] for d in columns.date_codes.tolist()] == [
+            datetime.date(2000, 1, 1),
+            datetime.date(2000, 1, 1),
+            datetime.date(2000, 1, 1),
+            datetime.date(2002, 1, 1),
+            datetime.date(2002, 1, 1),
+        ]
+        assert columns.countries == [CountryName(value='Euro area'), CountryName(value='Japan'),
+                                     CountryName(value='United States')]
+
+    def test_dollars_should_keep_the_columns_unchanged(self) -> None:
+        columns: PriceColumns = self._rebased('USD')
+
+        numpy.testing.assert_array_equal(columns.dollar_prices, [p.price.amount_in_dollars.value for p in _PRICES])
+
+    def test_should_fail_for_a_currency_without_prices(self) -> None:
+        result: Result = self._use_case.execute(_PRICES, 'GBP')
+
+        assert result.is_err()
+        assert typing.cast(Error, result).value.details == 'No prices in GBP'